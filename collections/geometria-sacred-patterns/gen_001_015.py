@@ -5,11 +5,11 @@ import math
 import random
 from reportlab.lib.pagesizes import A3
 from reportlab.lib.colors import Color
-from reportlab.pdfgen import canvas
+
+from geometria import dots, gstate, shading
+from geometria.registry import items, poster, poster_path
 
 W, H = A3
-import os
-OUT = os.path.dirname(os.path.abspath(__file__))
 
 # ─── Utility ──────────────────────────────────────────────
 
@@ -29,6 +29,7 @@ def title_block(c, title, subtitle, edition, color_main, color_sub, color_ed):
     c.drawCentredString(W/2, 52, edition)
 
 def scatter_stars(c, count, color, cx, cy, min_dist=0):
+    stars = []
     for _ in range(count):
         px = random.random() * W
         py = random.random() * H
@@ -36,8 +37,10 @@ def scatter_stars(c, count, color, cx, cy, min_dist=0):
         if dist > min_dist:
             sz = random.random() * 1.5 + 0.3
             a = random.random() * 0.25 + 0.05
-            c.setFillColor(Color(color[0], color[1], color[2], alpha=a))
-            c.circle(px, py, sz, fill=1, stroke=0)
+            stars.append((px, py, sz, a))
+    if stars:
+        xs, ys, sizes, alphas = zip(*stars)
+        dots.fill(c, xs, ys, sizes, rgb=color[:3], alpha=alphas)
 
 def draw_polygon(c, cx, cy, r, n, rotation=0):
     """Draw a regular polygon, return vertices."""
@@ -57,8 +60,9 @@ def draw_polygon(c, cx, cy, r, n, rotation=0):
 # ═══════════════════════════════════════════════════════════
 # 001 — FLOWER OF LIFE (Golden/Amber)
 # ═══════════════════════════════════════════════════════════
+@poster(1, 'flower-of-life', tags=('sacred', 'circles', 'glow'))
 def gen_001():
-    c = canvas.Canvas(f'{OUT}/001-flower-of-life.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(1), pagesize=A3)
     bg(c, Color(0.06, 0.04, 0.02))
     cx, cy = W/2, H/2 + 60
     r = 70
@@ -115,10 +119,7 @@ def gen_001():
     c.circle(cx, cy, 3.7 * r, fill=0, stroke=1)
 
     # Center glow
-    for rr in range(30, 0, -1):
-        a = 0.04 * (1 - rr/30)
-        c.setFillColor(Color(1, 0.85, 0.2, alpha=a))
-        c.circle(cx, cy, rr, fill=1, stroke=0)
+    shading.glow(c, cx, cy, 30, Color(1, 0.85, 0.2, alpha=0.04))
 
     scatter_stars(c, 200, (1, 0.9, 0.5), cx, cy, 3.5*r)
 
@@ -132,8 +133,9 @@ def gen_001():
 # ═══════════════════════════════════════════════════════════
 # 002 — SRI YANTRA (Crimson/Gold)
 # ═══════════════════════════════════════════════════════════
+@poster(2, 'sri-yantra', tags=('sacred', 'polygon', 'glow'))
 def gen_002():
-    c = canvas.Canvas(f'{OUT}/002-sri-yantra.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(2), pagesize=A3)
     bg(c, Color(0.08, 0.02, 0.02))
     cx, cy = W/2, H/2 + 50
 
@@ -177,9 +179,7 @@ def gen_002():
         c.drawPath(p, fill=0, stroke=1)
 
     # Bindu (center point)
-    for rr in range(20, 0, -1):
-        c.setFillColor(Color(1, 0.2, 0.1, alpha=0.06 * (1 - rr/20)))
-        c.circle(cx, cy, rr, fill=1, stroke=0)
+    shading.glow(c, cx, cy, 20, Color(1, 0.2, 0.1, alpha=0.06))
     c.setFillColor(Color(1, 0.85, 0, alpha=0.9))
     c.circle(cx, cy, 3, fill=1, stroke=0)
 
@@ -224,8 +224,9 @@ def gen_002():
 # ═══════════════════════════════════════════════════════════
 # 003 — FIBONACCI SPIRAL (Emerald/Teal)
 # ═══════════════════════════════════════════════════════════
+@poster(3, 'fibonacci-spiral', tags=('sacred', 'spiral'))
 def gen_003():
-    c = canvas.Canvas(f'{OUT}/003-fibonacci-spiral.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(3), pagesize=A3)
     bg(c, Color(0.02, 0.06, 0.05))
     cx, cy = W/2 - 30, H/2 + 40
 
@@ -331,8 +332,9 @@ def gen_003():
 # ═══════════════════════════════════════════════════════════
 # 004 — PLATONIC SOLIDS (Prismatic Rainbow)
 # ═══════════════════════════════════════════════════════════
+@poster(4, 'platonic-solids', tags=('3d', 'polyhedra'))
 def gen_004():
-    c = canvas.Canvas(f'{OUT}/004-platonic-solids.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(4), pagesize=A3)
     bg(c, Color(0.03, 0.03, 0.06))
     cx, cy = W/2, H/2 + 50
 
@@ -456,8 +458,9 @@ def gen_004():
 # ═══════════════════════════════════════════════════════════
 # 005 — VESICA PISCIS (Deep Ocean Blue/Cyan)
 # ═══════════════════════════════════════════════════════════
+@poster(5, 'vesica-piscis', tags=('sacred', 'circles', 'glow'))
 def gen_005():
-    c = canvas.Canvas(f'{OUT}/005-vesica-piscis.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(5), pagesize=A3)
     bg(c, Color(0.02, 0.03, 0.09))
     cx, cy = W/2, H/2 + 50
     r = 160
@@ -489,14 +492,8 @@ def gen_005():
     c.circle(c2x, cy, r, fill=0, stroke=1)
 
     # Vesica shape - filled with gradient-like effect
-    for step in range(40, 0, -1):
-        t = step / 40
-        rr = r * t
-        off = offset * t
-        alpha = 0.02 * (1 - t)
-        c.setFillColor(Color(0, 0.7, 1, alpha=alpha))
-        # Approximate vesica intersection with ellipse
-        c.ellipse(cx - rr * 0.3, cy - rr * 0.85, cx + rr * 0.3, cy + rr * 0.85, fill=1, stroke=0)
+    # Approximate vesica intersection with ellipse
+    shading.glow(c, cx, cy, r, Color(0, 0.7, 1, alpha=0.02), step=r / 40, sx=0.3, sy=0.85)
 
     # Inner vesica outline
     # Draw the almond shape with arcs
@@ -521,9 +518,7 @@ def gen_005():
     # Center point
     c.setFillColor(Color(0, 1, 1, alpha=0.9))
     c.circle(cx, cy, 4, fill=1, stroke=0)
-    for rr in range(25, 0, -1):
-        c.setFillColor(Color(0, 0.8, 1, alpha=0.03 * (1 - rr/25)))
-        c.circle(cx, cy, rr, fill=1, stroke=0)
+    shading.glow(c, cx, cy, 25, Color(0, 0.8, 1, alpha=0.03))
 
     scatter_stars(c, 300, (0.4, 0.7, 1), cx, cy, 250)
 
@@ -537,8 +532,9 @@ def gen_005():
 # ═══════════════════════════════════════════════════════════
 # 006 — MANDALA (Jewel Tones: Ruby/Sapphire/Amethyst)
 # ═══════════════════════════════════════════════════════════
+@poster(6, 'mandala', tags=('sacred', 'petals'))
 def gen_006():
-    c = canvas.Canvas(f'{OUT}/006-mandala.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(6), pagesize=A3)
     bg(c, Color(0.04, 0.02, 0.06))
     cx, cy = W/2, H/2 + 50
 
@@ -661,8 +657,9 @@ def gen_006():
 # ═══════════════════════════════════════════════════════════
 # 007 — METATRON'S CUBE (Electric Violet/White)
 # ═══════════════════════════════════════════════════════════
+@poster(7, 'metatrons-cube', tags=('sacred', 'graph'))
 def gen_007():
-    c = canvas.Canvas(f'{OUT}/007-metatrons-cube.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(7), pagesize=A3)
     bg(c, Color(0.03, 0.01, 0.07))
     cx, cy = W/2, H/2 + 50
     r = 120
@@ -731,8 +728,9 @@ def gen_007():
 # ═══════════════════════════════════════════════════════════
 # 008 — TORUS (Rose/Magenta wireframe)
 # ═══════════════════════════════════════════════════════════
+@poster(8, 'torus', tags=('3d', 'wireframe'))
 def gen_008():
-    c = canvas.Canvas(f'{OUT}/008-torus.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(8), pagesize=A3)
     bg(c, Color(0.05, 0.02, 0.04))
     cx, cy = W/2, H/2 + 40
 
@@ -805,8 +803,9 @@ def gen_008():
 # ═══════════════════════════════════════════════════════════
 # 009 — PENROSE TILING (Sunset: Coral/Amber/Peach)
 # ═══════════════════════════════════════════════════════════
+@poster(9, 'penrose-tiling', tags=('tiling',))
 def gen_009():
-    c = canvas.Canvas(f'{OUT}/009-penrose-tiling.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(9), pagesize=A3)
     bg(c, Color(0.07, 0.03, 0.02))
     cx, cy = W/2, H/2 + 50
 
@@ -896,8 +895,9 @@ def gen_009():
 # ═══════════════════════════════════════════════════════════
 # 010 — GEODESIC SPHERE (Mint/Teal/Seafoam)
 # ═══════════════════════════════════════════════════════════
+@poster(10, 'geodesic-sphere', tags=('3d', 'polyhedra'))
 def gen_010():
-    c = canvas.Canvas(f'{OUT}/010-geodesic-sphere.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(10), pagesize=A3)
     bg(c, Color(0.02, 0.05, 0.05))
     cx, cy = W/2, H/2 + 50
     R = 220
@@ -1008,8 +1008,9 @@ def gen_010():
 # ═══════════════════════════════════════════════════════════
 # 011 — VORONOI COSMOS (Neon pastels)
 # ═══════════════════════════════════════════════════════════
+@poster(11, 'voronoi-cosmos', tags=('tessellation', 'particles'))
 def gen_011():
-    c = canvas.Canvas(f'{OUT}/011-voronoi-cosmos.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(11), pagesize=A3)
     bg(c, Color(0.02, 0.02, 0.04))
     cx, cy = W/2, H/2
 
@@ -1086,8 +1087,9 @@ def gen_011():
 # ═══════════════════════════════════════════════════════════
 # 012 — LISSAJOUS HARMONY (Electric Blue/White)
 # ═══════════════════════════════════════════════════════════
+@poster(12, 'lissajous-harmony', tags=('curve', 'oscillator'))
 def gen_012():
-    c = canvas.Canvas(f'{OUT}/012-lissajous-harmony.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(12), pagesize=A3)
     bg(c, Color(0.01, 0.02, 0.06))
     cx, cy = W/2, H/2 + 50
 
@@ -1149,8 +1151,9 @@ def gen_012():
 # ═══════════════════════════════════════════════════════════
 # 013 — SEED OF LIFE (Soft Lavender/Lilac)
 # ═══════════════════════════════════════════════════════════
+@poster(13, 'seed-of-life', tags=('sacred', 'circles'))
 def gen_013():
-    c = canvas.Canvas(f'{OUT}/013-seed-of-life.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(13), pagesize=A3)
     bg(c, Color(0.04, 0.03, 0.06))
     cx, cy = W/2, H/2 + 50
     r = 100
@@ -1201,10 +1204,7 @@ def gen_013():
     c.circle(cx, cy, r * 2.3, fill=0, stroke=1)
 
     # Center glow
-    for rr in range(40, 0, -1):
-        a = 0.03 * (1 - rr/40)
-        c.setFillColor(Color(0.8, 0.5, 1, alpha=a))
-        c.circle(cx, cy, rr, fill=1, stroke=0)
+    shading.glow(c, cx, cy, 40, Color(0.8, 0.5, 1, alpha=0.03))
 
     scatter_stars(c, 250, (0.7, 0.5, 1), cx, cy, r * 2.3)
 
@@ -1218,8 +1218,9 @@ def gen_013():
 # ═══════════════════════════════════════════════════════════
 # 014 — FRACTAL TREE (Forest Green/Bark Brown)
 # ═══════════════════════════════════════════════════════════
+@poster(14, 'fractal-tree', tags=('fractal',))
 def gen_014():
-    c = canvas.Canvas(f'{OUT}/014-fractal-tree.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(14), pagesize=A3)
     bg(c, Color(0.02, 0.04, 0.03))
     cx, cy = W/2, 180  # Base of tree
 
@@ -1302,8 +1303,9 @@ def gen_014():
 # ═══════════════════════════════════════════════════════════
 # 015 — HYPERBOLIC TESSELLATION (Deep Red/Burgundy/Gold)
 # ═══════════════════════════════════════════════════════════
+@poster(15, 'hyperbolic-tessellation', tags=('tiling', 'hyperbolic'))
 def gen_015():
-    c = canvas.Canvas(f'{OUT}/015-hyperbolic-tessellation.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(15), pagesize=A3)
     bg(c, Color(0.06, 0.02, 0.02))
     cx, cy = W/2, H/2 + 50
     R = 280  # Poincaré disk radius
@@ -1414,19 +1416,6 @@ def gen_015():
 # ═══════════════════════════════════════════════════════════
 if __name__ == '__main__':
     print("Generating GEOMETRIA SACRED PATTERNS series...")
-    gen_001()
-    gen_002()
-    gen_003()
-    gen_004()
-    gen_005()
-    gen_006()
-    gen_007()
-    gen_008()
-    gen_009()
-    gen_010()
-    gen_011()
-    gen_012()
-    gen_013()
-    gen_014()
-    gen_015()
+    for item in items(kind='poster', series='001-015'):
+        item.func()
     print("\nAll 15 PDFs generated!")
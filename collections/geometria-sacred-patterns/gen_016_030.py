@@ -3,13 +3,14 @@
 
 import math
 import random
+import numpy as np
 from reportlab.lib.pagesizes import A3
 from reportlab.lib.colors import Color
-from reportlab.pdfgen import canvas
+
+from geometria import dots, fields, gstate, polyline, quality, raster, shading, trajectory
+from geometria.registry import items, poster, poster_path
 
 W, H = A3
-import os
-OUT = os.path.dirname(os.path.abspath(__file__))
 
 def bg(c, color):
     c.setFillColor(color)
@@ -27,11 +28,15 @@ def title_block(c, title, subtitle, edition, color_main, color_sub, color_ed):
     c.drawCentredString(W/2, 52, edition)
 
 def scatter_stars(c, count, color, cx, cy, min_dist=0):
+    stars = []
     for _ in range(count):
         px, py = random.random() * W, random.random() * H
         if math.hypot(px - cx, py - cy) > min_dist:
-            c.setFillColor(Color(color[0], color[1], color[2], alpha=random.random()*0.25+0.05))
-            c.circle(px, py, random.random()*1.5+0.3, fill=1, stroke=0)
+            a = random.random()*0.25+0.05   # drawn before the size, as always
+            stars.append((px, py, random.random()*1.5+0.3, a))
+    if stars:
+        xs, ys, sizes, alphas = zip(*stars)
+        dots.fill(c, xs, ys, sizes, rgb=color[:3], alpha=alphas)
 
 def draw_polygon(c, cx, cy, r, n, rotation=0):
     pts = []
@@ -50,8 +55,9 @@ def draw_polygon(c, cx, cy, r, n, rotation=0):
 # 016 — CYMATICS (Ice Blue / Silver)
 # Sound made visible — nodal patterns on vibrating plates
 # ═══════════════════════════════════════════════════════════
+@poster(16, 'cymatics', tags=('wave', 'field'))
 def gen_016():
-    c = canvas.Canvas(f'{OUT}/016-cymatics.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(16), pagesize=A3)
     bg(c, Color(0.02, 0.03, 0.06))
     cx, cy = W/2, H/2 + 50
 
@@ -67,33 +73,31 @@ def gen_016():
     modes = [(2, 3), (3, 5), (4, 7), (5, 6)]
     R = 230
 
-    for mi, (n, m) in enumerate(modes):
+    # Sample the Chladni function for every mode at once; keep points near zero
+    res = quality.grid(200)
+    k = 200 / res  # dot size follows the sample spacing
+    plate = fields.Sampler.square(res).within(r2=0.95)
+    values = plate.evaluate(
+        lambda s, n, m: np.sin(n * np.pi * s.x) * np.sin(m * np.pi * s.y) -
+                        np.sin(m * np.pi * s.x) * np.sin(n * np.pi * s.y),
+        n=[n for n, m in modes], m=[m for n, m in modes])
+    nodal = plate.threshold(values, below=0.06)
+
+    for mi, pts in enumerate(nodal):
         col = ices[mi % len(ices)]
         c.setStrokeColor(col)
         c.setLineWidth(0.4 + mi * 0.1)
 
-        # Sample the Chladni function and draw contours at zero
-        res = 200
-        for ix in range(res):
-            for iy in range(res):
-                x = (ix / res - 0.5) * 2
-                y = (iy / res - 0.5) * 2
-                if x*x + y*y > 0.95:
-                    continue
-
-                val = math.sin(n * math.pi * x) * math.sin(m * math.pi * y) - \
-                      math.sin(m * math.pi * x) * math.sin(n * math.pi * y)
-
-                # Draw dots near nodal lines
-                if abs(val) < 0.06:
-                    px = cx + x * R
-                    py = cy + y * R
-                    # Accumulate as small particles
-                    sz = 0.8 * (1 - abs(val) / 0.06)
-                    alpha_v = 0.4 * (1 - abs(val) / 0.06)
-                    fade = 1.0 - mi * 0.2
-                    c.setFillColor(Color(col.red, col.green, col.blue, alpha=alpha_v * fade))
-                    c.circle(px, py, sz, fill=1, stroke=0)
+        # Draw dots near nodal lines
+        for x, y, val in pts.rows():
+            px = cx + x * R
+            py = cy + y * R
+            # Accumulate as small particles
+            sz = 0.8 * (1 - abs(val) / 0.06) * k
+            alpha_v = 0.4 * (1 - abs(val) / 0.06)
+            fade = 1.0 - mi * 0.2
+            c.setFillColor(Color(col.red, col.green, col.blue, alpha=alpha_v * fade))
+            c.circle(px, py, sz, fill=1, stroke=0)
 
     # Circular boundary (vibrating plate edge)
     c.setStrokeColor(Color(0.7, 0.85, 1, alpha=0.4))
@@ -105,9 +109,7 @@ def gen_016():
     c.circle(cx, cy, R + 12, fill=0, stroke=1)
 
     # Center glow
-    for rr in range(30, 0, -1):
-        c.setFillColor(Color(0.7, 0.85, 1, alpha=0.02 * (1 - rr/30)))
-        c.circle(cx, cy, rr, fill=1, stroke=0)
+    shading.glow(c, cx, cy, 30, Color(0.7, 0.85, 1, alpha=0.02))
 
     scatter_stars(c, 200, (0.7, 0.85, 1), cx, cy, R + 15)
 
@@ -122,8 +124,9 @@ def gen_016():
 # 017 — DOUBLE HELIX (Bioluminescent Cyan/Green)
 # DNA structure — the geometry of life
 # ═══════════════════════════════════════════════════════════
+@poster(17, 'double-helix', tags=('3d',))
 def gen_017():
-    c = canvas.Canvas(f'{OUT}/017-double-helix.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(17), pagesize=A3)
     bg(c, Color(0.01, 0.03, 0.04))
     cx, cy = W/2, H/2
 
@@ -197,9 +200,7 @@ def gen_017():
             c.circle(x, y, 2.5, fill=1, stroke=0)
 
     # Glow at center
-    for rr in range(50, 0, -1):
-        c.setFillColor(Color(0, 0.7, 0.8, alpha=0.008 * (1 - rr/50)))
-        c.ellipse(cx - rr, cy - rr*3, cx + rr, cy + rr*3, fill=1, stroke=0)
+    shading.glow(c, cx, cy, 50, Color(0, 0.7, 0.8, alpha=0.008), sy=3)
 
     scatter_stars(c, 250, (0.2, 0.8, 0.7), cx, cy, 0)
 
@@ -214,8 +215,9 @@ def gen_017():
 # 018 — SPIROGRAPH (Candy: Hot Pink/Electric Purple/Lime)
 # Hypotrochoid and epitrochoid patterns
 # ═══════════════════════════════════════════════════════════
+@poster(18, 'spirograph', tags=('curve',))
 def gen_018():
-    c = canvas.Canvas(f'{OUT}/018-spirograph.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(18), pagesize=A3)
     bg(c, Color(0.03, 0.01, 0.05))
     cx, cy = W/2, H/2 + 50
 
@@ -281,8 +283,9 @@ def gen_018():
 # 019 — ISLAMIC GEOMETRIC (Midnight Blue / Gold / White)
 # Moorish star patterns — zellige-inspired
 # ═══════════════════════════════════════════════════════════
+@poster(19, 'islamic-geometric', tags=('sacred', 'tiling'))
 def gen_019():
-    c = canvas.Canvas(f'{OUT}/019-islamic-geometric.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(19), pagesize=A3)
     bg(c, Color(0.02, 0.03, 0.08))
     cx, cy = W/2, H/2 + 50
 
@@ -373,8 +376,9 @@ def gen_019():
 # 020 — STRANGE ATTRACTOR (Blood Orange / Ember)
 # Lorenz butterfly — chaos theory
 # ═══════════════════════════════════════════════════════════
+@poster(20, 'strange-attractor', tags=('attractor', 'ode', 'chaos'))
 def gen_020():
-    c = canvas.Canvas(f'{OUT}/020-strange-attractor.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(20), pagesize=A3)
     bg(c, Color(0.05, 0.02, 0.01))
     cx, cy = W/2, H/2 + 30
 
@@ -387,24 +391,11 @@ def gen_020():
 
     # Lorenz attractor
     sigma, rho, beta = 10.0, 28.0, 8.0/3.0
-    dt = 0.005
-    x, y, z = 0.1, 0.0, 0.0
-    points = []
-
-    for _ in range(25000):
-        dx = sigma * (y - x)
-        dy = x * (rho - z) - y
-        dz = x * y - beta * z
-        x += dx * dt
-        y += dy * dt
-        z += dz * dt
-        points.append((x, y, z))
+    traj = trajectory.lorenz(quality.count(25000), sigma, rho, beta, dt=0.005, start=(0.1, 0.0, 0.0))
 
     # Project: use x-z plane, scale to fit
-    xs = [p[0] for p in points]
-    zs = [p[2] for p in points]
-    x_min, x_max = min(xs), max(xs)
-    z_min, z_max = min(zs), max(zs)
+    x_min, x_max = traj.bounds(0)
+    z_min, z_max = traj.bounds(2)
 
     scale_x = 500 / (x_max - x_min)
     scale_z = 600 / (z_max - z_min)
@@ -413,30 +404,20 @@ def gen_020():
     ox = cx - (x_max + x_min) / 2 * scale
     oy = cy - (z_max + z_min) / 2 * scale
 
-    # Draw trajectory
-    for i in range(len(points) - 1):
-        px1 = ox + points[i][0] * scale
-        py1 = oy + points[i][2] * scale
-        px2 = ox + points[i+1][0] * scale
-        py2 = oy + points[i+1][2] * scale
-
-        t = i / len(points)
-        col_idx = int(t * 4) % len(embers)
-        col = embers[col_idx]
-        y_val = points[i][1]
-        depth = (y_val - min(p[1] for p in points)) / (max(p[1] for p in points) - min(p[1] for p in points))
-        alpha = 0.05 + 0.25 * depth
-        c.setStrokeColor(Color(col.red, col.green, col.blue, alpha=alpha))
-        c.setLineWidth(0.3 + 0.7 * depth)
-        c.line(px1, py1, px2, py2)
+    # Draw trajectory: ember colour by time, alpha and width by depth
+    n = len(traj)
+    t = np.arange(n) / n
+    palette = np.array([(col.red, col.green, col.blue) for col in embers])
+    depth = traj.depth(1)
+    polyline.stroke(c, ox + traj.x * scale, oy + traj.z * scale,
+                    rgb=palette[(t * 4).astype(int) % len(embers)],
+                    alpha=0.05 + 0.25 * depth, width=0.3 + 0.7 * depth)
 
     # Attractor fixed points glow
     for fx, fz in [(math.sqrt(beta*(rho-1)), rho-1), (-math.sqrt(beta*(rho-1)), rho-1)]:
         gpx = ox + fx * scale
         gpy = oy + fz * scale
-        for rr in range(25, 0, -1):
-            c.setFillColor(Color(1, 0.4, 0.1, alpha=0.025 * (1 - rr/25)))
-            c.circle(gpx, gpy, rr, fill=1, stroke=0)
+        shading.glow(c, gpx, gpy, 25, Color(1, 0.4, 0.1, alpha=0.025))
 
     scatter_stars(c, 150, (1, 0.6, 0.3), cx, cy, 0)
 
@@ -451,8 +432,9 @@ def gen_020():
 # 021 — ROSE CURVES (Blush Pink / Dusty Rose / Cream)
 # Rhodonea mathematical curves
 # ═══════════════════════════════════════════════════════════
+@poster(21, 'rose-curves', tags=('curve',))
 def gen_021():
-    c = canvas.Canvas(f'{OUT}/021-rose-curves.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(21), pagesize=A3)
     bg(c, Color(0.05, 0.03, 0.04))
     cx, cy = W/2, H/2 + 50
 
@@ -499,9 +481,7 @@ def gen_021():
         c.drawPath(p, fill=0, stroke=1)
 
     # Center bloom
-    for rr in range(35, 0, -1):
-        c.setFillColor(Color(0.95, 0.5, 0.6, alpha=0.02 * (1 - rr/35)))
-        c.circle(cx, cy, rr, fill=1, stroke=0)
+    shading.glow(c, cx, cy, 35, Color(0.95, 0.5, 0.6, alpha=0.02))
     c.setFillColor(Color(1, 0.8, 0.8, alpha=0.8))
     c.circle(cx, cy, 4, fill=1, stroke=0)
 
@@ -518,22 +498,16 @@ def gen_021():
 # 022 — SUPERNOVA (White/Blue core → Red/Orange shell)
 # Explosive radial energy burst
 # ═══════════════════════════════════════════════════════════
+@poster(22, 'supernova', tags=('cosmic', 'particles', 'glow'))
 def gen_022():
-    c = canvas.Canvas(f'{OUT}/022-supernova.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(22), pagesize=A3)
     bg(c, Color(0.02, 0.01, 0.03))
     cx, cy = W/2, H/2 + 50
 
     random.seed(2024)
 
     # Core glow (white → blue)
-    for rr in range(120, 0, -1):
-        t = rr / 120
-        r_c = 0.3 + 0.7 * (1 - t)
-        g_c = 0.4 + 0.6 * (1 - t)
-        b_c = 0.8 + 0.2 * (1 - t)
-        alpha = 0.04 * (1 - t)
-        c.setFillColor(Color(r_c, g_c, b_c, alpha=alpha))
-        c.circle(cx, cy, rr, fill=1, stroke=0)
+    shading.glow(c, cx, cy, 120, Color(1, 1, 1, alpha=0.04), edge=Color(0.3, 0.4, 0.8))
 
     # Bright white core
     c.setFillColor(Color(1, 1, 1, alpha=0.95))
@@ -607,8 +581,9 @@ def gen_022():
 # 023 — NEURAL NETWORK (Synapse Purple / Electric)
 # Brain-like interconnected nodes
 # ═══════════════════════════════════════════════════════════
+@poster(23, 'neural-network', tags=('graph',))
 def gen_023():
-    c = canvas.Canvas(f'{OUT}/023-neural-network.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(23), pagesize=A3)
     bg(c, Color(0.03, 0.02, 0.05))
     cx, cy = W/2, H/2 + 30
 
@@ -705,8 +680,9 @@ def gen_023():
 # 024 — ORBITAL MECHANICS (Space Black / Celestial Gold)
 # Kepler orbits — planetary dance
 # ═══════════════════════════════════════════════════════════
+@poster(24, 'orbital-mechanics', tags=('cosmic', 'physics'))
 def gen_024():
-    c = canvas.Canvas(f'{OUT}/024-orbital-mechanics.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(24), pagesize=A3)
     bg(c, Color(0.01, 0.01, 0.02))
     cx, cy = W/2, H/2 + 50
 
@@ -720,10 +696,7 @@ def gen_024():
     ]
 
     # Sun at center
-    for rr in range(60, 0, -1):
-        t = rr / 60
-        c.setFillColor(Color(1, 0.85, 0.2, alpha=0.04 * (1 - t)))
-        c.circle(cx, cy, rr, fill=1, stroke=0)
+    shading.glow(c, cx, cy, 60, Color(1, 0.85, 0.2, alpha=0.04))
     c.setFillColor(Color(1, 0.95, 0.6, alpha=0.9))
     c.circle(cx, cy, 10, fill=1, stroke=0)
     c.setFillColor(Color(1, 1, 0.9, alpha=0.95))
@@ -809,9 +782,11 @@ def gen_024():
 # 025 — WAVE INTERFERENCE (Deep Indigo / Phosphor Green)
 # Double slit experiment — quantum patterns
 # ═══════════════════════════════════════════════════════════
+@poster(25, 'wave-interference', tags=('wave', 'field', 'physics'))
 def gen_025():
-    c = canvas.Canvas(f'{OUT}/025-wave-interference.pdf', pagesize=A3)
-    bg(c, Color(0.01, 0.02, 0.04))
+    c = gstate.canvas(poster_path(25), pagesize=A3)
+    paper = Color(0.01, 0.02, 0.04)
+    bg(c, paper)
     cx, cy = W/2, H/2 + 50
 
     # Two wave sources
@@ -819,34 +794,30 @@ def gen_025():
     s2 = (cx + 60, cy)
     wavelength = 40
 
+    def waves(s):
+        # Interference: sum of the waves from both sources
+        return sum(np.sin(2 * np.pi * fields.distance(s, src) / wavelength) for src in (s1, s2))
+
     # Calculate interference pattern
-    res = 250
-    for ix in range(res):
-        for iy in range(res):
-            px = ix / res * W
-            py = 140 + iy / res * (H - 160)
-
-            d1 = math.hypot(px - s1[0], py - s1[1])
-            d2 = math.hypot(px - s2[0], py - s2[1])
-
-            # Interference: sum of two waves
-            wave = math.sin(2 * math.pi * d1 / wavelength) + math.sin(2 * math.pi * d2 / wavelength)
-            intensity = (wave / 2) ** 2  # Normalized intensity
-
-            if intensity > 0.3:
-                alpha = min(0.4, intensity * 0.4)
-                # Color: green for constructive, subtle blue for edges
-                g = min(1, intensity * 0.8)
-                b = min(0.5, intensity * 0.3)
-                c.setFillColor(Color(0.1, g, 0.3 + b, alpha=alpha))
-                sz = 1.0 + intensity * 1.5
-                c.circle(px, py, sz, fill=1, stroke=0)
+    res = quality.grid(250)
+    k = 250 / res
+    page = fields.Sampler(fields.linear(res, 0, W), fields.linear(res, 140, H - 160))
+    intensity = (page.evaluate(waves) / 2) ** 2  # Normalized intensity
+    # Drawn right after bg(): only the flat paper lies under this opaque extent
+    dense = raster.layer(c, 25, (0, 130, W, H - 10), background=paper)
+    for px, py, intensity in page.threshold(intensity, above=0.3).rows():
+        alpha = min(0.4, intensity * 0.4)
+        # Color: green for constructive, subtle blue for edges
+        g = min(1, intensity * 0.8)
+        b = min(0.5, intensity * 0.3)
+        dense.setFillColor(Color(0.1, g, 0.3 + b, alpha=alpha))
+        sz = (1.0 + intensity * 1.5) * k
+        dense.circle(px, py, sz, fill=1, stroke=0)
+    raster.flush(c, dense)
 
     # Wave source points
     for sx, sy in [s1, s2]:
-        for rr in range(20, 0, -1):
-            c.setFillColor(Color(0.2, 1, 0.5, alpha=0.04 * (1 - rr/20)))
-            c.circle(sx, sy, rr, fill=1, stroke=0)
+        shading.glow(c, sx, sy, 20, Color(0.2, 1, 0.5, alpha=0.04))
         c.setFillColor(Color(0.5, 1, 0.7, alpha=0.9))
         c.circle(sx, sy, 4, fill=1, stroke=0)
 
@@ -862,11 +833,9 @@ def gen_025():
     # "Screen" at the top and bottom showing fringe pattern
     c.setLineWidth(0.5)
     for py_screen in [cy - 320, cy + 320]:
-        for ix in range(300):
-            px = W * 0.1 + ix / 300 * W * 0.8
-            d1 = math.hypot(px - s1[0], py_screen - s1[1])
-            d2 = math.hypot(px - s2[0], py_screen - s2[1])
-            wave = math.sin(2 * math.pi * d1 / wavelength) + math.sin(2 * math.pi * d2 / wavelength)
+        n_screen = quality.count(300, minimum=30)
+        screen = fields.Sampler(W * 0.1 + np.arange(n_screen) / n_screen * W * 0.8, [py_screen])
+        for px, wave in zip(screen.x.tolist(), screen.evaluate(waves).tolist()):
             intensity = abs(wave / 2)
             c.setFillColor(Color(0.2, 1, 0.5, alpha=intensity * 0.5))
             c.circle(px, py_screen, 1 + intensity * 2, fill=1, stroke=0)
@@ -884,8 +853,9 @@ def gen_025():
 # 026 — HEXAGONAL LATTICE (Honey Gold / Warm Amber)
 # Honeycomb structure with depth
 # ═══════════════════════════════════════════════════════════
+@poster(26, 'hexagonal-lattice', tags=('tiling',))
 def gen_026():
-    c = canvas.Canvas(f'{OUT}/026-hexagonal-lattice.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(26), pagesize=A3)
     bg(c, Color(0.05, 0.03, 0.01))
     cx, cy = W/2, H/2 + 50
 
@@ -953,8 +923,9 @@ def gen_026():
 # 027 — MÖBIUS STRIP (Chromatic Iridescent)
 # Non-orientable surface — single surface, single edge
 # ═══════════════════════════════════════════════════════════
+@poster(27, 'mobius-strip', tags=('3d', 'wireframe'))
 def gen_027():
-    c = canvas.Canvas(f'{OUT}/027-mobius-strip.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(27), pagesize=A3)
     bg(c, Color(0.03, 0.03, 0.04))
     cx, cy = W/2, H/2 + 50
 
@@ -1033,8 +1004,9 @@ def gen_027():
 # 028 — CELTIC KNOT (Emerald / Antique Gold)
 # Interwoven eternal paths
 # ═══════════════════════════════════════════════════════════
+@poster(28, 'celtic-knot', tags=('curve', 'knot'))
 def gen_028():
-    c = canvas.Canvas(f'{OUT}/028-celtic-knot.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(28), pagesize=A3)
     bg(c, Color(0.02, 0.04, 0.03))
     cx, cy = W/2, H/2 + 50
 
@@ -1114,8 +1086,9 @@ def gen_028():
 # 029 — SACRED EYE (Midnight / Gold / All-seeing)
 # Eye of Providence meets sacred geometry
 # ═══════════════════════════════════════════════════════════
+@poster(29, 'sacred-eye', tags=('sacred', 'glow'))
 def gen_029():
-    c = canvas.Canvas(f'{OUT}/029-sacred-eye.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(29), pagesize=A3)
     bg(c, Color(0.03, 0.02, 0.05))
     cx, cy = W/2, H/2 + 40
 
@@ -1155,10 +1128,7 @@ def gen_029():
     c.setLineWidth(1.0)
     c.circle(cx, cy, 55, fill=0, stroke=1)
     # Iris fill
-    for rr in range(55, 0, -1):
-        t = rr / 55
-        c.setFillColor(Color(0.2, 0.3, 0.8, alpha=0.015 * (1 - t)))
-        c.circle(cx, cy, rr, fill=1, stroke=0)
+    shading.glow(c, cx, cy, 55, Color(0.2, 0.3, 0.8, alpha=0.015))
 
     # Iris rays
     c.setLineWidth(0.3)
@@ -1211,8 +1181,9 @@ def gen_029():
 # 030 — TESSERACT (Holographic Silver / Ultraviolet)
 # 4D hypercube projected to 2D
 # ═══════════════════════════════════════════════════════════
+@poster(30, 'tesseract', tags=('3d', '4d'))
 def gen_030():
-    c = canvas.Canvas(f'{OUT}/030-tesseract.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(30), pagesize=A3)
     bg(c, Color(0.02, 0.01, 0.04))
     cx, cy = W/2, H/2 + 50
 
@@ -1342,19 +1313,6 @@ def gen_030():
 # ═══════════════════════════════════════════════════════════
 if __name__ == '__main__':
     print("Generating GEOMETRIA SACRED PATTERNS 016–030...")
-    gen_016()
-    gen_017()
-    gen_018()
-    gen_019()
-    gen_020()
-    gen_021()
-    gen_022()
-    gen_023()
-    gen_024()
-    gen_025()
-    gen_026()
-    gen_027()
-    gen_028()
-    gen_029()
-    gen_030()
+    for item in items(kind='poster', series='016-030'):
+        item.func()
     print("\nAll 15 PDFs (016–030) generated!")
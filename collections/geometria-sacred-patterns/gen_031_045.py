@@ -3,13 +3,15 @@
 
 import math
 import random
-import os
+import numpy as np
 from reportlab.lib.pagesizes import A3
 from reportlab.lib.colors import Color
-from reportlab.pdfgen import canvas
+
+from geometria import (density, dots, escape, fields, gstate, polyline, quality, raster, reaction,
+                       shading, simcache, trajectory)
+from geometria.registry import items, poster, poster_path
 
 W, H = A3
-OUT = os.path.dirname(os.path.abspath(__file__))
 
 def bg(c, color):
     c.setFillColor(color)
@@ -27,11 +29,15 @@ def title_block(c, title, subtitle, edition, color_main, color_sub, color_ed):
     c.drawCentredString(W/2, 52, edition)
 
 def scatter_stars(c, count, color, cx, cy, min_dist=0):
+    stars = []
     for _ in range(count):
         px, py = random.random() * W, random.random() * H
         if math.hypot(px - cx, py - cy) > min_dist:
-            c.setFillColor(Color(color[0], color[1], color[2], alpha=random.random()*0.25+0.05))
-            c.circle(px, py, random.random()*1.5+0.3, fill=1, stroke=0)
+            a = random.random()*0.25+0.05   # drawn before the size, as always
+            stars.append((px, py, random.random()*1.5+0.3, a))
+    if stars:
+        xs, ys, sizes, alphas = zip(*stars)
+        dots.fill(c, xs, ys, sizes, rgb=color[:3], alpha=alphas)
 
 def draw_polygon(c, cx, cy, r, n, rotation=0):
     pts = []
@@ -50,43 +56,37 @@ def draw_polygon(c, cx, cy, r, n, rotation=0):
 # 031 — JULIA SET (Deep Ultraviolet / Plasma Pink)
 # Fractal boundary of complex dynamics
 # ═══════════════════════════════════════════════════════════
+@poster(31, 'julia-set', tags=('fractal', 'complex'))
 def gen_031():
-    c = canvas.Canvas(f'{OUT}/031-julia-set.pdf', pagesize=A3)
-    bg(c, Color(0.02, 0.01, 0.04))
+    c = gstate.canvas(poster_path(31), pagesize=A3)
+    paper = Color(0.02, 0.01, 0.04)
+    bg(c, paper)
     cx, cy = W/2, H/2 + 50
 
     # Julia set for c = -0.7 + 0.27015i
     c_re, c_im = -0.7, 0.27015
     max_iter = 80
     R = 280
-    res = 350
-
-    for ix in range(res):
-        for iy in range(res):
-            # Map pixel to complex plane [-1.5, 1.5]
-            x0 = (ix / res - 0.5) * 3.0
-            y0 = (iy / res - 0.5) * 3.0
-            zr, zi = x0, y0
-            iteration = 0
-            while zr*zr + zi*zi < 4 and iteration < max_iter:
-                zr_new = zr*zr - zi*zi + c_re
-                zi = 2*zr*zi + c_im
-                zr = zr_new
-                iteration += 1
-
-            if iteration < max_iter:
-                t = iteration / max_iter
-                # Color mapping: ultraviolet → pink → white
-                r_c = min(1, 0.3 + t * 1.5)
-                g_c = min(1, 0.05 + t * 0.6)
-                b_c = min(1, 0.5 + t * 0.8)
-                alpha = min(0.6, 0.05 + t * 0.8)
-                sz = 0.8 + t * 1.2
-
-                px = cx + (ix / res - 0.5) * R * 2
-                py = cy + (iy / res - 0.5) * R * 2
-                c.setFillColor(Color(r_c, g_c, b_c, alpha=alpha))
-                c.circle(px, py, sz, fill=1, stroke=0)
+    res = quality.grid(350)
+    k = 350 / res
+
+    # Escape time over the complex plane [-1.5, 1.5]², one dot per escaped sample,
+    # coloured by the continuous (smooth) count so there are no iteration bands
+    esc = escape.julia(complex(c_re, c_im), res, span=3.0, max_iter=max_iter, smooth=True)
+    ix, iy = np.nonzero(esc.escaped)
+    t = esc.potential[ix, iy]
+    # Color mapping: ultraviolet → pink → white
+    rgb = np.column_stack([np.minimum(1, 0.3 + t * 1.5), np.minimum(1, 0.05 + t * 0.6),
+                           np.minimum(1, 0.5 + t * 0.8)])
+    alpha = np.minimum(0.6, 0.05 + t * 0.8)
+    # Only the flat background lies under the layer, so it can be an opaque image
+    reach = R + 2 * k + 1
+    dense = raster.layer(c, 31, (cx - reach, cy - reach, cx + reach, cy + reach),
+                         background=paper)
+    # 256 levels per channel: 8-bit colour, one state change per level instead of per dot
+    dots.fill(dense, cx + (ix / res - 0.5) * R * 2, cy + (iy / res - 0.5) * R * 2,
+              (0.8 + t * 1.2) * k, rgb=rgb, alpha=alpha, buckets=256)
+    raster.flush(c, dense)
 
     # Boundary glow
     c.setStrokeColor(Color(0.8, 0.3, 1, alpha=0.08))
@@ -106,34 +106,17 @@ def gen_031():
 # 032 — MAGNETIC FIELD (Iron / Steel Blue / Arc White)
 # Dipole field lines — invisible forces
 # ═══════════════════════════════════════════════════════════
-def gen_032():
-    c = canvas.Canvas(f'{OUT}/032-magnetic-field.pdf', pagesize=A3)
-    bg(c, Color(0.02, 0.02, 0.05))
-    cx, cy = W/2, H/2 + 50
-
-    steels = [
-        Color(0.4, 0.6, 0.9, alpha=0.45),
-        Color(0.6, 0.75, 1.0, alpha=0.4),
-        Color(0.3, 0.45, 0.8, alpha=0.4),
-        Color(0.8, 0.85, 1.0, alpha=0.3),
-    ]
-
-    # Two magnetic poles
-    pole_sep = 120
-    north = (cx, cy + pole_sep/2)
-    south = (cx, cy - pole_sep/2)
-
-    # Draw field lines by tracing from angles around north pole
-    random.seed(77)
-    for start_angle_deg in range(0, 360, 8):
+@simcache.memoize('field-lines-032')
+def field_lines(north, south, center, step_deg=8, max_steps=500):
+    """Trace dipole field lines from around the north pole; one (k, 2) array per line."""
+    lines = []
+    for start_angle_deg in range(0, 360, step_deg):
         a = math.radians(start_angle_deg)
         x = north[0] + 8 * math.cos(a)
         y = north[1] + 8 * math.sin(a)
 
-        col = steels[start_angle_deg // 90 % len(steels)]
-
         pts = [(x, y)]
-        for step in range(500):
+        for step in range(max_steps):
             # Magnetic field of a dipole (simplified)
             bx_total, by_total = 0, 0
             for pole, sign in [(north, 1), (south, -1)]:
@@ -151,27 +134,52 @@ def gen_032():
             pts.append((x, y))
 
             # Stop if too far or reached south pole
-            if math.hypot(x - cx, y - cy) > 400:
+            if math.hypot(x - center[0], y - center[1]) > 400:
                 break
             if math.hypot(x - south[0], y - south[1]) < 10:
                 break
+        lines.append(np.array(pts, dtype=float))
+    return lines
+
+
+@poster(32, 'magnetic-field', tags=('field', 'physics'))
+def gen_032():
+    c = gstate.canvas(poster_path(32), pagesize=A3)
+    bg(c, Color(0.02, 0.02, 0.05))
+    cx, cy = W/2, H/2 + 50
+
+    steels = [
+        Color(0.4, 0.6, 0.9, alpha=0.45),
+        Color(0.6, 0.75, 1.0, alpha=0.4),
+        Color(0.3, 0.45, 0.8, alpha=0.4),
+        Color(0.8, 0.85, 1.0, alpha=0.3),
+    ]
 
-        # Draw field line
-        if len(pts) > 5:
-            for i in range(len(pts) - 1):
-                dist_n = math.hypot(pts[i][0] - north[0], pts[i][1] - north[1])
-                dist_s = math.hypot(pts[i][0] - south[0], pts[i][1] - south[1])
-                min_d = min(dist_n, dist_s)
-                alpha = min(0.5, max(0.05, 0.4 * (1 - min_d / 400)))
-                c.setStrokeColor(Color(col.red, col.green, col.blue, alpha=alpha))
-                c.setLineWidth(0.4 + 0.6 * (1 - min_d / 400))
-                c.line(pts[i][0], pts[i][1], pts[i+1][0], pts[i+1][1])
+    # Two magnetic poles
+    pole_sep = 120
+    north = (cx, cy + pole_sep/2)
+    south = (cx, cy - pole_sep/2)
+
+    # Draw field lines by tracing from angles around north pole
+    random.seed(77)
+    lines = field_lines(north, south, (cx, cy))
+    c.saveState()
+    c.setLineJoin(1)  # round joins for every line, set once
+    for start_angle_deg, line in zip(range(0, 360, 8), lines):
+        col = steels[start_angle_deg // 90 % len(steels)]
+
+        # Draw field line, brighter and thicker near the poles
+        if len(line) > 5:
+            min_d = np.minimum(np.hypot(line[:, 0] - north[0], line[:, 1] - north[1]),
+                               np.hypot(line[:, 0] - south[0], line[:, 1] - south[1]))
+            polyline.stroke(c, line[:, 0], line[:, 1], rgb=(col.red, col.green, col.blue),
+                            alpha=np.clip(0.4 * (1 - min_d / 400), 0.05, 0.5),
+                            width=0.4 + 0.6 * (1 - min_d / 400), join=None)
+    c.restoreState()
 
     # Pole markers
     for pole, label, col_p in [(north, "N", Color(0.9, 0.3, 0.3)), (south, "S", Color(0.3, 0.5, 0.9))]:
-        for rr in range(30, 0, -1):
-            c.setFillColor(Color(col_p.red, col_p.green, col_p.blue, alpha=0.03 * (1 - rr/30)))
-            c.circle(pole[0], pole[1], rr, fill=1, stroke=0)
+        shading.glow(c, pole[0], pole[1], 30, Color(col_p.red, col_p.green, col_p.blue, alpha=0.03))
         c.setFillColor(Color(col_p.red, col_p.green, col_p.blue, alpha=0.8))
         c.circle(pole[0], pole[1], 6, fill=1, stroke=0)
         c.setFillColor(Color(1, 1, 1, alpha=0.6))
@@ -191,8 +199,9 @@ def gen_032():
 # 033 — HARMONIC OSCILLATOR (Warm Copper / Bronze)
 # Pendulum traces — phase space portraits
 # ═══════════════════════════════════════════════════════════
+@poster(33, 'harmonic-oscillator', tags=('curve', 'oscillator'))
 def gen_033():
-    c = canvas.Canvas(f'{OUT}/033-harmonic-oscillator.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(33), pagesize=A3)
     bg(c, Color(0.05, 0.03, 0.02))
     cx, cy = W/2, H/2 + 50
 
@@ -214,32 +223,28 @@ def gen_033():
         (200,2.0,0,0.0008, 100,3.0,math.pi/3,0.003, 200,3.0,math.pi/2,0.0008, 100,4.0,0,0.003),
     ]
 
+    c.saveState()
+    c.setLineJoin(1)  # round joins for every trail, set once
     for ci_idx, cfg in enumerate(configs):
         a1,f1,p1,d1,a2,f2,p2,d2,a3,f3,p3,d3,a4,f4,p4,d4 = cfg
         col = coppers[ci_idx]
         scale = 0.85
 
-        steps = 8000
-        prev = None
-        for s in range(steps):
-            t = s * 0.02
-            x = (a1*math.sin(f1*t+p1)*math.exp(-d1*t) + a2*math.sin(f2*t+p2)*math.exp(-d2*t)) * scale
-            y = (a3*math.sin(f3*t+p3)*math.exp(-d3*t) + a4*math.sin(f4*t+p4)*math.exp(-d4*t)) * scale
-            px, py = cx + x, cy + y
+        steps = quality.count(8000)
+        dt = 0.02 * 8000 / steps  # same time span at any quality
+        t = np.arange(steps) * dt
+        x = (a1*np.sin(f1*t+p1)*np.exp(-d1*t) + a2*np.sin(f2*t+p2)*np.exp(-d2*t)) * scale
+        y = (a3*np.sin(f3*t+p3)*np.exp(-d3*t) + a4*np.sin(f4*t+p4)*np.exp(-d4*t)) * scale
 
-            if prev:
-                fade = math.exp(-d1 * t * 0.5)
-                alpha = col.alpha * fade * 0.7
-                if alpha > 0.01:
-                    c.setStrokeColor(Color(col.red, col.green, col.blue, alpha=alpha))
-                    c.setLineWidth(0.4 + fade * 0.8)
-                    c.line(prev[0], prev[1], px, py)
-            prev = (px, py)
+        # Each segment fades with the time at its far end
+        fade = np.exp(-d1 * t[1:] * 0.5)
+        alpha = col.alpha * fade * 0.7
+        polyline.stroke(c, cx + x, cy + y, rgb=(col.red, col.green, col.blue),
+                        alpha=alpha, width=0.4 + fade * 0.8, keep=alpha > 0.01, join=None)
+    c.restoreState()
 
     # Center pivot
-    for rr in range(20, 0, -1):
-        c.setFillColor(Color(0.85, 0.6, 0.3, alpha=0.03 * (1 - rr/20)))
-        c.circle(cx, cy, rr, fill=1, stroke=0)
+    shading.glow(c, cx, cy, 20, Color(0.85, 0.6, 0.3, alpha=0.03))
     c.setFillColor(Color(1, 0.85, 0.5, alpha=0.8))
     c.circle(cx, cy, 3, fill=1, stroke=0)
 
@@ -256,46 +261,29 @@ def gen_033():
 # 034 — REACTION-DIFFUSION (Organic Teal / Deep Sea)
 # Turing patterns — spots and stripes of nature
 # ═══════════════════════════════════════════════════════════
+@simcache.memoize('gray-scott-034')
+def gray_scott(res, spots, steps, Du=0.16, Dv=0.08, f=0.035, k=0.065, dt=1.0):
+    """Run the Gray-Scott model from 9×9 spots; returns the final v grid."""
+    rd = reaction.GrayScott(res, Du=Du, Dv=Dv, f=f, k=k, dt=dt)
+    for sx, sy in spots:
+        rd.seed_square(sx, sy)
+    rd.step(steps)
+    return rd.v.astype(float)
+
+
+@poster(34, 'reaction-diffusion', tags=('simulation', 'pde'))
 def gen_034():
-    c = canvas.Canvas(f'{OUT}/034-reaction-diffusion.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(34), pagesize=A3)
     bg(c, Color(0.01, 0.04, 0.05))
     cx, cy = W/2, H/2 + 50
 
     # Simplified Gray-Scott model visualization
     # Pre-compute a pattern using reaction-diffusion
     random.seed(2025)
-    res = 120
-    # Initialize concentrations
-    u = [[1.0]*res for _ in range(res)]
-    v = [[0.0]*res for _ in range(res)]
-
+    res = quality.grid(120, minimum=48)
     # Seed some spots
-    for _ in range(15):
-        sx, sy = random.randint(20, res-20), random.randint(20, res-20)
-        for dx in range(-4, 5):
-            for dy in range(-4, 5):
-                if 0 <= sx+dx < res and 0 <= sy+dy < res:
-                    u[sx+dx][sy+dy] = 0.5
-                    v[sx+dx][sy+dy] = 0.25
-
-    # Run simulation
-    Du, Dv = 0.16, 0.08
-    f, k = 0.035, 0.065
-    dt = 1.0
-
-    for _ in range(3000):
-        nu = [[0.0]*res for _ in range(res)]
-        nv = [[0.0]*res for _ in range(res)]
-        for x in range(1, res-1):
-            for y in range(1, res-1):
-                lap_u = u[x+1][y] + u[x-1][y] + u[x][y+1] + u[x][y-1] - 4*u[x][y]
-                lap_v = v[x+1][y] + v[x-1][y] + v[x][y+1] + v[x][y-1] - 4*v[x][y]
-                uvv = u[x][y] * v[x][y] * v[x][y]
-                nu[x][y] = u[x][y] + (Du * lap_u - uvv + f * (1 - u[x][y])) * dt
-                nv[x][y] = v[x][y] + (Dv * lap_v + uvv - (f + k) * v[x][y]) * dt
-                nu[x][y] = max(0, min(1, nu[x][y]))
-                nv[x][y] = max(0, min(1, nv[x][y]))
-        u, v = nu, nv
+    spots = [(random.randint(20, res-20), random.randint(20, res-20)) for _ in range(15)]
+    v = gray_scott(res, spots, steps=3000).tolist()
 
     # Render
     scale = min(500 / res, 700 / res)
@@ -334,8 +322,9 @@ def gen_034():
 # 035 — ASTRONOMICAL CLOCK (Burnished Gold / Midnight)
 # Medieval astronomical instruments
 # ═══════════════════════════════════════════════════════════
+@poster(35, 'astronomical-clock', tags=('cosmic',))
 def gen_035():
-    c = canvas.Canvas(f'{OUT}/035-astronomical-clock.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(35), pagesize=A3)
     bg(c, Color(0.03, 0.02, 0.04))
     cx, cy = W/2, H/2 + 50
 
@@ -464,8 +453,9 @@ def gen_035():
 # 036 — SIERPINSKI TRIANGLE (Neon Green / Matrix)
 # Recursive self-similarity — fractal dust
 # ═══════════════════════════════════════════════════════════
+@poster(36, 'sierpinski-triangle', tags=('fractal', 'chaos'))
 def gen_036():
-    c = canvas.Canvas(f'{OUT}/036-sierpinski-triangle.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(36), pagesize=A3)
     bg(c, Color(0.01, 0.03, 0.01))
     cx, cy = W/2, H/2 + 50
 
@@ -531,13 +521,19 @@ def gen_036():
     random.seed(42)
     verts = [(ax, ay), (bx, by), (ccx_v, ccy_v)]
     px, py = cx, cy
-    for i in range(5000):
+    points = []
+    for i in range(quality.count(5000, minimum=100)):
         target = random.choice(verts)
         px = (px + target[0]) / 2
         py = (py + target[1]) / 2
         if i > 10:  # Skip first few
-            c.setFillColor(Color(0, 1, 0.3, alpha=0.12))
-            c.circle(px, py, 0.8, fill=1, stroke=0)
+            points.append((px, py))
+
+    # One density image; 'over' stacks like the 0.12-alpha dots it replaces
+    hist = density.Histogram((bx - 2, by - 2, ccx_v + 2, ay + 2), dpi=quality.grid(200, minimum=72))
+    xs, ys = zip(*points)
+    hist.add(xs, ys).splat(0.8)
+    density.draw(c, hist.image(tone='over', alpha=0.12, rgb=(0, 1, 0.3)), hist)
 
     scatter_stars(c, 150, (0.2, 0.8, 0.3), cx, cy, R + 20)
 
@@ -552,8 +548,9 @@ def gen_036():
 # 037 — STANDING WAVES (Warm Amber / Acoustic)
 # Harmonic modes on a circular membrane
 # ═══════════════════════════════════════════════════════════
+@poster(37, 'standing-waves', tags=('wave', 'field'))
 def gen_037():
-    c = canvas.Canvas(f'{OUT}/037-standing-waves.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(37), pagesize=A3)
     bg(c, Color(0.04, 0.03, 0.01))
     cx, cy = W/2, H/2 + 50
 
@@ -576,7 +573,16 @@ def gen_037():
         (cx, cy + 300),  # skip this, only 5 visible
     ]
 
-    for mi, ((n, m), (px_c, py_c)) in enumerate(zip(modes[:5], positions[:5])):
+    # Sample all mode shapes in one pass on the unit disc
+    # Approximate Bessel: sin(m*pi*r) for radial, cos(n*theta) for angular
+    res = quality.grid(80)
+    k = 80 / res
+    disc = fields.Sampler.square(res).within(radius=0.95)
+    values = disc.evaluate(lambda s, n, m: np.sin(m * np.pi * s.r) * np.cos(n * s.theta),
+                           n=[n for n, m in modes[:5]], m=[m for n, m in modes[:5]])
+    shapes = disc.threshold(values, above=0.1)
+
+    for mi, ((n, m), (px_c, py_c), pts) in enumerate(zip(modes[:5], positions[:5], shapes)):
         col = ambers[mi % len(ambers)]
         mr = 110  # mode radius
 
@@ -585,31 +591,20 @@ def gen_037():
         c.setLineWidth(0.8)
         c.circle(px_c, py_c, mr, fill=0, stroke=1)
 
-        # Sample the mode shape
-        res = 80
-        for ix in range(res):
-            for iy in range(res):
-                x = (ix / res - 0.5) * 2
-                y = (iy / res - 0.5) * 2
-                r = math.sqrt(x*x + y*y)
-                if r > 0.95:
-                    continue
-                theta = math.atan2(y, x)
-
-                # Approximate Bessel: sin(m*pi*r) for radial, cos(n*theta) for angular
-                radial = math.sin(m * math.pi * r)
-                angular = math.cos(n * theta)
-                val = radial * angular
-
-                if abs(val) > 0.1:
-                    sx = px_c + x * mr
-                    sy = py_c + y * mr
-                    intensity = abs(val)
-                    if val > 0:
-                        c.setFillColor(Color(1, 0.8, 0.3, alpha=intensity * 0.4))
-                    else:
-                        c.setFillColor(Color(0.3, 0.5, 0.9, alpha=intensity * 0.3))
-                    c.circle(sx, sy, 1.0 + intensity * 1.0, fill=1, stroke=0)
+        # One layer per mode, placed before its label and over its own boundary only
+        reach = mr + 2 * k + 1
+        dense = raster.layer(c, 37, (px_c - reach, py_c - reach, px_c + reach, py_c + reach))
+
+        for x, y, val in pts.rows():
+            sx = px_c + x * mr
+            sy = py_c + y * mr
+            intensity = abs(val)
+            if val > 0:
+                dense.setFillColor(Color(1, 0.8, 0.3, alpha=intensity * 0.4))
+            else:
+                dense.setFillColor(Color(0.3, 0.5, 0.9, alpha=intensity * 0.3))
+            dense.circle(sx, sy, (1.0 + intensity * 1.0) * k, fill=1, stroke=0)
+        raster.flush(c, dense)
 
         # Mode label
         c.setFillColor(Color(1, 0.85, 0.4, alpha=0.3))
@@ -636,18 +631,16 @@ def gen_037():
 # 038 — GALAXY SPIRAL (Cosmic Indigo / Starlight)
 # Logarithmic spiral arms of a galaxy
 # ═══════════════════════════════════════════════════════════
+@poster(38, 'galaxy-spiral', tags=('cosmic', 'particles', 'spiral'))
 def gen_038():
-    c = canvas.Canvas(f'{OUT}/038-galaxy-spiral.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(38), pagesize=A3)
     bg(c, Color(0.01, 0.01, 0.03))
     cx, cy = W/2, H/2 + 50
 
     random.seed(2024)
 
     # Central bulge
-    for rr in range(80, 0, -1):
-        t = rr / 80
-        c.setFillColor(Color(1, 0.95, 0.7, alpha=0.03 * (1 - t)))
-        c.ellipse(cx - rr * 1.2, cy - rr, cx + rr * 1.2, cy + rr, fill=1, stroke=0)
+    shading.glow(c, cx, cy, 80, Color(1, 0.95, 0.7, alpha=0.03), sx=1.2)
 
     # Bright core
     c.setFillColor(Color(1, 0.95, 0.8, alpha=0.8))
@@ -658,11 +651,12 @@ def gen_038():
     a_spiral = 5
     b_spiral = 0.18
 
+    stars = []
     for arm in range(n_arms):
         base_angle = arm * 2 * math.pi / n_arms
 
         # Each arm has thousands of "stars"
-        for _ in range(3000):
+        for _ in range(quality.count(3000)):
             t = random.random() * 12  # theta range
             r = a_spiral * math.exp(b_spiral * t)
             if r > 320:
@@ -701,14 +695,16 @@ def gen_038():
             brightness = max(0.1, 1.0 - r / 350)
             alpha = brightness * (0.1 + random.random() * 0.3)
             sz = 0.3 + random.random() * 1.5 * brightness
+            stars.append((px, py, sz, r_c, g_c, b_c, alpha))
 
-            c.setFillColor(Color(r_c, g_c, b_c, alpha=alpha))
-            c.circle(px, py, sz, fill=1, stroke=0)
+    xs, ys, sizes, *rgb, alphas = zip(*stars)
+    dots.fill(c, xs, ys, sizes, rgb=np.transpose(rgb), alpha=alphas)
 
     # Dust lanes (dark areas between arms)
+    lanes = []
     for arm in range(n_arms):
         base_angle = arm * 2 * math.pi / n_arms + math.pi / n_arms
-        for _ in range(500):
+        for _ in range(quality.count(500)):
             t = random.random() * 10
             r = a_spiral * math.exp(b_spiral * t)
             if r > 280:
@@ -716,9 +712,9 @@ def gen_038():
             angle = base_angle + t
             x = r * math.cos(angle)
             y = r * math.sin(angle) * 0.5
-            px, py = cx + x, cy + y
-            c.setFillColor(Color(0.02, 0.01, 0.03, alpha=0.15))
-            c.circle(px, py, 3 + random.random() * 4, fill=1, stroke=0)
+            lanes.append((cx + x, cy + y, 3 + random.random() * 4))
+    xs, ys, sizes = zip(*lanes)
+    dots.fill(c, xs, ys, sizes, rgb=(0.02, 0.01, 0.03), alpha=0.15)
 
     # Bright H-II regions (star forming)
     for arm in range(n_arms):
@@ -751,8 +747,9 @@ def gen_038():
 # 039 — KOCH SNOWFLAKE (Arctic Blue / Frost White)
 # Infinite perimeter, finite area
 # ═══════════════════════════════════════════════════════════
+@poster(39, 'koch-snowflake', tags=('fractal',))
 def gen_039():
-    c = canvas.Canvas(f'{OUT}/039-koch-snowflake.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(39), pagesize=A3)
     bg(c, Color(0.02, 0.03, 0.07))
     cx, cy = W/2, H/2 + 50
 
@@ -824,8 +821,9 @@ def gen_039():
 # 040 — ELECTRIC CIRCUIT (Copper traces / PCB Green)
 # Circuit board geometry
 # ═══════════════════════════════════════════════════════════
+@poster(40, 'electric-circuit', tags=('physics',))
 def gen_040():
-    c = canvas.Canvas(f'{OUT}/040-electric-circuit.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(40), pagesize=A3)
     bg(c, Color(0.01, 0.04, 0.02))
     cx, cy = W/2, H/2 + 50
 
@@ -938,8 +936,9 @@ def gen_040():
 # 041 — INTERFERENCE MOIRÉ (Monochrome Silver/White)
 # Overlapping grids create emergent patterns
 # ═══════════════════════════════════════════════════════════
+@poster(41, 'moire-interference', tags=('wave', 'circles'))
 def gen_041():
-    c = canvas.Canvas(f'{OUT}/041-moire-interference.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(41), pagesize=A3)
     bg(c, Color(0.03, 0.03, 0.04))
     cx, cy = W/2, H/2 + 50
 
@@ -982,9 +981,7 @@ def gen_041():
         c.line(x1, y1, x2, y2)
 
     # Center highlight
-    for rr in range(40, 0, -1):
-        c.setFillColor(Color(0.9, 0.9, 1, alpha=0.015 * (1 - rr/40)))
-        c.circle(cx, cy, rr, fill=1, stroke=0)
+    shading.glow(c, cx, cy, 40, Color(0.9, 0.9, 1, alpha=0.015))
 
     scatter_stars(c, 100, (0.8, 0.8, 0.9), cx, cy, 0)
 
@@ -999,8 +996,9 @@ def gen_041():
 # 042 — NAUTILUS SHELL (Pearl / Warm Cream / Ocean Blue)
 # Golden ratio in nature — chamber proportions
 # ═══════════════════════════════════════════════════════════
+@poster(42, 'nautilus-shell', tags=('sacred', 'spiral'))
 def gen_042():
-    c = canvas.Canvas(f'{OUT}/042-nautilus-shell.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(42), pagesize=A3)
     bg(c, Color(0.03, 0.03, 0.05))
     cx, cy = W/2 + 50, H/2 + 50
 
@@ -1099,8 +1097,9 @@ def gen_042():
 # 043 — SACRED LOTUS (Deep Magenta / Spiritual Gold)
 # Layered petals with mathematical precision
 # ═══════════════════════════════════════════════════════════
+@poster(43, 'sacred-lotus', tags=('sacred', 'petals'))
 def gen_043():
-    c = canvas.Canvas(f'{OUT}/043-sacred-lotus.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(43), pagesize=A3)
     bg(c, Color(0.04, 0.01, 0.03))
     cx, cy = W/2, H/2 + 50
 
@@ -1171,10 +1170,7 @@ def gen_043():
             c.circle(tx, ty, 1.5, fill=1, stroke=0)
 
     # Center: golden seed pod
-    for rr in range(35, 0, -1):
-        t = rr / 35
-        c.setFillColor(Color(0.85, 0.7, 0.15, alpha=0.03 * (1 - t)))
-        c.circle(cx, cy, rr, fill=1, stroke=0)
+    shading.glow(c, cx, cy, 35, Color(0.85, 0.7, 0.15, alpha=0.03))
 
     # Seed dots in Fibonacci pattern
     golden_angle = math.pi * (3 - math.sqrt(5))  # ~137.5 degrees
@@ -1206,8 +1202,9 @@ def gen_043():
 # 044 — ROSSLER ATTRACTOR (Deep Jade / Turquoise)
 # Another strange attractor — simpler chaos
 # ═══════════════════════════════════════════════════════════
+@poster(44, 'rossler-attractor', tags=('attractor', 'ode', 'chaos'))
 def gen_044():
-    c = canvas.Canvas(f'{OUT}/044-rossler-attractor.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(44), pagesize=A3)
     bg(c, Color(0.01, 0.04, 0.04))
     cx, cy = W/2, H/2 + 50
 
@@ -1220,24 +1217,11 @@ def gen_044():
 
     # Rössler attractor: dx/dt = -y-z, dy/dt = x+ay, dz/dt = b+z(x-c)
     a_r, b_r, c_r = 0.2, 0.2, 5.7
-    dt = 0.01
-    x, y, z = 1.0, 1.0, 1.0
-    points = []
-
-    for _ in range(40000):
-        dx = -y - z
-        dy = x + a_r * y
-        dz = b_r + z * (x - c_r)
-        x += dx * dt
-        y += dy * dt
-        z += dz * dt
-        points.append((x, y, z))
+    traj = trajectory.rossler(quality.count(40000), a_r, b_r, c_r, dt=0.01, start=(1.0, 1.0, 1.0))
 
     # Project x-y plane
-    xs = [p[0] for p in points]
-    ys = [p[1] for p in points]
-    x_min, x_max = min(xs), max(xs)
-    y_min, y_max = min(ys), max(ys)
+    x_min, x_max = traj.bounds(0)
+    y_min, y_max = traj.bounds(1)
     x_range = x_max - x_min
     y_range = y_max - y_min
 
@@ -1245,23 +1229,12 @@ def gen_044():
     ox = cx - (x_max + x_min) / 2 * scale
     oy = cy - (y_max + y_min) / 2 * scale
 
-    for i in range(len(points) - 1):
-        px1 = ox + points[i][0] * scale
-        py1 = oy + points[i][1] * scale
-        px2 = ox + points[i+1][0] * scale
-        py2 = oy + points[i+1][1] * scale
-
-        z_val = points[i][2]
-        z_min = min(p[2] for p in points)
-        z_max = max(p[2] for p in points)
-        z_norm = (z_val - z_min) / (z_max - z_min)
-
-        col_idx = int(z_norm * 3.99)
-        col = jades[col_idx]
-        alpha = 0.05 + 0.25 * (1 - z_norm * 0.5)
-        c.setStrokeColor(Color(col.red, col.green, col.blue, alpha=alpha))
-        c.setLineWidth(0.3 + 0.5 * (1 - z_norm))
-        c.line(px1, py1, px2, py2)
+    # Colour, alpha and width all follow height
+    z_norm = traj.depth(2)
+    palette = np.array([(col.red, col.green, col.blue) for col in jades])
+    polyline.stroke(c, ox + traj.x * scale, oy + traj.y * scale,
+                    rgb=palette[(z_norm * 3.99).astype(int)],
+                    alpha=0.05 + 0.25 * (1 - z_norm * 0.5), width=0.3 + 0.5 * (1 - z_norm))
 
     scatter_stars(c, 200, (0.2, 0.8, 0.7), cx, cy, 0)
 
@@ -1276,8 +1249,9 @@ def gen_044():
 # 045 — TREE OF LIFE (Kabbalistic) (Royal Purple / Gold / White)
 # Sephiroth and paths of the Kabbalah
 # ═══════════════════════════════════════════════════════════
+@poster(45, 'tree-of-life', tags=('sacred', 'graph'))
 def gen_045():
-    c = canvas.Canvas(f'{OUT}/045-tree-of-life.pdf', pagesize=A3)
+    c = gstate.canvas(poster_path(45), pagesize=A3)
     bg(c, Color(0.03, 0.02, 0.05))
     cx, cy = W/2, H/2 + 20
 
@@ -1344,10 +1318,7 @@ def gen_045():
         node_r = 28
 
         # Outer glow
-        for rr in range(int(node_r * 2.5), 0, -2):
-            alpha = 0.01 * (1 - rr / (node_r * 2.5))
-            c.setFillColor(Color(col.red, col.green, col.blue, alpha=alpha))
-            c.circle(sx, sy, rr, fill=1, stroke=0)
+        shading.glow(c, sx, sy, node_r * 2.5, Color(col.red, col.green, col.blue, alpha=0.01), step=2)
 
         # Circle
         c.setStrokeColor(Color(col.red, col.green, col.blue, alpha=col.alpha))
@@ -1406,19 +1377,6 @@ def gen_045():
 # ═══════════════════════════════════════════════════════════
 if __name__ == '__main__':
     print("Generating GEOMETRIA SACRED PATTERNS 031–045...")
-    gen_031()
-    gen_032()
-    gen_033()
-    gen_034()
-    gen_035()
-    gen_036()
-    gen_037()
-    gen_038()
-    gen_039()
-    gen_040()
-    gen_041()
-    gen_042()
-    gen_043()
-    gen_044()
-    gen_045()
+    for item in items(kind='poster', series='031-045'):
+        item.func()
     print("\nAll 15 PDFs (031–045) generated!")
@@ -3,13 +3,15 @@
 
 import math
 import random
-import os
+import numpy as np
 from reportlab.lib.pagesizes import A3
 from reportlab.lib.colors import Color
-from reportlab.pdfgen import canvas
+
+from geometria import (bessel, contour, density, dots, gstate, polyline, quality, radial, raster,
+                       shading, trajectory)
+from geometria.registry import items, poster, poster_path
 
 W, H = A3
-OUT = os.path.dirname(os.path.abspath(__file__))
 
 def bg(c, color):
     c.setFillColor(color)
@@ -27,11 +29,15 @@ def title_block(c, title, subtitle, edition, color_main, color_sub, color_ed):
     c.drawCentredString(W/2, 52, edition)
 
 def scatter_stars(c, count, color, cx, cy, min_dist=0):
+    stars = []
     for _ in range(count):
         px, py = random.random() * W, random.random() * H
         if math.hypot(px - cx, py - cy) > min_dist:
-            c.setFillColor(Color(color[0], color[1], color[2], alpha=random.random()*0.25+0.05))
-            c.circle(px, py, random.random()*1.5+0.3, fill=1, stroke=0)
+            a = random.random()*0.25+0.05   # drawn before the size, as always
+            stars.append((px, py, random.random()*1.5+0.3, a))
+    if stars:
+        xs, ys, sizes, alphas = zip(*stars)
+        dots.fill(c, xs, ys, sizes, rgb=color[:3], alpha=alphas)
 
 def draw_polygon(c, cx, cy, r, n, rotation=0):
     pts = []
@@ -50,8 +56,9 @@ def draw_polygon(c, cx, cy, r, n, rotation=0):
 # 046 — BLACK HOLE (Vantablack / Accretion Orange-Red)
 # Gravitational lensing and accretion disk
 # ═══════════════════════════════════════════════════════════
+@poster(46, 'black-hole', tags=('cosmic', 'physics', 'glow'))
 def gen_046():
-    cv = canvas.Canvas(f'{OUT}/046-black-hole.pdf', pagesize=A3)
+    cv = gstate.canvas(poster_path(46), pagesize=A3)
     bg(cv, Color(0.005, 0.005, 0.01))
     cx, cy = W/2, H/2 + 50
 
@@ -62,10 +69,7 @@ def gen_046():
     cv.circle(cx, cy, 50, fill=1, stroke=0)
 
     # Photon sphere glow
-    for rr in range(70, 50, -1):
-        t = (rr - 50) / 20
-        cv.setFillColor(Color(1, 0.6, 0.1, alpha=0.04 * (1 - t)))
-        cv.circle(cx, cy, rr, fill=1, stroke=0)
+    shading.glow(cv, cx, cy, 70, Color(1, 0.6, 0.1, alpha=0.04), inner=50)
 
     # Accretion disk — tilted ellipse with Doppler shift
     disk_a = 280  # semi-major
@@ -164,15 +168,16 @@ def gen_046():
 # 047 — DRAGON CURVE (Blood Red / Obsidian)
 # Space-filling fractal from simple folding rules
 # ═══════════════════════════════════════════════════════════
+@poster(47, 'dragon-curve', tags=('fractal', 'curve'))
 def gen_047():
-    cv = canvas.Canvas(f'{OUT}/047-dragon-curve.pdf', pagesize=A3)
+    cv = gstate.canvas(poster_path(47), pagesize=A3)
     bg(cv, Color(0.04, 0.01, 0.01))
     cx, cy = W/2, H/2 + 50
 
     # Generate dragon curve via L-system
     # Axiom: F, Rules: F -> F+G, G -> F-G
     # + = turn left 90, - = turn right 90
-    iterations = 16
+    iterations = quality.depth(16, 2)
     sequence = [1]  # 1 = forward, True = left turn, False = right turn
     turns = []
     for _ in range(iterations):
@@ -214,17 +219,13 @@ def gen_047():
                cy + (p[1] - (min_y+max_y)/2) * scale) for p in points]
 
     # Draw
-    total = len(points)
-    for i in range(total - 1):
-        t = i / total
-        # Gradient: deep red → bright crimson → orange at tips
-        r_c = 0.5 + t * 0.5
-        g_c = 0.05 + t * 0.25
-        b_c = 0.02 + t * 0.08
-        alpha = 0.2 + 0.4 * (0.5 + 0.5 * math.sin(t * math.pi * 8))
-        cv.setStrokeColor(Color(min(1, r_c), g_c, b_c, alpha=alpha))
-        cv.setLineWidth(0.4 + 0.3 * (1 - t))
-        cv.line(points[i][0], points[i][1], points[i+1][0], points[i+1][1])
+    pts = np.array(points)
+    t = np.arange(len(pts)) / len(pts)
+    # Gradient: deep red → bright crimson → orange at tips
+    rgb = np.stack([np.minimum(1, 0.5 + t * 0.5), 0.05 + t * 0.25, 0.02 + t * 0.08], axis=-1)
+    polyline.stroke(cv, pts[:, 0], pts[:, 1], rgb=rgb,
+                    alpha=0.2 + 0.4 * (0.5 + 0.5 * np.sin(t * math.pi * 8)),
+                    width=0.4 + 0.3 * (1 - t))
 
     scatter_stars(cv, 150, (0.8, 0.2, 0.15), cx, cy, 0)
 
@@ -239,8 +240,9 @@ def gen_047():
 # 048 — HILBERT CURVE (Synth Wave Cyan / Magenta gradient)
 # Space-filling continuous fractal
 # ═══════════════════════════════════════════════════════════
+@poster(48, 'hilbert-curve', tags=('fractal', 'curve'))
 def gen_048():
-    cv = canvas.Canvas(f'{OUT}/048-hilbert-curve.pdf', pagesize=A3)
+    cv = gstate.canvas(poster_path(48), pagesize=A3)
     bg(cv, Color(0.02, 0.01, 0.04))
     cx, cy = W/2, H/2 + 50
 
@@ -285,23 +287,14 @@ def gen_048():
     ox = cx - n * scale / 2
     oy = cy - n * scale / 2
 
-    total = len(points)
-    for i in range(total - 1):
-        t = i / total
-        # Synthwave gradient: cyan → magenta → back
-        r_c = 0.2 + 0.8 * abs(math.sin(t * math.pi))
-        g_c = 0.1 + 0.3 * (1 - abs(math.sin(t * math.pi)))
-        b_c = 0.5 + 0.5 * abs(math.cos(t * math.pi))
-        alpha = 0.3 + 0.3 * (0.5 + 0.5 * math.sin(t * 20))
-
-        px1 = ox + points[i][0] * scale
-        py1 = oy + points[i][1] * scale
-        px2 = ox + points[i+1][0] * scale
-        py2 = oy + points[i+1][1] * scale
-
-        cv.setStrokeColor(Color(r_c, g_c, b_c, alpha=alpha))
-        cv.setLineWidth(0.8)
-        cv.line(px1, py1, px2, py2)
+    pts = np.array(points)
+    t = np.arange(len(pts)) / len(pts)
+    # Synthwave gradient: cyan → magenta → back
+    rgb = np.stack([0.2 + 0.8 * np.abs(np.sin(t * math.pi)),
+                    0.1 + 0.3 * (1 - np.abs(np.sin(t * math.pi))),
+                    0.5 + 0.5 * np.abs(np.cos(t * math.pi))], axis=-1)
+    polyline.stroke(cv, ox + pts[:, 0] * scale, oy + pts[:, 1] * scale, rgb=rgb,
+                    alpha=0.3 + 0.3 * (0.5 + 0.5 * np.sin(t * 20)), width=0.8)
 
     scatter_stars(cv, 100, (0.5, 0.3, 0.8), cx, cy, 0)
 
@@ -316,8 +309,9 @@ def gen_048():
 # 049 — APOLLONIAN GASKET (Pearl White / Champagne)
 # Circle packing — infinite nested tangent circles
 # ═══════════════════════════════════════════════════════════
+@poster(49, 'apollonian-gasket', tags=('fractal', 'circles'))
 def gen_049():
-    cv = canvas.Canvas(f'{OUT}/049-apollonian-gasket.pdf', pagesize=A3)
+    cv = gstate.canvas(poster_path(49), pagesize=A3)
     bg(cv, Color(0.03, 0.03, 0.04))
     cx, cy = W/2, H/2 + 50
 
@@ -438,8 +432,9 @@ def gen_049():
 # 050 — SOUND WAVEFORM (Warm Vinyl / Analog)
 # Fourier harmonics composing a complex wave
 # ═══════════════════════════════════════════════════════════
+@poster(50, 'sound-waveform', tags=('wave',))
 def gen_050():
-    cv = canvas.Canvas(f'{OUT}/050-sound-waveform.pdf', pagesize=A3)
+    cv = gstate.canvas(poster_path(50), pagesize=A3)
     bg(cv, Color(0.04, 0.03, 0.02))
     cx, cy = W/2, H/2 + 50
 
@@ -542,8 +537,9 @@ def gen_050():
 # 051 — FERROFLUID (Liquid Metal / Magnetic Chrome)
 # Spiky magnetic fluid sculpture
 # ═══════════════════════════════════════════════════════════
+@poster(51, 'ferrofluid', tags=('physics',))
 def gen_051():
-    cv = canvas.Canvas(f'{OUT}/051-ferrofluid.pdf', pagesize=A3)
+    cv = gstate.canvas(poster_path(51), pagesize=A3)
     bg(cv, Color(0.02, 0.02, 0.03))
     cx, cy = W/2, H/2 + 50
 
@@ -652,8 +648,9 @@ def gen_051():
 # 052 — QUANTUM ORBITALS (Atomic Blue / Probability Cloud)
 # Hydrogen electron probability densities
 # ═══════════════════════════════════════════════════════════
+@poster(52, 'quantum-orbitals', tags=('physics', 'particles'))
 def gen_052():
-    cv = canvas.Canvas(f'{OUT}/052-quantum-orbitals.pdf', pagesize=A3)
+    cv = gstate.canvas(poster_path(52), pagesize=A3)
     bg(cv, Color(0.01, 0.02, 0.04))
     cx, cy = W/2, H/2 + 50
 
@@ -678,7 +675,8 @@ def gen_052():
         R_vis = 120
 
         # Generate probability cloud with Monte Carlo sampling
-        n_points = 3000
+        n_points = quality.count(3000)
+        cloud = []
         for _ in range(n_points):
             # Spherical coordinates
             r = random.random() * R_vis
@@ -708,12 +706,12 @@ def gen_052():
             x = r * math.sin(theta) * math.cos(phi_a)
             y = r * math.cos(theta)
 
-            px = ocx + x
-            py = ocy + y
-            col = quantums[l % len(quantums)]
-            alpha = min(0.5, prob * 2)
-            cv.setFillColor(Color(col.red, col.green, col.blue, alpha=alpha))
-            cv.circle(px, py, 0.8 + prob * 2, fill=1, stroke=0)
+            cloud.append((ocx + x, ocy + y, 0.8 + prob * 2, min(0.5, prob * 2)))
+
+        col = quantums[l % len(quantums)]
+        if cloud:
+            xs, ys, sizes, alphas = zip(*cloud)
+            dots.fill(cv, xs, ys, sizes, rgb=(col.red, col.green, col.blue), alpha=alphas)
 
         # Nucleus
         cv.setFillColor(Color(1, 0.9, 0.5, alpha=0.8))
@@ -752,8 +750,9 @@ def gen_052():
 # 053 — TOPOGRAPHIC MAP (Earth Tones / Contour Lines)
 # Elevation contours of an alien landscape
 # ═══════════════════════════════════════════════════════════
+@poster(53, 'topographic-map', tags=('contour', 'field'))
 def gen_053():
-    cv = canvas.Canvas(f'{OUT}/053-topographic-map.pdf', pagesize=A3)
+    cv = gstate.canvas(poster_path(53), pagesize=A3)
     bg(cv, Color(0.03, 0.04, 0.03))
     cx, cy = W/2, H/2 + 50
 
@@ -773,15 +772,15 @@ def gen_053():
     def terrain_height(x, y):
         h = 0
         for px, py, amp, freq in peaks:
-            d = math.hypot(x - px, y - py)
-            h += amp * math.exp(-d * freq)
+            d = np.hypot(x - px, y - py)
+            h = h + amp * np.exp(-d * freq)
         # Add noise
-        h += 10 * math.sin(x * 0.03) * math.cos(y * 0.025)
-        h += 5 * math.sin(x * 0.07 + y * 0.05)
+        h = h + 10 * np.sin(x * 0.03) * np.cos(y * 0.025)
+        h = h + 5 * np.sin(x * 0.07 + y * 0.05)
         return h
 
-    # Trace contour lines using marching squares (simplified)
-    res = 200
+    # Trace contour lines using marching squares
+    res = quality.grid(200)
     grid_w = W - 80
     grid_h = H - 220
     ox_g = 40
@@ -789,14 +788,12 @@ def gen_053():
     cell_w = grid_w / res
     cell_h = grid_h / res
 
-    # Compute height grid
-    heights = [[terrain_height(ox_g + x * cell_w, oy_g + y * cell_h) for x in range(res+1)] for y in range(res+1)]
-
-    # Find min/max
-    all_h = [h for row in heights for h in row]
-    h_min, h_max = min(all_h), max(all_h)
+    # Compute height grid, indexed [y][x]
+    gy, gx = np.indices((res + 1, res + 1))
+    heights = terrain_height(ox_g + gx * cell_w, oy_g + gy * cell_h)
+    h_min, h_max = float(heights.min()), float(heights.max())
 
-    # Draw contour lines at regular intervals
+    # Draw contour lines at regular intervals, one path per level
     n_contours = 20
     for ci in range(n_contours):
         level = h_min + (h_max - h_min) * (ci + 0.5) / n_contours
@@ -805,41 +802,16 @@ def gen_053():
         cv.setStrokeColor(Color(col.red, col.green, col.blue, alpha=col.alpha * (0.5 + t * 0.5)))
         cv.setLineWidth(0.3 + t * 0.5)
 
-        # Simple contour tracing: check each cell for level crossing
-        for y in range(res):
-            for x in range(res):
-                h00 = heights[y][x]
-                h10 = heights[y][x+1]
-                h01 = heights[y+1][x]
-                h11 = heights[y+1][x+1]
-
-                above = [(h00 >= level), (h10 >= level), (h01 >= level), (h11 >= level)]
-                n_above = sum(above)
-
-                if n_above == 0 or n_above == 4:
-                    continue
-
-                # Find interpolated crossing points on edges
-                crossings = []
-                # Top edge
-                if above[0] != above[1]:
-                    t_val = (level - h00) / (h10 - h00) if h10 != h00 else 0.5
-                    crossings.append((ox_g + (x + t_val) * cell_w, oy_g + y * cell_h))
-                # Bottom edge
-                if above[2] != above[3]:
-                    t_val = (level - h01) / (h11 - h01) if h11 != h01 else 0.5
-                    crossings.append((ox_g + (x + t_val) * cell_w, oy_g + (y+1) * cell_h))
-                # Left edge
-                if above[0] != above[2]:
-                    t_val = (level - h00) / (h01 - h00) if h01 != h00 else 0.5
-                    crossings.append((ox_g + x * cell_w, oy_g + (y + t_val) * cell_h))
-                # Right edge
-                if above[1] != above[3]:
-                    t_val = (level - h10) / (h11 - h10) if h11 != h10 else 0.5
-                    crossings.append((ox_g + (x+1) * cell_w, oy_g + (y + t_val) * cell_h))
-
-                if len(crossings) >= 2:
-                    cv.line(crossings[0][0], crossings[0][1], crossings[1][0], crossings[1][1])
+        path = cv.beginPath()
+        for line in contour.isolines(heights, level):
+            closed = contour.is_closed(line)
+            pts = (line[:-1] if closed else line).tolist()
+            path.moveTo(ox_g + pts[0][0] * cell_w, oy_g + pts[0][1] * cell_h)
+            for x, y in pts[1:]:
+                path.lineTo(ox_g + x * cell_w, oy_g + y * cell_h)
+            if closed:
+                path.close()
+        cv.drawPath(path, stroke=1, fill=0)
 
     # Peak markers
     for px, py, amp, _ in peaks:
@@ -871,66 +843,44 @@ def gen_053():
 # 054 — DIFFRACTION PATTERN (Laser Red / Deep Black)
 # Airy disk — light through a circular aperture
 # ═══════════════════════════════════════════════════════════
+@poster(54, 'diffraction-pattern', tags=('wave', 'physics', 'field'))
 def gen_054():
-    cv = canvas.Canvas(f'{OUT}/054-diffraction-pattern.pdf', pagesize=A3)
-    bg(cv, Color(0.01, 0.01, 0.01))
+    cv = gstate.canvas(poster_path(54), pagesize=A3)
+    paper = Color(0.01, 0.01, 0.01)
+    bg(cv, paper)
     cx, cy = W/2, H/2 + 50
 
     # Airy pattern: I(r) = [2*J1(x)/x]^2 where x = pi*r*D/(lambda*L)
-    # Approximate J1 with series
-    def bessel_j1(x):
-        if abs(x) < 1e-10:
-            return 0.5
-        s = 0
-        for k in range(20):
-            sign = (-1)**k
-            s += sign * (x/2)**(2*k+1) / (math.factorial(k) * math.factorial(k+1))
-        return s
-
     R = 300
-    res = 300
-
-    for ix in range(res):
-        for iy in range(res):
-            x = (ix / res - 0.5) * 2
-            y = (iy / res - 0.5) * 2
-            r = math.sqrt(x*x + y*y)
-
-            if r > 0.98:
-                continue
-
-            # Scale r to get nice ring pattern
-            x_bessel = r * 25
-
-            if abs(x_bessel) < 1e-10:
-                intensity = 1.0
-            else:
-                j1 = bessel_j1(x_bessel)
-                airy = (2 * j1 / x_bessel) ** 2
-                intensity = airy
-
-            if intensity < 0.005:
-                continue
-
-            px = cx + x * R
-            py = cy + y * R
-
-            # Color: monochromatic red laser
-            alpha = min(0.8, intensity * 1.5)
-            sz = 0.8 + intensity * 2.5
-
-            # Central disk is bright white-red, rings are dimmer red
-            if r < 0.15:
-                r_c = min(1, 0.8 + intensity * 0.2)
-                g_c = min(1, 0.3 + intensity * 0.7)
-                b_c = min(1, 0.2 + intensity * 0.5)
-            else:
-                r_c = min(1, 0.9 * intensity + 0.1)
-                g_c = min(0.3, 0.15 * intensity)
-                b_c = min(0.1, 0.05 * intensity)
-
-            cv.setFillColor(Color(r_c, g_c, b_c, alpha=alpha))
-            cv.circle(px, py, sz, fill=1, stroke=0)
+    res = quality.grid(300)
+    k = 300 / res
+
+    # Intensity depends only on r (scaled by 25 to get a nice ring pattern)
+    def airy_color(r, intensity):
+        # Central disk is bright white-red, rings are dimmer red
+        disk = np.stack([np.minimum(1, 0.8 + intensity * 0.2),
+                         np.minimum(1, 0.3 + intensity * 0.7),
+                         np.minimum(1, 0.2 + intensity * 0.5)], axis=-1)
+        rings = np.stack([np.minimum(1, 0.9 * intensity + 0.1),
+                          np.minimum(0.3, 0.15 * intensity),
+                          np.minimum(0.1, 0.05 * intensity)], axis=-1)
+        return np.where((r < 0.15)[:, None], disk, rings)
+
+    f = radial.field(res, profile=lambda r: bessel.airy(r * 25),
+                     color=airy_color,
+                     # Color: monochromatic red laser
+                     alpha=lambda r, intensity: np.minimum(0.8, intensity * 1.5),
+                     keep=lambda r, intensity: intensity >= 0.005)
+
+    dense = raster.layer(cv, 54, (cx - R - 10, cy - R - 10, cx + R + 10, cy + R + 10),
+                         background=paper)
+    for x, y, intensity, (r_c, g_c, b_c), alpha in zip(f.x, f.y, f.value, f.rgb, f.alpha):
+        px = cx + x * R
+        py = cy + y * R
+        sz = (0.8 + intensity * 2.5) * k
+        dense.setFillColor(Color(r_c, g_c, b_c, alpha=alpha))
+        dense.circle(px, py, sz, fill=1, stroke=0)
+    raster.flush(cv, dense)
 
     # Aperture ring
     cv.setStrokeColor(Color(0.5, 0.1, 0.1, alpha=0.1))
@@ -950,8 +900,9 @@ def gen_054():
 # 055 — GRAVITY WELL (Spacetime Blue / Grid Warp)
 # Rubber sheet analogy of curved spacetime
 # ═══════════════════════════════════════════════════════════
+@poster(55, 'gravity-well', tags=('physics', 'grid'))
 def gen_055():
-    cv = canvas.Canvas(f'{OUT}/055-gravity-well.pdf', pagesize=A3)
+    cv = gstate.canvas(poster_path(55), pagesize=A3)
     bg(cv, Color(0.01, 0.01, 0.03))
     cx, cy = W/2, H/2 + 30
 
@@ -975,59 +926,46 @@ def gen_055():
         # Convert z-displacement to visual y-displacement (perspective)
         return x, y + dz * perspective_tilt
 
+    def grid_line(points):
+        """Stroke one warped grid line through (x, y) grid points."""
+        xs, ys, rgb, alphas = [], [], [], []
+        for x, y in points:
+            wx, wy = warp(x, y)
+            dist = min(math.hypot(x - m[0], y - m[1]) for m in masses)
+            alphas.append(max(0.04, min(0.35, 0.2 * (dist / 100))))
+
+            # Color shifts near mass (bluer = more warped)
+            warp_amount = abs(wy - y) / 80
+            rgb.append((0.15 + 0.15 * (1 - min(1, warp_amount)),
+                        0.25 + 0.2 * (1 - min(1, warp_amount)),
+                        0.5 + 0.4 * min(1, warp_amount)))
+            xs.append(wx)
+            ys.append(wy)
+        # each segment takes the colour of the point it ends at
+        polyline.stroke(cv, xs, ys, rgb=rgb[1:], alpha=alphas[1:], width=0.4, join=None)
+
+    cv.saveState()
+    cv.setLineJoin(1)  # round joins for every grid line, set once
+
     # Horizontal grid lines
-    cv.setLineWidth(0.4)
     for i in range(grid_lines + 1):
         t = i / grid_lines
         y_base = cy - grid_extent + t * 2 * grid_extent
-
-        prev = None
-        for s in range(200):
-            x = cx - grid_extent + s / 200 * 2 * grid_extent
-            wx, wy = warp(x, y_base)
-            dist = min(math.hypot(x - m[0], y_base - m[1]) for m in masses)
-            alpha = max(0.04, min(0.35, 0.2 * (dist / 100)))
-
-            # Color shifts near mass (bluer = more warped)
-            warp_amount = abs(wy - y_base) / 80
-            r_c = 0.15 + 0.15 * (1 - min(1, warp_amount))
-            g_c = 0.25 + 0.2 * (1 - min(1, warp_amount))
-            b_c = 0.5 + 0.4 * min(1, warp_amount)
-
-            cv.setStrokeColor(Color(r_c, g_c, b_c, alpha=alpha))
-            if prev:
-                cv.line(prev[0], prev[1], wx, wy)
-            prev = (wx, wy)
+        grid_line([(cx - grid_extent + s / 200 * 2 * grid_extent, y_base) for s in range(200)])
 
     # Vertical grid lines
     for i in range(grid_lines + 1):
         t = i / grid_lines
         x_base = cx - grid_extent + t * 2 * grid_extent
-
-        prev = None
-        for s in range(200):
-            y = cy - grid_extent + s / 200 * 2 * grid_extent
-            wx, wy = warp(x_base, y)
-            dist = min(math.hypot(x_base - m[0], y - m[1]) for m in masses)
-            alpha = max(0.04, min(0.35, 0.2 * (dist / 100)))
-
-            warp_amount = abs(wy - y) / 80
-            r_c = 0.15 + 0.15 * (1 - min(1, warp_amount))
-            g_c = 0.25 + 0.2 * (1 - min(1, warp_amount))
-            b_c = 0.5 + 0.4 * min(1, warp_amount)
-
-            cv.setStrokeColor(Color(r_c, g_c, b_c, alpha=alpha))
-            if prev:
-                cv.line(prev[0], prev[1], wx, wy)
-            prev = (wx, wy)
+        grid_line([(x_base, cy - grid_extent + s / 200 * 2 * grid_extent) for s in range(200)])
+    cv.restoreState()
 
     # Mass markers
     for mx, my, m_str in masses:
         _, wmy = warp(mx, my)
         # Glow
-        for rr in range(int(m_str * 0.3), 0, -1):
-            cv.setFillColor(Color(0.3, 0.5, 1, alpha=0.02 * (1 - rr / (m_str * 0.3))))
-            cv.circle(mx, wmy, rr, fill=1, stroke=0)
+        shading.glow(cv, mx, wmy, m_str * 0.3, Color(0.3, 0.5, 1, alpha=0.02),
+                     outer=int(m_str * 0.3))
         cv.setFillColor(Color(0.6, 0.8, 1, alpha=0.8))
         sz = 3 + m_str * 0.03
         cv.circle(mx, wmy, sz, fill=1, stroke=0)
@@ -1045,8 +983,9 @@ def gen_055():
 # 056 — PHYLLOTAXIS (Sunflower Gold / Living Green)
 # Fibonacci spiral arrangement in nature
 # ═══════════════════════════════════════════════════════════
+@poster(56, 'phyllotaxis', tags=('sacred', 'spiral'))
 def gen_056():
-    cv = canvas.Canvas(f'{OUT}/056-phyllotaxis.pdf', pagesize=A3)
+    cv = gstate.canvas(poster_path(56), pagesize=A3)
     bg(cv, Color(0.02, 0.03, 0.02))
     cx, cy = W/2, H/2 + 50
 
@@ -1132,63 +1071,42 @@ def gen_056():
 # 057 — INTERFERENCE RINGS (Thin-Film Iridescent)
 # Newton's rings — rainbow thin-film interference
 # ═══════════════════════════════════════════════════════════
+@poster(57, 'interference-rings', tags=('wave', 'physics', 'field'))
 def gen_057():
-    cv = canvas.Canvas(f'{OUT}/057-interference-rings.pdf', pagesize=A3)
-    bg(cv, Color(0.02, 0.02, 0.03))
+    cv = gstate.canvas(poster_path(57), pagesize=A3)
+    paper = Color(0.02, 0.02, 0.03)
+    bg(cv, paper)
     cx, cy = W/2, H/2 + 50
 
     R = 300
-    res = 300
-
-    for ix in range(res):
-        for iy in range(res):
-            x = (ix / res - 0.5) * 2
-            y = (iy / res - 0.5) * 2
-            r = math.sqrt(x*x + y*y)
-            if r > 0.98:
-                continue
-
-            px = cx + x * R
-            py = cy + y * R
-
-            # Thin-film interference: path difference depends on r^2
-            # This creates rainbow-colored concentric rings
-            phase = r * r * 40  # Adjust for ring density
-
-            # Convert phase to RGB (rainbow)
-            hue = (phase % 1.0)
-            # HSV to RGB (simplified)
-            h6 = hue * 6
-            hi = int(h6) % 6
-            f = h6 - int(h6)
-            s, v = 0.8, 0.9
-            p_c = v * (1 - s)
-            q = v * (1 - f * s)
-            t_c = v * (1 - (1 - f) * s)
-
-            if hi == 0: r_c, g_c, b_c = v, t_c, p_c
-            elif hi == 1: r_c, g_c, b_c = q, v, p_c
-            elif hi == 2: r_c, g_c, b_c = p_c, v, t_c
-            elif hi == 3: r_c, g_c, b_c = p_c, q, v
-            elif hi == 4: r_c, g_c, b_c = t_c, p_c, v
-            else: r_c, g_c, b_c = v, p_c, q
-
-            # Intensity modulation (fringes)
-            intensity = (0.5 + 0.5 * math.cos(phase * 2 * math.pi)) ** 2
-            # Fade toward edges
-            fade = 1.0 - r * 0.5
-            alpha = intensity * fade * 0.5
-
-            if alpha < 0.02:
-                continue
-
-            cv.setFillColor(Color(r_c, g_c, b_c, alpha=alpha))
-            cv.circle(px, py, 1.2, fill=1, stroke=0)
+    res = quality.grid(300)
+    k = 300 / res
+
+    # Thin-film interference: path difference depends on r^2
+    # This creates rainbow-colored concentric rings
+    def phase(r):
+        return r * r * 40  # Adjust for ring density
+
+    def fringe_alpha(r, ph):
+        # Intensity modulation (fringes), fading toward edges
+        intensity = (0.5 + 0.5 * np.cos(ph * 2 * math.pi)) ** 2
+        fade = 1.0 - r * 0.5
+        return intensity * fade * 0.5
+
+    f = radial.field(res, profile=phase,
+                     color=lambda r, ph: radial.hsv_to_rgb(ph % 1.0, 0.8, 0.9),
+                     alpha=fringe_alpha,
+                     keep=lambda r, ph: fringe_alpha(r, ph) >= 0.02)
+
+    dense = raster.layer(cv, 57, (cx - R - 5, cy - R - 5, cx + R + 5, cy + R + 5),
+                         background=paper)
+    for x, y, (r_c, g_c, b_c), alpha in zip(f.x, f.y, f.rgb, f.alpha):
+        dense.setFillColor(Color(r_c, g_c, b_c, alpha=alpha))
+        dense.circle(cx + x * R, cy + y * R, 1.2 * k, fill=1, stroke=0)
+    raster.flush(cv, dense)
 
     # Center bright spot
-    for rr in range(20, 0, -1):
-        cv.setFillColor(Color(1, 1, 1, alpha=0.03 * (1 - rr/20)))
-        cv.circle(cx, cy, rr, fill=1, stroke=0)
+    shading.glow(cv, cx, cy, 20, Color(1, 1, 1, alpha=0.03))
 
     scatter_stars(cv, 100, (0.7, 0.7, 0.8), cx, cy, R + 5)
 
@@ -1203,8 +1121,9 @@ def gen_057():
 # 058 — STRANGE LOOP (Escher-like Impossible / Warm Gray)
 # Penrose triangle and impossible geometry
 # ═══════════════════════════════════════════════════════════
+@poster(58, 'strange-loop', tags=('impossible', '3d'))
 def gen_058():
-    cv = canvas.Canvas(f'{OUT}/058-strange-loop.pdf', pagesize=A3)
+    cv = gstate.canvas(poster_path(58), pagesize=A3)
     bg(cv, Color(0.04, 0.04, 0.05))
     cx, cy = W/2, H/2 + 50
 
@@ -1317,45 +1236,37 @@ def gen_058():
 # 059 — CLIFFORD ATTRACTOR (Neon Vapor / Retrowave)
 # Chaotic attractor from simple trig rules
 # ═══════════════════════════════════════════════════════════
+@poster(59, 'clifford-attractor', tags=('attractor', 'chaos', 'particles'))
 def gen_059():
-    cv = canvas.Canvas(f'{OUT}/059-clifford-attractor.pdf', pagesize=A3)
+    cv = gstate.canvas(poster_path(59), pagesize=A3)
     bg(cv, Color(0.02, 0.01, 0.04))
     cx, cy = W/2, H/2 + 50
 
     # Clifford attractor: x' = sin(a*y) + c*cos(a*x), y' = sin(b*x) + d*cos(b*y)
     a, b, cc, d = -1.4, 1.6, 1.0, 0.7
-    x, y = 0.1, 0.1
 
     # Collect points
-    points = []
-    for _ in range(200000):
-        nx = math.sin(a * y) + cc * math.cos(a * x)
-        ny = math.sin(b * x) + d * math.cos(b * y)
-        x, y = nx, ny
-        points.append((x, y))
+    traj = trajectory.clifford(quality.count(200000), a, b, cc, d, start=(0.1, 0.1))
 
     # Scale
-    xs = [p[0] for p in points]
-    ys = [p[1] for p in points]
-    x_min, x_max = min(xs), max(xs)
-    y_min, y_max = min(ys), max(ys)
+    x_min, x_max = traj.bounds(0)
+    y_min, y_max = traj.bounds(1)
     x_range = x_max - x_min
     y_range = y_max - y_min
     scale = min(550 / x_range, 700 / y_range) * 0.9
 
-    for i, (px, py) in enumerate(points):
-        sx = cx + (px - (x_min + x_max) / 2) * scale
-        sy = cy + (py - (y_min + y_max) / 2) * scale
-
-        # Color cycles through neon vapor palette
-        t = (i / len(points))
-        hue = (t * 3) % 1.0
-        r_c = 0.5 + 0.5 * math.sin(hue * 2 * math.pi)
-        g_c = 0.1 + 0.2 * math.sin(hue * 2 * math.pi + 2)
-        b_c = 0.5 + 0.5 * math.sin(hue * 2 * math.pi + 4)
+    screen_x = cx + (traj.x - (x_min + x_max) / 2) * scale
+    screen_y = cy + (traj.y - (y_min + y_max) / 2) * scale
 
-        cv.setFillColor(Color(min(1, r_c), max(0, g_c), min(1, b_c), alpha=0.04))
-        cv.circle(sx, sy, 0.6, fill=1, stroke=0)
+    # Bin the points into one density image instead of a circle per point,
+    # tone-mapped through a neon vapor gradient
+    pad = 2
+    hist = density.Histogram((cx - x_range * scale / 2 - pad, cy - y_range * scale / 2 - pad,
+                              cx + x_range * scale / 2 + pad, cy + y_range * scale / 2 + pad),
+                             dpi=quality.grid(200, minimum=72))
+    hist.add(screen_x, screen_y).splat(0.6)
+    vapor = density.gradient((0.25, 0.05, 0.45), (0.6, 0.15, 0.8), (0.95, 0.35, 0.85), (1.0, 0.85, 1.0))
+    density.draw(cv, hist.image(tone='log', vmax=hist.percentile(99.5), gamma=0.9, palette=vapor), hist)
 
     scatter_stars(cv, 80, (0.7, 0.3, 0.8), cx, cy, 0)
 
@@ -1370,8 +1281,9 @@ def gen_059():
 # 060 — COSMIC WEB (Dark Matter Filaments / Void Black)
 # Large-scale structure of the universe
 # ═══════════════════════════════════════════════════════════
+@poster(60, 'cosmic-web', tags=('cosmic', 'particles'))
 def gen_060():
-    cv = canvas.Canvas(f'{OUT}/060-cosmic-web.pdf', pagesize=A3)
+    cv = gstate.canvas(poster_path(60), pagesize=A3)
     bg(cv, Color(0.005, 0.005, 0.01))
     cx, cy = W/2, H/2 + 50
 
@@ -1426,10 +1338,8 @@ def gen_060():
     for x, y, mass in clusters:
         # Dark matter halo
         halo_r = 10 + mass * 30
-        for rr in range(int(halo_r), 0, -2):
-            alpha = 0.005 * (1 - rr / halo_r)
-            cv.setFillColor(Color(0.2, 0.25, 0.5, alpha=alpha))
-            cv.circle(x, y, rr, fill=1, stroke=0)
+        shading.glow(cv, x, y, halo_r, Color(0.2, 0.25, 0.5, alpha=0.005), step=2,
+                     outer=int(halo_r))
 
         # Galaxies within cluster
         n_gal = int(mass * 15) + 3
@@ -1465,19 +1375,6 @@ def gen_060():
 # ═══════════════════════════════════════════════════════════
 if __name__ == '__main__':
     print("Generating GEOMETRIA SACRED PATTERNS 046–060...")
-    gen_046()
-    gen_047()
-    gen_048()
-    gen_049()
-    gen_050()
-    gen_051()
-    gen_052()
-    gen_053()
-    gen_054()
-    gen_055()
-    gen_056()
-    gen_057()
-    gen_058()
-    gen_059()
-    gen_060()
+    for item in items(kind='poster', series='046-060'):
+        item.func()
     print("\nAll 15 PDFs (046–060) generated!")
@@ -2,14 +2,16 @@
 """GEOMETRIA SACRED PATTERNS — Animated GIF Series (Perfect Loops)"""
 
 import math
-import os
 import random
+import numpy as np
 from PIL import Image, ImageDraw, ImageFilter
 
-OUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'gif')
+from geometria import quality, shading, trajectory
+from geometria.registry import gif, gif_path, items
+
 SZ = 540  # square canvas
-FRAMES = 60
-DUR = 50  # ms per frame
+FRAMES = quality.frames(60)
+DUR = 3000 // FRAMES  # ms per frame: every loop lasts 3s
 
 
 def ease(t):
@@ -27,8 +29,11 @@ def blend_color(c1, c2, t):
 
 
 def make_gif(frames_list, name, duration=DUR):
+    size = quality.pixels(SZ)
+    if size != SZ:
+        frames_list = [f.resize((size, size), Image.LANCZOS) for f in frames_list]
     frames_list[0].save(
-        f'{OUT}/{name}.gif',
+        gif_path(name),
         save_all=True, append_images=frames_list[1:],
         duration=duration, loop=0, optimize=False, disposal=2
     )
@@ -38,6 +43,7 @@ def make_gif(frames_list, name, duration=DUR):
 # ═══════════════════════════════════════════════════════════
 # 01 — ROTATING FLOWER OF LIFE
 # ═══════════════════════════════════════════════════════════
+@gif(1, 'flower-of-life', tags=('sacred', 'circles'))
 def gif_01():
     frames = []
     r = 60
@@ -79,6 +85,7 @@ def gif_01():
 # ═══════════════════════════════════════════════════════════
 # 02 — BREATHING MANDALA
 # ═══════════════════════════════════════════════════════════
+@gif(2, 'breathing-mandala', tags=('sacred', 'petals'))
 def gif_02():
     frames = []
     for f in range(FRAMES):
@@ -117,9 +124,7 @@ def gif_02():
                 draw.line([(base_r_x, base_ry), (tip_x, tip_y)], fill=c, width=1)
 
         # Center glow
-        for rr in range(20, 0, -2):
-            v = int(200 * (1 - rr / 20))
-            draw.ellipse([cx-rr, cy-rr, cx+rr, cy+rr], fill=(v, int(v*0.5), v))
+        shading.glow_image(img, cx, cy, 20, (200, 100, 200), falloff=0, edge=(0, 0, 0), step=2)
         draw.ellipse([cx-3, cy-3, cx+3, cy+3], fill=(255, 200, 255))
 
         frames.append(img)
@@ -129,6 +134,7 @@ def gif_02():
 # ═══════════════════════════════════════════════════════════
 # 03 — SPIRAL VORTEX
 # ═══════════════════════════════════════════════════════════
+@gif(3, 'spiral-vortex', tags=('spiral', 'particles'))
 def gif_03():
     frames = []
     for f in range(FRAMES):
@@ -166,6 +172,7 @@ def gif_03():
 # ═══════════════════════════════════════════════════════════
 # 04 — PULSING METATRON'S CUBE
 # ═══════════════════════════════════════════════════════════
+@gif(4, 'metatrons-cube', tags=('sacred', 'graph'))
 def gif_04():
     frames = []
     r_base = 100
@@ -212,6 +219,7 @@ def gif_04():
 # ═══════════════════════════════════════════════════════════
 # 05 — ORBITING PARTICLES
 # ═══════════════════════════════════════════════════════════
+@gif(5, 'orbiting-particles', tags=('particles', 'cosmic'))
 def gif_05():
     random.seed(42)
     n_particles = 120
@@ -234,9 +242,7 @@ def gif_05():
         cx, cy = SZ // 2, SZ // 2
 
         # Center glow
-        for rr in range(30, 0, -2):
-            v = int(40 * (1 - rr / 30))
-            draw.ellipse([cx-rr, cy-rr, cx+rr, cy+rr], fill=(v, v, int(v*1.5)))
+        shading.glow_image(img, cx, cy, 30, (40, 40, 60), falloff=0, edge=(0, 0, 0), step=2)
         draw.ellipse([cx-3, cy-3, cx+3, cy+3], fill=(180, 180, 255))
 
         for orbit_r, speed, start_a, size, hue in particles:
@@ -265,6 +271,7 @@ def gif_05():
 # ═══════════════════════════════════════════════════════════
 # 06 — WAVE PROPAGATION
 # ═══════════════════════════════════════════════════════════
+@gif(6, 'wave-propagation', tags=('wave',))
 def gif_06():
     frames = []
     for f in range(FRAMES):
@@ -303,68 +310,53 @@ def gif_06():
 # ═══════════════════════════════════════════════════════════
 # 07 — LORENZ BUTTERFLY (rotating view)
 # ═══════════════════════════════════════════════════════════
+@gif(7, 'lorenz-butterfly', tags=('attractor', 'ode', 'chaos', '3d'))
 def gif_07():
     # Pre-compute Lorenz
-    sigma, rho, beta = 10.0, 28.0, 8.0/3.0
-    dt = 0.005
-    x, y, z = 0.1, 0.0, 0.0
-    points = []
-    for _ in range(15000):
-        dx = sigma * (y - x)
-        dy = x * (rho - z) - y
-        dz = x * y - beta * z
-        x += dx * dt; y += dy * dt; z += dz * dt
-        points.append((x, y, z))
+    traj = trajectory.lorenz(quality.count(15000), 10.0, 28.0, 8.0/3.0, dt=0.005, start=(0.1, 0.0, 0.0))
 
     # Normalize
-    xs = [p[0] for p in points]
-    ys = [p[1] for p in points]
-    zs = [p[2] for p in points]
-    cx_d = (min(xs)+max(xs))/2
-    cy_d = (min(ys)+max(ys))/2
-    cz_d = (min(zs)+max(zs))/2
+    px = traj.x[:-1] - traj.center(0)
+    py = traj.y[:-1] - traj.center(1)
+    pz = traj.z[:-1] - traj.center(2)
     sc = 8.0
 
+    # Trail colours brighten along the path; only the depth fade changes per frame
+    progress = np.arange(len(traj) - 1) / len(traj)
+    base = np.stack([np.minimum(255, (200 + 55 * progress).astype(int)),
+                     np.minimum(255, (80 + 100 * progress).astype(int)),
+                     (30 + 40 * (1 - progress)).astype(int)], axis=1)
+
     frames = []
     for f in range(FRAMES):
         t = loop_t(f, FRAMES)
         rot = t * 2 * math.pi
 
-        img = Image.new('RGB', (SZ, SZ), (12, 5, 2))
-        draw = ImageDraw.Draw(img)
+        # Rotate around Z
+        rx = px * math.cos(rot) - py * math.sin(rot)
+        ry = px * math.sin(rot) + py * math.cos(rot)
+        rz = pz
 
-        for i in range(len(points) - 1):
-            px, py, pz = points[i]
-            px -= cx_d; py -= cy_d; pz -= cz_d
-            # Rotate around Z
-            rx = px * math.cos(rot) - py * math.sin(rot)
-            ry = px * math.sin(rot) + py * math.cos(rot)
-            rz = pz
+        sx = SZ // 2 + rx * sc
+        sy = SZ // 2 - rz * sc + ry * sc * 0.3
 
-            sx = SZ // 2 + rx * sc
-            sy = SZ // 2 - rz * sc + ry * sc * 0.3
+        fade = np.clip((ry + 30) / 60, 0.2, 1.0)
+        rgb = (base * fade[:, None]).astype(np.uint8)
 
-            progress = i / len(points)
-            r_c = min(255, int(200 + 55 * progress))
-            g_c = min(255, int(80 + 100 * progress))
-            b_c = int(30 + 40 * (1 - progress))
+        # Later points overwrite earlier ones, as with draw.point in path order
+        inside = (0 <= sx) & (sx < SZ) & (0 <= sy) & (sy < SZ)
+        pixels = np.empty((SZ, SZ, 3), np.uint8)
+        pixels[:] = (12, 5, 2)
+        pixels[sy[inside].astype(int), sx[inside].astype(int)] = rgb[inside]
 
-            depth = (ry + 30) / 60
-            fade = max(0.2, min(1.0, depth))
-            r_c = int(r_c * fade)
-            g_c = int(g_c * fade)
-            b_c = int(b_c * fade)
-
-            if 0 <= sx < SZ and 0 <= sy < SZ:
-                draw.point((int(sx), int(sy)), fill=(r_c, g_c, b_c))
-
-        frames.append(img)
+        frames.append(Image.fromarray(pixels, 'RGB'))
     make_gif(frames, '07-lorenz-butterfly')
 
 
 # ═══════════════════════════════════════════════════════════
 # 08 — GEOMETRIC MORPH (Triangle → Square → Pentagon → Hex → Circle)
 # ═══════════════════════════════════════════════════════════
+@gif(8, 'geometric-morph', tags=('polygon',))
 def gif_08():
     frames = []
     shapes = [3, 4, 5, 6, 8, 12, 36]  # vertices (36 ≈ circle)
@@ -445,6 +437,7 @@ def gif_08():
 # ═══════════════════════════════════════════════════════════
 # 09 — FIBONACCI PHYLLOTAXIS BLOOM
 # ═══════════════════════════════════════════════════════════
+@gif(9, 'phyllotaxis-bloom', tags=('sacred', 'spiral'))
 def gif_09():
     golden_angle = math.pi * (3 - math.sqrt(5))
     frames = []
@@ -495,6 +488,7 @@ def gif_09():
 # ═══════════════════════════════════════════════════════════
 # 10 — SACRED GEOMETRY KALEIDOSCOPE
 # ═══════════════════════════════════════════════════════════
+@gif(10, 'kaleidoscope', tags=('symmetry',))
 def gif_10():
     frames = []
     for f in range(FRAMES):
@@ -550,9 +544,7 @@ def gif_10():
                 draw.line([(x2, y2), (xc, yc)], fill=c2, width=1)
 
         # Center jewel
-        for rr in range(12, 0, -1):
-            v = int(200 * (1 - rr / 12))
-            draw.ellipse([cx-rr, cy-rr, cx+rr, cy+rr], fill=(v, int(v*0.6), v))
+        shading.glow_image(img, cx, cy, 12, (200, 120, 200), falloff=0, edge=(0, 0, 0))
 
         frames.append(img)
     make_gif(frames, '10-kaleidoscope')
@@ -561,6 +553,7 @@ def gif_10():
 # ═══════════════════════════════════════════════════════════
 # 11 — SPINNING TORUS
 # ═══════════════════════════════════════════════════════════
+@gif(11, 'spinning-torus', tags=('3d',))
 def gif_11():
     frames = []
     R, r_tube = 120, 45
@@ -612,6 +605,7 @@ def gif_11():
 # ═══════════════════════════════════════════════════════════
 # 12 — TESSERACT ROTATION
 # ═══════════════════════════════════════════════════════════
+@gif(12, 'tesseract-rotation', tags=('3d', '4d'))
 def gif_12():
     # 4D hypercube
     verts_4d = []
@@ -685,6 +679,7 @@ def gif_12():
 # ═══════════════════════════════════════════════════════════
 # 13 — SUPERNOVA PULSE
 # ═══════════════════════════════════════════════════════════
+@gif(13, 'supernova-pulse', tags=('cosmic', 'glow'))
 def gif_13():
     random.seed(2024)
     # Pre-generate rays
@@ -723,10 +718,8 @@ def gif_13():
         draw.ellipse([cx-ring_r, cy-ring_r, cx+ring_r, cy+ring_r], outline=ring_color, width=2)
 
         # Core glow
-        for rr in range(25, 0, -1):
-            v = int(255 * (1 - rr/25) * pulse)
-            draw.ellipse([cx-rr, cy-rr, cx+rr, cy+rr],
-                         fill=(min(255,v+50), min(255, int(v*0.8)), min(255, int(v*0.4))))
+        v = 255 * pulse
+        shading.glow_image(img, cx, cy, 25, (min(255, v + 50), v * 0.8, v * 0.4), falloff=0, edge=(50, 0, 0))
 
         # Bright center
         draw.ellipse([cx-5, cy-5, cx+5, cy+5], fill=(255, 240, 200))
@@ -738,6 +731,7 @@ def gif_13():
 # ═══════════════════════════════════════════════════════════
 # 14 — DNA HELIX ROTATION
 # ═══════════════════════════════════════════════════════════
+@gif(14, 'dna-helix', tags=('3d',))
 def gif_14():
     frames = []
     R = 70  # helix radius
@@ -802,6 +796,7 @@ def gif_14():
 # ═══════════════════════════════════════════════════════════
 # 15 — GEODESIC SPHERE ROTATION
 # ═══════════════════════════════════════════════════════════
+@gif(15, 'geodesic-sphere', tags=('3d', 'polyhedra'))
 def gif_15():
     # Build icosahedron
     phi = (1 + math.sqrt(5)) / 2
@@ -886,19 +881,6 @@ def gif_15():
 # ═══════════════════════════════════════════════════════════
 if __name__ == '__main__':
     print("Generating GEOMETRIA GIF series (15 perfect loops)...")
-    gif_01()
-    gif_02()
-    gif_03()
-    gif_04()
-    gif_05()
-    gif_06()
-    gif_07()
-    gif_08()
-    gif_09()
-    gif_10()
-    gif_11()
-    gif_12()
-    gif_13()
-    gif_14()
-    gif_15()
+    for item in items(kind='gif'):
+        item.func()
     print("\nAll 15 GIFs generated!")
@@ -0,0 +1 @@
+"""GEOMETRIA SACRED PATTERNS — build tooling shared by the gen_*.py series"""
@@ -0,0 +1,5 @@
+import sys
+
+from geometria.cli import main
+
+sys.exit(main())
@@ -0,0 +1,721 @@
+"""GEOMETRIA SACRED PATTERNS — Kernel benchmarks
+
+Times the numeric kernels behind the heaviest posters and the GIF frame
+loops, without any drawing, at several sizes each, and compares them with
+a stored baseline:
+
+    python3 -m geometria bench --save           # record bench-baseline.json
+    python3 -m geometria bench                  # compare, exit 1 on regression
+    python3 -m geometria bench julia gif07 --threshold 0.1
+
+A case maps a size to a zero-argument callable (setup happens outside the
+timed call) and reports the best of several runs. Alternative
+implementations of a kernel are registered as 'name/variant' so the
+reference and the replacement are timed side by side in the same run.
+
+The poster kernels below mirror the loops in the gen_*.py scripts; the GIF
+cases run the real gif_NN() functions with fewer frames and no encoding.
+"""
+
+import contextlib
+import json
+import math
+import os
+import platform
+import random
+import tempfile
+import time
+from dataclasses import dataclass
+
+import numpy as np
+from reportlab.lib.pagesizes import A3
+
+from geometria import (bessel, cache, contour, density, escape, fields, ode, polyline, radial, raster,
+                       reaction, registry, simcache, trajectory)
+
+BASELINE = 'bench-baseline.json'
+THRESHOLD = 0.25      # fail when a case is 25% slower than its baseline...
+MIN_DELTA_S = 0.002   # ...and at least this much slower in absolute terms
+
+_cases = {}
+_scratch = None
+
+
+@dataclass
+class Case:
+    name: str
+    factory: object    # size -> zero-argument callable
+    sizes: tuple
+    unit: str
+    source: str        # catalogue key of the generator the kernel comes from
+
+
+def case(name, sizes, unit, source):
+    """Register a benchmark case."""
+    def decorate(factory):
+        _cases[name] = Case(name, factory, tuple(sizes), unit, source)
+        return factory
+    return decorate
+
+
+def _stored(name, result):
+    """Write result to a scratch simulation-cache entry; return its path."""
+    global _scratch
+    if _scratch is None:
+        _scratch = tempfile.TemporaryDirectory(prefix='geometria-bench-')
+    path = os.path.join(_scratch.name, name + '.npz')
+    simcache.store(path, result)
+    return path
+
+
+# ─── 031 — Julia escape time ──────────────────────────────
+
+@case('julia', sizes=(100, 200, 350), unit='px', source='031')
+def julia(res, c_re=-0.7, c_im=0.27015, max_iter=80):
+    def run():
+        counts = []
+        for ix in range(res):
+            for iy in range(res):
+                x0 = (ix / res - 0.5) * 3.0
+                y0 = (iy / res - 0.5) * 3.0
+                zr, zi = x0, y0
+                iteration = 0
+                while zr*zr + zi*zi < 4 and iteration < max_iter:
+                    zr_new = zr*zr - zi*zi + c_re
+                    zi = 2*zr*zi + c_im
+                    zr = zr_new
+                    iteration += 1
+                counts.append(iteration)
+        return counts
+    return run
+
+
+
+@case('julia/numpy', sizes=(100, 200, 350), unit='px', source='031')
+def julia_numpy(res, c_re=-0.7, c_im=0.27015, max_iter=80):
+    return lambda: escape.julia(complex(c_re, c_im), res, max_iter=max_iter)
+
+
+@case('julia/smooth', sizes=(100, 200, 350), unit='px', source='031')
+def julia_smooth(res, c_re=-0.7, c_im=0.27015, max_iter=80):
+    return lambda: escape.julia(complex(c_re, c_im), res, max_iter=max_iter, smooth=True).potential
+
+# ─── 016 — Chladni nodal lines ────────────────────────────
+
+CHLADNI_MODES = [(2, 3), (3, 5), (4, 7), (5, 6)]
+
+
+@case('chladni', sizes=(100, 200), unit='grid', source='016')
+def chladni(res):
+    def run():
+        out = []
+        for n, m in CHLADNI_MODES:
+            for ix in range(res):
+                for iy in range(res):
+                    x = (ix / res - 0.5) * 2
+                    y = (iy / res - 0.5) * 2
+                    if x*x + y*y > 0.95:
+                        continue
+                    val = math.sin(n * math.pi * x) * math.sin(m * math.pi * y) - \
+                          math.sin(m * math.pi * x) * math.sin(n * math.pi * y)
+                    if abs(val) < 0.06:
+                        out.append((x, y, val))
+        return out
+    return run
+
+
+@case('chladni/numpy', sizes=(100, 200), unit='grid', source='016')
+def chladni_numpy(res):
+    def run():
+        plate = fields.Sampler.square(res).within(r2=0.95)
+        values = plate.evaluate(
+            lambda s, n, m: np.sin(n * np.pi * s.x) * np.sin(m * np.pi * s.y) -
+                            np.sin(m * np.pi * s.x) * np.sin(n * np.pi * s.y),
+            n=[n for n, m in CHLADNI_MODES], m=[m for n, m in CHLADNI_MODES])
+        return plate.threshold(values, below=0.06)
+    return run
+
+
+# ─── 034 — Gray-Scott reaction-diffusion ──────────────────
+
+@case('gray-scott', sizes=(40, 80, 120), unit='grid', source='034')
+def gray_scott(res, steps=50):
+    random.seed(2025)
+    u = [[1.0]*res for _ in range(res)]
+    v = [[0.0]*res for _ in range(res)]
+    margin = min(20, res // 4)
+    for _ in range(15):
+        sx, sy = random.randint(margin, res-margin), random.randint(margin, res-margin)
+        for dx in range(-4, 5):
+            for dy in range(-4, 5):
+                if 0 <= sx+dx < res and 0 <= sy+dy < res:
+                    u[sx+dx][sy+dy] = 0.5
+                    v[sx+dx][sy+dy] = 0.25
+    Du, Dv = 0.16, 0.08
+    f, k = 0.035, 0.065
+    dt = 1.0
+
+    def run():
+        uu, vv = u, v
+        for _ in range(steps):
+            nu = [[0.0]*res for _ in range(res)]
+            nv = [[0.0]*res for _ in range(res)]
+            for x in range(1, res-1):
+                for y in range(1, res-1):
+                    lap_u = uu[x+1][y] + uu[x-1][y] + uu[x][y+1] + uu[x][y-1] - 4*uu[x][y]
+                    lap_v = vv[x+1][y] + vv[x-1][y] + vv[x][y+1] + vv[x][y-1] - 4*vv[x][y]
+                    uvv = uu[x][y] * vv[x][y] * vv[x][y]
+                    nu[x][y] = uu[x][y] + (Du * lap_u - uvv + f * (1 - uu[x][y])) * dt
+                    nv[x][y] = vv[x][y] + (Dv * lap_v + uvv - (f + k) * vv[x][y]) * dt
+                    nu[x][y] = max(0, min(1, nu[x][y]))
+                    nv[x][y] = max(0, min(1, nv[x][y]))
+            uu, vv = nu, nv
+        return vv
+    return run
+
+
+
+@case('gray-scott/numpy', sizes=(40, 80, 120), unit='grid', source='034')
+def gray_scott_numpy(res, steps=50):
+    random.seed(2025)
+    margin = min(20, res // 4)
+    spots = [(random.randint(margin, res-margin), random.randint(margin, res-margin))
+             for _ in range(15)]
+
+    def run():
+        rd = reaction.GrayScott(res, **reaction.PRESETS['turing'])
+        for sx, sy in spots:
+            rd.seed_square(sx, sy)
+        return rd.step(steps).v
+    return run
+
+@case('gray-scott/cached', sizes=(40, 80, 120), unit='grid', source='034')
+def gray_scott_cached(res):
+    path = _stored(f'gray-scott-{res}', np.array(gray_scott(res, steps=1)()))
+    return lambda: simcache.load(path)
+
+
+# ─── 054 — Airy disk (Bessel J1 series) ───────────────────
+
+def _bessel_j1(x):
+    if abs(x) < 1e-10:
+        return 0.5
+    s = 0
+    for k in range(20):
+        sign = (-1)**k
+        s += sign * (x/2)**(2*k+1) / (math.factorial(k) * math.factorial(k+1))
+    return s
+
+
+@case('airy', sizes=(50, 100, 200), unit='px', source='054')
+def airy(res):
+    def run():
+        out = []
+        for ix in range(res):
+            for iy in range(res):
+                x = (ix / res - 0.5) * 2
+                y = (iy / res - 0.5) * 2
+                r = math.sqrt(x*x + y*y)
+                if r > 0.98:
+                    continue
+                x_bessel = r * 25
+                if abs(x_bessel) < 1e-10:
+                    out.append(1.0)
+                else:
+                    out.append((2 * _bessel_j1(x_bessel) / x_bessel) ** 2)
+        return out
+    return run
+
+
+
+@case('airy/numpy', sizes=(50, 100, 200), unit='px', source='054')
+def airy_numpy(res):
+    def run():
+        x = (np.arange(res) / res - 0.5) * 2
+        r = np.hypot(*np.meshgrid(x, x, indexing='ij'))
+        return bessel.airy(r[r <= 0.98] * 25)
+    return run
+
+
+@case('airy/radial', sizes=(50, 100, 200), unit='px', source='054')
+def airy_radial(res, samples=4096):
+    def run():
+        radius = np.linspace(0, 0.98, samples)
+        profile = bessel.airy(radius * 25)
+        x = (np.arange(res) / res - 0.5) * 2
+        r = np.hypot(*np.meshgrid(x, x, indexing='ij'))
+        return np.interp(r[r <= 0.98], radius, profile)
+    return run
+
+# ─── 057 — Newton's rings (per-pixel HSV) ────────────────
+
+@case('rings', sizes=(100, 200, 300), unit='px', source='057')
+def rings(res):
+    def run():
+        out = []
+        for ix in range(res):
+            for iy in range(res):
+                x = (ix / res - 0.5) * 2
+                y = (iy / res - 0.5) * 2
+                r = math.sqrt(x*x + y*y)
+                if r > 0.98:
+                    continue
+                phase = r * r * 40
+                h6 = (phase % 1.0) * 6
+                hi = int(h6) % 6
+                f = h6 - int(h6)
+                s, v = 0.8, 0.9
+                p_c, q, t_c = v * (1 - s), v * (1 - f * s), v * (1 - (1 - f) * s)
+                rgb = [(v, t_c, p_c), (q, v, p_c), (p_c, v, t_c),
+                       (p_c, q, v), (t_c, p_c, v), (v, p_c, q)][hi]
+                alpha = (0.5 + 0.5 * math.cos(phase * 2 * math.pi)) ** 2 * (1.0 - r * 0.5) * 0.5
+                if alpha >= 0.02:
+                    out.append((rgb, alpha))
+        return out
+    return run
+
+
+@case('rings/radial', sizes=(100, 200, 300), unit='px', source='057')
+def rings_radial(res):
+    def alpha(r, phase):
+        return (0.5 + 0.5 * np.cos(phase * 2 * math.pi)) ** 2 * (1.0 - r * 0.5) * 0.5
+    return lambda: radial.field(res, profile=lambda r: r * r * 40,
+                                color=lambda r, ph: radial.hsv_to_rgb(ph % 1.0, 0.8, 0.9),
+                                alpha=alpha, keep=lambda r, ph: alpha(r, ph) >= 0.02)
+
+
+@case('rings/raster', sizes=(100, 200, 300), unit='px', source='057')
+def rings_raster(res):
+    f = rings_radial(res)()
+    xs = 421 + np.array(f.x) * 300
+    ys = 645 + np.array(f.y) * 300
+
+    def run():
+        dense = raster.Layer((116, 340, 726, 950))
+        dense.dots(xs, ys, 1.2 * 300 / res, f.rgb, f.alpha)
+        return dense.render()
+    return run
+
+
+# ─── 020 / 044 / 059 — Attractors ─────────────────────────
+
+def _bounds(points, *axes):
+    return [(min(p[a] for p in points), max(p[a] for p in points)) for a in axes]
+
+
+@case('lorenz', sizes=(5000, 25000), unit='steps', source='020')
+def lorenz(steps):
+    def run():
+        sigma, rho, beta = 10.0, 28.0, 8.0/3.0
+        dt = 0.005
+        x, y, z = 0.1, 0.0, 0.0
+        points = []
+        for _ in range(steps):
+            dx = sigma * (y - x)
+            dy = x * (rho - z) - y
+            dz = x * y - beta * z
+            x += dx * dt
+            y += dy * dt
+            z += dz * dt
+            points.append((x, y, z))
+        return points, _bounds(points, 0, 2)
+    return run
+
+
+@case('rossler', sizes=(10000, 40000), unit='steps', source='044')
+def rossler(steps):
+    def run():
+        a_r, b_r, c_r = 0.2, 0.2, 5.7
+        dt = 0.01
+        x, y, z = 1.0, 1.0, 1.0
+        points = []
+        for _ in range(steps):
+            dx = -y - z
+            dy = x + a_r * y
+            dz = b_r + z * (x - c_r)
+            x += dx * dt
+            y += dy * dt
+            z += dz * dt
+            points.append((x, y, z))
+        return points, _bounds(points, 0, 1)
+    return run
+
+
+def _depth_per_segment(points, axis):
+    # As the 020/044 draw loops do it: min/max over every point, per segment.
+    depths = []
+    for i in range(len(points) - 1):
+        lo = min(p[axis] for p in points)
+        hi = max(p[axis] for p in points)
+        depths.append((points[i][axis] - lo) / (hi - lo))
+    return depths
+
+
+@case('lorenz-depth', sizes=(500, 1000, 2000), unit='points', source='020')
+def lorenz_depth(n):
+    points, _ = lorenz(n)()
+    return lambda: _depth_per_segment(points, 1)
+
+
+@case('rossler-depth', sizes=(500, 1000, 2000), unit='points', source='044')
+def rossler_depth(n):
+    points, _ = rossler(n)()
+    return lambda: _depth_per_segment(points, 2)
+
+
+@case('clifford', sizes=(50000, 200000), unit='points', source='059')
+def clifford(n):
+    def run():
+        a, b, cc, d = -1.4, 1.6, 1.0, 0.7
+        x, y = 0.1, 0.1
+        points = []
+        for _ in range(n):
+            nx = math.sin(a * y) + cc * math.cos(a * x)
+            ny = math.sin(b * x) + d * math.cos(b * y)
+            x, y = nx, ny
+            points.append((x, y))
+        return points, _bounds(points, 0, 1)
+    return run
+
+
+@case('lorenz/numpy', sizes=(5000, 25000), unit='steps', source='020')
+def lorenz_numpy(steps):
+    return lambda: trajectory.lorenz(steps)
+
+
+@case('rossler/numpy', sizes=(10000, 40000), unit='steps', source='044')
+def rossler_numpy(steps):
+    return lambda: trajectory.rossler(steps)
+
+
+@case('clifford/numpy', sizes=(50000, 200000), unit='points', source='059')
+def clifford_numpy(n):
+    return lambda: trajectory.clifford(n)
+
+
+@case('clifford/cached', sizes=(50000, 200000), unit='points', source='059')
+def clifford_cached(n):
+    path = _stored(f'clifford-{n}', trajectory.clifford(n).coords)
+    return lambda: trajectory.Trajectory(simcache.load(path))
+
+
+@case('lorenz-depth/numpy', sizes=(500, 1000, 2000), unit='points', source='020')
+def lorenz_depth_numpy(n):
+    traj = trajectory.lorenz(n)
+    return lambda: trajectory.Trajectory(traj.coords).depth(1)
+
+
+@case('rossler-depth/numpy', sizes=(500, 1000, 2000), unit='points', source='044')
+def rossler_depth_numpy(n):
+    traj = trajectory.rossler(n)
+    return lambda: trajectory.Trajectory(traj.coords).depth(2)
+
+
+
+# Flow renderings: many short Lorenz trajectories, 200 Euler steps each
+
+@case('lorenz-flow', sizes=(100, 1000), unit='paths', source='020')
+def lorenz_flow(n, steps=200):
+    starts = ode.ball((0.1, 0.0, 0.0), 5.0, n, seed=7).tolist()
+
+    def run():
+        sigma, rho, beta = 10.0, 28.0, 8.0/3.0
+        dt = 0.005
+        paths = []
+        for x, y, z in starts:
+            points = []
+            for _ in range(steps):
+                dx = sigma * (y - x)
+                dy = x * (rho - z) - y
+                dz = x * y - beta * z
+                x += dx * dt
+                y += dy * dt
+                z += dz * dt
+                points.append((x, y, z))
+            paths.append(points)
+        return paths
+    return run
+
+
+@case('lorenz-flow/ensemble', sizes=(100, 1000), unit='paths', source='020')
+def lorenz_flow_ensemble(n, steps=200):
+    y0 = ode.ball((0.1, 0.0, 0.0), 5.0, n, seed=7)
+    return lambda: ode.integrate(ode.lorenz(), y0, 0.005, steps)
+
+
+@case('lorenz-flow/rk4', sizes=(100, 1000), unit='paths', source='020')
+def lorenz_flow_rk4(n, steps=200):
+    y0 = ode.ball((0.1, 0.0, 0.0), 5.0, n, seed=7)
+    return lambda: ode.integrate(ode.lorenz(), y0, 0.005, steps, method='rk4')
+
+
+@case('clifford/density', sizes=(200000, 2000000), unit='points', source='059')
+def clifford_density(n):
+    rng = np.random.default_rng(59)
+    xs, ys = rng.normal(421, 120, n), rng.normal(645, 160, n)
+
+    def run():
+        hist = density.Histogram((150, 300, 700, 1000), dpi=200)
+        hist.add(xs, ys).splat(0.6)
+        return hist.image(tone='log', vmax=hist.percentile(99.5))
+    return run
+
+# ─── 047 — Dragon curve fold ──────────────────────────────
+
+@case('dragon', sizes=(12, 14, 16), unit='folds', source='047')
+def dragon(iterations):
+    def run():
+        turns = []
+        for _ in range(iterations):
+            new_turns = []
+            for t in turns:
+                new_turns.append(t)
+            new_turns.append(True)
+            for t in reversed(turns):
+                new_turns.append(not t)
+            turns = new_turns
+        step = 2.5
+        x, y = 0.0, 0.0
+        dx, dy = step, 0
+        points = [(x, y)]
+        for turn in turns:
+            x += dx
+            y += dy
+            points.append((x, y))
+            if turn:
+                dx, dy = -dy, dx
+            else:
+                dx, dy = dy, -dx
+        return points, _bounds(points, 0, 1)
+    return run
+
+
+
+@case('dragon/polyline', sizes=(12, 14, 16), unit='folds', source='047')
+def dragon_polyline(iterations):
+    points, _ = dragon(iterations)()
+    t = np.arange(len(points) - 1) / len(points)
+    rgb = np.stack([np.minimum(1, 0.5 + t * 0.5), 0.05 + t * 0.25, 0.02 + t * 0.08], axis=-1)
+    alpha = 0.2 + 0.4 * (0.5 + 0.5 * np.sin(t * math.pi * 8))
+    width = 0.4 + 0.3 * (1 - t)
+    return lambda: polyline.runs(rgb, alpha, width, n=polyline.DEFAULT)
+
+# ─── 053 — Terrain and marching squares ───────────────────
+
+def _terrain(res):
+    W, H = A3
+    random.seed(99)
+    peaks = [(random.random()*W, random.random()*(H-200)+150, random.random()*80+30,
+              random.random()*0.01+0.005) for _ in range(8)]
+
+    def terrain_height(x, y):
+        h = 0
+        for px, py, amp, freq in peaks:
+            d = math.hypot(x - px, y - py)
+            h += amp * math.exp(-d * freq)
+        h += 10 * math.sin(x * 0.03) * math.cos(y * 0.025)
+        h += 5 * math.sin(x * 0.07 + y * 0.05)
+        return h
+
+    cell_w, cell_h = (W - 80) / res, (H - 220) / res
+    return [[terrain_height(40 + x * cell_w, 160 + y * cell_h) for x in range(res+1)]
+            for y in range(res+1)]
+
+
+@case('terrain', sizes=(50, 100, 200), unit='grid', source='053')
+def terrain(res):
+    return lambda: _terrain(res)
+
+
+@case('marching-squares', sizes=(50, 100, 200), unit='grid', source='053')
+def marching_squares(res, n_contours=20):
+    heights = _terrain(res)
+    all_h = [h for row in heights for h in row]
+    h_min, h_max = min(all_h), max(all_h)
+
+    def run():
+        segments = []
+        for ci in range(n_contours):
+            level = h_min + (h_max - h_min) * (ci + 0.5) / n_contours
+            for y in range(res):
+                for x in range(res):
+                    h00 = heights[y][x]
+                    h10 = heights[y][x+1]
+                    h01 = heights[y+1][x]
+                    h11 = heights[y+1][x+1]
+                    above = [(h00 >= level), (h10 >= level), (h01 >= level), (h11 >= level)]
+                    n_above = sum(above)
+                    if n_above == 0 or n_above == 4:
+                        continue
+                    crossings = []
+                    if above[0] != above[1]:
+                        t_val = (level - h00) / (h10 - h00) if h10 != h00 else 0.5
+                        crossings.append((x + t_val, y))
+                    if above[2] != above[3]:
+                        t_val = (level - h01) / (h11 - h01) if h11 != h01 else 0.5
+                        crossings.append((x + t_val, y + 1))
+                    if above[0] != above[2]:
+                        t_val = (level - h00) / (h01 - h00) if h01 != h00 else 0.5
+                        crossings.append((x, y + t_val))
+                    if above[1] != above[3]:
+                        t_val = (level - h10) / (h11 - h10) if h11 != h10 else 0.5
+                        crossings.append((x + 1, y + t_val))
+                    if len(crossings) >= 2:
+                        segments.append((crossings[0], crossings[1]))
+        return segments
+    return run
+
+
+
+def _terrain_numpy(res):
+    W, H = A3
+    random.seed(99)
+    peaks = [(random.random()*W, random.random()*(H-200)+150, random.random()*80+30,
+              random.random()*0.01+0.005) for _ in range(8)]
+    cell_w, cell_h = (W - 80) / res, (H - 220) / res
+    gy, gx = np.indices((res + 1, res + 1))
+    x, y = 40 + gx * cell_w, 160 + gy * cell_h
+    h = 0
+    for px, py, amp, freq in peaks:
+        h = h + amp * np.exp(-np.hypot(x - px, y - py) * freq)
+    h = h + 10 * np.sin(x * 0.03) * np.cos(y * 0.025)
+    return h + 5 * np.sin(x * 0.07 + y * 0.05)
+
+
+@case('terrain/numpy', sizes=(50, 100, 200), unit='grid', source='053')
+def terrain_numpy(res):
+    return lambda: _terrain_numpy(res)
+
+
+@case('marching-squares/numpy', sizes=(50, 100, 200), unit='grid', source='053')
+def marching_squares_numpy(res, n_contours=20):
+    heights = _terrain_numpy(res)
+    h_min, h_max = float(heights.min()), float(heights.max())
+    levels = [h_min + (h_max - h_min) * (ci + 0.5) / n_contours for ci in range(n_contours)]
+    return lambda: contour.contours(heights, levels)
+
+# ─── GIF frame loops ──────────────────────────────────────
+
+@contextlib.contextmanager
+def _gif_frames(module, n_frames):
+    """Run gif_NN() with n_frames frames and without writing the GIF."""
+    frames, make_gif = module.FRAMES, module.make_gif
+    module.FRAMES = n_frames
+    module.make_gif = lambda frames_list, name, duration=None: None
+    try:
+        yield
+    finally:
+        module.FRAMES, module.make_gif = frames, make_gif
+
+
+def _gif_case(number):
+    def factory(n_frames):
+        import gen_gifs
+        func = registry.get('gif', number).func
+
+        def run():
+            with _gif_frames(gen_gifs, n_frames):
+                func()
+        return run
+    key = f'gif{number:02d}'
+    case(key, sizes=(4, 12), unit='frames', source=key)(factory)
+
+
+for _n in range(1, 16):
+    _gif_case(_n)
+
+
+# ─── Runner ───────────────────────────────────────────────
+
+def cases(patterns=()):
+    """Registered cases whose name contains any of patterns (all by default)."""
+    found = list(_cases.values())
+    if patterns:
+        found = [c for c in found if any(p in c.name for p in patterns)]
+        if not found:
+            raise KeyError(f'no benchmark matches {" ".join(patterns)!r}')
+    return found
+
+
+def time_call(func, repeat=3, budget=2.0):
+    """Best wall time of up to repeat calls, stopping early once budget is spent."""
+    best, spent = float('inf'), 0.0
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        dt = time.perf_counter() - t0
+        best, spent = min(best, dt), spent + dt
+        if spent >= budget:
+            break
+    return best
+
+
+def run(selected, repeat=3, on_result=None):
+    """Time every size of every selected case; return {name: {size: seconds}}.
+
+    The simulation cache is bypassed so that kernels are really recomputed.
+    """
+    registry.load()
+    results = {}
+    for c in selected:
+        for size in c.sizes:
+            with simcache.disabled():
+                seconds = time_call(c.factory(size), repeat)
+            results.setdefault(c.name, {})[str(size)] = round(seconds, 6)
+            if on_result:
+                on_result(c, size, seconds)
+    return results
+
+
+# ─── Baseline ─────────────────────────────────────────────
+
+def baseline_path():
+    return os.path.join(registry.ROOT, BASELINE)
+
+
+def load_baseline(path):
+    """{name: {size: seconds}} from a baseline file, or {} if there is none."""
+    try:
+        with open(path) as fh:
+            return json.load(fh)['cases']
+    except (OSError, ValueError, KeyError):
+        return {}
+
+
+def save_baseline(results, path):
+    """Merge results into the baseline at path (other cases are kept)."""
+    merged = load_baseline(path)
+    for name, sizes in results.items():
+        merged.setdefault(name, {}).update(sizes)
+    doc = {
+        'machine': f'{platform.system()} {platform.machine()} {platform.processor()}'.strip(),
+        'versions': cache.versions(),
+        'cases': merged,
+    }
+    with open(path, 'w') as fh:
+        json.dump(doc, fh, indent=1, sort_keys=True)
+
+
+def compare(results, baseline, threshold=THRESHOLD):
+    """Rows of (name, size, seconds, base seconds or None, ratio or None, regressed)."""
+    rows = []
+    for name, sizes in results.items():
+        for size, seconds in sizes.items():
+            base = baseline.get(name, {}).get(size)
+            ratio = seconds / base if base else None
+            regressed = (ratio is not None and ratio > 1 + threshold
+                         and seconds - base > MIN_DELTA_S)
+            rows.append((name, size, seconds, base, ratio, regressed))
+    return rows
+
+
+def format_table(rows, units):
+    w = max([18] + [len(row[0]) for row in rows])
+    lines = [f"{'case':<{w}} {'size':>14} {'best s':>10} {'base s':>10} {'ratio':>7}"]
+    for name, size, seconds, base, ratio, regressed in rows:
+        base_s = '-' if base is None else f'{base:10.4f}'
+        ratio_s = '-' if ratio is None else f'{ratio:7.2f}'
+        flag = '  REGRESSION' if regressed else ''
+        lines.append(f"{name:<{w}} {size + ' ' + units[name]:>14} {seconds:10.4f} "
+                     f"{base_s:>10} {ratio_s:>7}{flag}")
+    return '\n'.join(lines)
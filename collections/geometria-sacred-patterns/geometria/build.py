@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""GEOMETRIA SACRED PATTERNS — Parallel build driver
+
+Renders registered generators (see geometria.registry) on a process pool.
+Output ("NNN done", errors) is reported in catalogue order no matter which
+worker finishes first. Generators whose fingerprint and output are unchanged
+since the last build are skipped (see geometria.cache).
+
+    python3 -m geometria.build --jobs 8
+    python3 -m geometria.build --force        # ignore the cache
+
+This is `python3 -m geometria render` with no selection.
+"""
+
+import contextlib
+import functools
+import io
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+from dataclasses import dataclass
+
+from geometria import cache, instrument, profile, registry
+
+# Pure-Python generators that dominate a full rebuild. They are dispatched
+# first so the pool never ends up waiting on one of them after everything else.
+HEAVY = ('031', '034', '044', '054', '057', '020', '059', '025', 'gif07')
+
+
+@dataclass
+class Result:
+    key: str
+    output: str
+    error: str
+    seconds: float
+    stats: dict = None
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+# ─── Workers ──────────────────────────────────────────────
+
+def _init_worker(out_dir):
+    registry.load()
+    registry.set_output_dir(out_dir)
+
+
+def run_item(ref, profiling=False, instrumenting=False):
+    """Render the item (kind, number), capturing its stdout and any traceback.
+
+    With profiling, drawing primitives are counted and the process peak RSS
+    is recorded (meaningful because profiled workers render a single item).
+    With instrumenting, poster canvases are InstrumentedCanvas proxies and
+    their phase/operator summary is returned in stats['canvas'].
+    """
+    item = registry.get(*ref)
+    out = io.StringIO()
+    error = None
+    counts = None
+    canvases = []
+    t0, c0 = time.perf_counter(), time.process_time()
+    try:
+        with contextlib.ExitStack() as stack:
+            stack.enter_context(contextlib.redirect_stdout(out))
+            if profiling:
+                counts = stack.enter_context(profile.counting_primitives())
+            if instrumenting:
+                canvases = stack.enter_context(instrument.instrumented())
+            item.func()
+    except Exception:
+        error = traceback.format_exc()
+    wall, cpu = time.perf_counter() - t0, time.process_time() - c0
+    stats = {
+        'key': item.key,
+        'wall_s': round(wall, 4),
+        'cpu_s': round(cpu, 4),
+        'peak_rss_mb': round(profile.peak_rss_mb(), 1) if profiling else None,
+        'output_bytes': os.path.getsize(item.path) if os.path.exists(item.path) else None,
+        'primitives': sum(counts.values()) if counts is not None else None,
+    }
+    if canvases:
+        stats['canvas'] = canvases[-1].summary()
+    return Result(item.key, out.getvalue(), error, wall, stats)
+
+
+def schedule(items):
+    """Order items for dispatch, longest first.
+
+    Uses the wall times of the last profiled build in the output directory
+    when there is one, otherwise the HEAVY list, then catalogue order.
+    """
+    last = {r['key']: r['wall_s'] for r in profile.load_report(registry.output_dir())}
+    if last:
+        return sorted(items, key=lambda it: (-last.get(it.key, 0), it.order))
+    rank = {key: i for i, key in enumerate(HEAVY)}
+    return sorted(items, key=lambda it: (rank.get(it.key, len(rank)), it.order))
+
+
+def run_items(items, n_jobs=None, on_result=None, profiling=False, instrumenting=False):
+    """Render items on a pool of n_jobs processes; return results in catalogue order.
+
+    on_result(result) is called in catalogue order as soon as every earlier
+    item has finished, so streamed output stays deterministic. Profiled
+    builds always use worker processes, one fresh process per item, so that
+    peak memory is attributed to the right poster.
+    """
+    n_jobs = n_jobs or os.cpu_count() or 1
+    order = [it.key for it in sorted(items, key=lambda it: it.order)]
+    refs = [(it.kind, it.number) for it in schedule(items)]
+    done = {}
+    emitted = 0
+
+    def collect(result):
+        nonlocal emitted
+        done[result.key] = result
+        while emitted < len(order) and order[emitted] in done:
+            if on_result:
+                on_result(done[order[emitted]])
+            emitted += 1
+
+    work = functools.partial(run_item, profiling=profiling, instrumenting=instrumenting)
+    if not profiling and (n_jobs == 1 or len(items) <= 1):
+        for ref in refs:
+            collect(work(ref))
+    else:
+        pool = multiprocessing.Pool(min(n_jobs, len(items)), initializer=_init_worker,
+                                    initargs=(registry.output_dir(),),
+                                    maxtasksperchild=1 if profiling else None)
+        with pool:
+            for result in pool.imap_unordered(work, refs, chunksize=1):
+                collect(result)
+    return [done[key] for key in order]
+
+
+def build(items, n_jobs=None, force=False, on_result=None, profiling=False,
+          instrumenting=False):
+    """Render the stale items and update the manifest; return (results, skipped)."""
+    bc = cache.BuildCache(registry.output_dir())
+    digests = {it.key: cache.fingerprint(it.func) for it in items}
+    stale, skipped = [], []
+    for it in items:
+        if not force and bc.is_fresh(it.key, digests[it.key], it.filename):
+            skipped.append(it)
+        else:
+            stale.append(it)
+
+    results = run_items(stale, n_jobs, on_result, profiling, instrumenting) if stale else []
+    by_key = {it.key: it for it in stale}
+    for result in results:
+        it = by_key[result.key]
+        if result.ok and os.path.exists(it.path):
+            bc.record(it.key, digests[it.key], it.filename)
+    bc.save()
+    return results, skipped
+
+
+def report(result):
+    sys.stdout.write(result.output)
+    if not result.ok:
+        print(f"  {result.key} FAILED")
+        print(result.error, file=sys.stderr)
+    sys.stdout.flush()
+
+
+def main(argv=None):
+    from geometria import cli
+    return cli.main(['render'] + list(sys.argv[1:] if argv is None else argv))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,167 @@
+"""GEOMETRIA SACRED PATTERNS — Content-hash incremental build cache
+
+Every generator gets a fingerprint built from its own source, the source of
+the module-level helpers it calls (bg, title_block, scatter_stars,
+draw_polygon, make_gif, ...), the geometria modules they use and every
+geometria module those import, the module constants it reads (W, H, SZ,
+FRAMES, ...), the random seeds in its body, the quality level and the
+library versions. A
+render is skipped when the fingerprint matches the manifest stored next to
+the outputs and the output file is byte-for-byte what was recorded.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import re
+import sys
+import types
+
+from geometria import cull, dots, gstate, polyline, quality, raster, shading
+
+MANIFEST = '.build-cache.json'
+
+_SEED = re.compile(r'random\.seed\(([^)]*)\)')
+
+
+# ─── Fingerprints ─────────────────────────────────────────
+
+def _names(code):
+    """Global names referenced by a code object and every nested function in it."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _names(const)
+    return names
+
+
+def _geometria_module(obj):
+    """The geometria module obj is or was defined in, or None (registry excluded)."""
+    if isinstance(obj, types.ModuleType):
+        module = obj
+    elif isinstance(obj, (types.FunctionType, type)):
+        module = sys.modules.get(obj.__module__)
+    else:
+        return None
+    name = getattr(module, '__name__', '')
+    if not name.startswith('geometria.') or name == 'geometria.registry':
+        return None  # registry: output paths only, never pixels
+    return module
+
+
+def _modules(module, seen):
+    """Add the source of module and of every geometria module it imports, transitively."""
+    if module.__name__ in seen:
+        return
+    seen[module.__name__] = inspect.getsource(module)
+    for obj in vars(module).values():
+        imported = _geometria_module(obj)
+        if imported is not None:
+            _modules(imported, seen)
+
+
+def _dependencies(func, seen=None):
+    """Map name -> source/repr for every module-level object func relies on.
+
+    geometria modules are keyed by module name and pull in the geometria
+    modules they import, so editing cull.py changes every poster that
+    reaches it through gstate, polyline or dots.
+    """
+    seen = {} if seen is None else seen
+    module = sys.modules[func.__module__]
+    for name in sorted(_names(func.__code__)):
+        if name in seen or not hasattr(module, name):
+            continue
+        obj = getattr(module, name)
+        if isinstance(obj, types.FunctionType) and obj.__module__ == module.__name__:
+            obj = inspect.unwrap(obj)  # e.g. simcache.memoize helpers
+            seen[name] = inspect.getsource(obj)
+            _dependencies(obj, seen)
+        elif _geometria_module(obj) is not None:
+            _modules(_geometria_module(obj), seen)
+        elif getattr(obj, '__module__', None) == 'geometria.registry':
+            continue
+        elif isinstance(obj, (int, float, str, tuple)):
+            seen[name] = repr(obj)
+    return seen
+
+
+def versions():
+    """Versions of the interpreter and rendering libraries that affect output bytes."""
+    found = {'python': '%d.%d' % sys.version_info[:2]}
+    for name, attr in [('reportlab', 'Version'), ('PIL', '__version__'), ('numpy', '__version__')]:
+        module = sys.modules.get(name)
+        if module is not None:
+            found[name] = getattr(module, attr, '?')
+    return found
+
+
+def fingerprint(func):
+    """Stable hex digest of everything that determines func's output."""
+    source = inspect.getsource(func)
+    parts = {
+        'source': source,
+        'helpers': _dependencies(func),
+        'seeds': _SEED.findall(source),
+        'quality': quality.level(),
+        'raster': raster.mode(),
+        'gstate': gstate.mode(),
+        'buckets': polyline.buckets(),
+        'simplify': polyline.simplify_mode(),
+        'dots': dots.mode(),
+        'cull': cull.mode(),
+        'glow': shading.mode(),
+        'versions': versions(),
+    }
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode()).hexdigest()
+
+
+def file_digest(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+# ─── Manifest ─────────────────────────────────────────────
+
+class BuildCache:
+    """Manifest of fingerprints for one output directory."""
+
+    def __init__(self, out_dir):
+        self.out_dir = out_dir
+        self.path = os.path.join(out_dir, MANIFEST)
+        self.entries = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path) as fh:
+                    self.entries = json.load(fh)
+            except (OSError, ValueError):
+                self.entries = {}
+
+    def is_fresh(self, key, digest, output):
+        """True if key was last built with digest and its output is untouched."""
+        entry = self.entries.get(key)
+        path = os.path.join(self.out_dir, output)
+        if not entry or entry['fingerprint'] != digest or entry['output'] != output:
+            return False
+        if not os.path.exists(path) or os.path.getsize(path) != entry['size']:
+            return False
+        return file_digest(path) == entry['sha256']
+
+    def record(self, key, digest, output):
+        path = os.path.join(self.out_dir, output)
+        self.entries[key] = {
+            'fingerprint': digest,
+            'output': output,
+            'size': os.path.getsize(path),
+            'sha256': file_digest(path),
+        }
+
+    def save(self):
+        tmp = self.path + '.tmp'
+        with open(tmp, 'w') as fh:
+            json.dump(self.entries, fh, indent=1, sort_keys=True)
+        os.replace(tmp, self.path)
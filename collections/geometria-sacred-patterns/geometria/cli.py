@@ -0,0 +1,249 @@
+"""GEOMETRIA SACRED PATTERNS — command line
+
+    python3 -m geometria list [--tag attractor]
+    python3 -m geometria render 031 044-047 --tag attractor --out DIR
+    python3 -m geometria render gif07 --jobs 1 --force
+    python3 -m geometria render --quality draft --out /tmp/draft
+    python3 -m geometria render 054 057 --raster 054,057
+    python3 -m geometria raster 054 025 057 037
+    python3 -m geometria render --gstate 256 --instrument
+    python3 -m geometria render 047 020 --buckets 8
+    python3 -m geometria render 020 044 055 --buckets 32 --simplify 0.5
+    python3 -m geometria render 038 052 --dots path
+    python3 -m geometria render 019 046 060 --cull 1 --instrument
+    python3 -m geometria render 022 038 046 --glow off
+    python3 -m geometria watch [031 gif07] [--port 8000]
+    python3 -m geometria bench [julia gif07] [--save]
+
+Selectors are poster numbers ('031'), ranges ('044-047'), GIF numbers
+('gif07', 'gif01-05') or slugs ('julia-set'); items matching any selector
+or --tag are rendered. With no selection the whole collection is built.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from geometria import (bench, build, cull, dots, gstate, instrument, polyline, profile, quality,
+                       raster, registry, shading, watch)
+
+
+def _add_selection(parser):
+    parser.add_argument('selectors', nargs='*', metavar='ITEM',
+                        help="poster number/range, gifNN or slug (default: everything)")
+    parser.add_argument('-t', '--tag', action='append', default=[],
+                        help='also select items carrying this tag (repeatable)')
+    parser.add_argument('-s', '--series', help="restrict to a series, e.g. 031-045 or gifs")
+
+
+def _selected(parser, args):
+    registry.load()
+    try:
+        return registry.select(args.selectors, args.tag, args.series)
+    except KeyError as e:
+        parser.error(e.args[0])
+
+
+def cmd_list(parser, args):
+    for it in _selected(parser, args):
+        print(f"{it.key:>6}  {it.filename:<36} {it.series:<8} {', '.join(it.tags)}")
+    return 0
+
+
+def cmd_render(parser, args):
+    try:
+        quality.set_level(args.quality)  # before the generator modules are imported
+        raster.set_mode(args.raster)
+        gstate.set_mode(args.gstate)
+        polyline.set_buckets(args.buckets)
+        polyline.set_tolerance(args.simplify)
+        dots.set_mode(args.dots)
+        cull.set_mode(args.cull)
+        shading.set_mode(args.glow)
+    except ValueError as e:
+        parser.error(e.args[0])
+    items = _selected(parser, args)
+    if args.no_sim_cache:
+        os.environ['GEOMETRIA_SIM_CACHE'] = 'off'  # inherited by the workers
+    if args.out:
+        registry.set_output_dir(args.out)
+    print(f"Rendering {len(items)} item(s) into {registry.output_dir()} "
+          f"on {args.jobs} worker(s) at {args.quality} quality...")
+    t0 = time.perf_counter()
+    results, skipped = build.build(items, args.jobs, args.force or args.instrument,
+                                   on_result=build.report, profiling=args.profile,
+                                   instrumenting=args.instrument)
+    failed = [r for r in results if not r.ok]
+    if args.instrument:
+        rows = [(r.key, r.stats['canvas']) for r in results if r.ok and 'canvas' in r.stats]
+        print()
+        print(instrument.format_table(rows))
+        culled = [(key, s['cull']) for key, s in rows if s.get('cull')]
+        if culled:
+            print()
+            print(cull.format_table(culled))
+        path = instrument.write_report(dict(rows), registry.output_dir())
+        print(f"  wrote {path}")
+    if args.profile and results:
+        records = [r.stats for r in results if r.ok]
+        print()
+        print(profile.format_table(records))
+        for path in profile.write_reports(records, registry.output_dir()):
+            print(f"  wrote {path}")
+    print(f"\ncache: {len(skipped)} hit, {len(results)} miss")
+    print(f"{len(results) - len(failed)}/{len(results)} items rendered "
+          f"in {time.perf_counter() - t0:.1f}s")
+    if failed:
+        print("Failed: " + ", ".join(r.key for r in failed))
+        return 1
+    return 0
+
+
+def cmd_watch(parser, args):
+    quality.set_level(args.quality)
+    items = _selected(parser, args)
+    initial = items if (args.selectors or args.tag) else []
+    return watch.watch(items, initial, args.out, args.port, args.interval)
+
+
+def cmd_raster(parser, args):
+    if not (args.selectors or args.tag):
+        args.selectors = list(raster.POSTERS)
+    items = [it for it in _selected(parser, args) if it.kind == 'poster']
+    if not items:
+        parser.error('select at least one poster')
+    rows, out_dir, tool = raster.compare(items, args.out)
+    print(raster.format_table(rows, tool))
+    print(f"  outputs in {out_dir}")
+    if not tool:
+        print("  no PDF rasterizer on PATH (pdftoppm, mutool or gs); view times not measured")
+    return 0
+
+
+def cmd_bench(parser, args):
+    quality.set_level('final')  # GIF cases read FRAMES and counts at import
+    try:
+        selected = bench.cases(args.selectors)
+    except KeyError as e:
+        parser.error(e.args[0])
+    path = args.baseline or bench.baseline_path()
+    baseline = bench.load_baseline(path)
+    units = {c.name: c.unit for c in selected}
+
+    def progress(c, size, seconds):
+        print(f"  {c.name} [{size} {c.unit}] {seconds:.4f}s", flush=True)
+
+    results = bench.run(selected, args.repeat, on_result=progress)
+    rows = bench.compare(results, baseline, args.threshold)
+    print()
+    print(bench.format_table(rows, units))
+    if args.save:
+        bench.save_baseline(results, path)
+        print(f"  wrote {path}")
+        return 0
+    if not baseline:
+        print(f"no baseline at {path}; record one with --save")
+        return 0
+    regressed = [f'{name}[{size}]' for name, size, *_, bad in rows if bad]
+    if regressed:
+        print(f"Regressed beyond {args.threshold:.0%}: " + ", ".join(regressed))
+        return 1
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='geometria', description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('list', help='show registered posters and GIFs')
+    _add_selection(p)
+    p.set_defaults(run=cmd_list, parser=p)
+
+    p = sub.add_parser('render', help='render selected posters and GIFs')
+    _add_selection(p)
+    p.add_argument('-o', '--out', help='output directory (default: the collection folder)')
+    p.add_argument('-j', '--jobs', type=int, default=os.cpu_count(),
+                   help='worker processes (default: one per CPU)')
+    p.add_argument('-f', '--force', action='store_true',
+                   help='re-render even if the build cache says the output is fresh')
+    p.add_argument('-p', '--profile', action='store_true',
+                   help='record time, memory, size and primitive counts per item '
+                        '(build-profile.json/.csv)')
+    p.add_argument('-i', '--instrument', action='store_true',
+                   help='wrap poster canvases to count operators and split compute / '
+                        'emit / save time (canvas-profile.json); implies --force')
+    p.add_argument('-q', '--quality', choices=list(quality.LEVELS),
+                   default=os.environ.get(quality.ENV, quality.DEFAULT),
+                   help='sampling density: draft/preview for layout review, print for more '
+                        'than today (default: $GEOMETRIA_QUALITY or %(default)s)')
+    p.add_argument('--no-sim-cache', action='store_true',
+                   help='recompute simulations instead of loading them from .sim-cache/')
+    p.add_argument('--raster', default=os.environ.get(raster.ENV, raster.DEFAULT),
+                   help="posters whose dense dot layer is embedded as one image: 'all', "
+                        "'off' or numbers such as 054,057 (default: $GEOMETRIA_RASTER "
+                        "or %(default)s)")
+    p.add_argument('--gstate', default=os.environ.get(gstate.ENV, gstate.DEFAULT),
+                   help="graphics-state handling: 'off', 'dedup' (skip state changes to the "
+                        "value in effect) or a number of levels to round colours and alphas "
+                        "to, e.g. 256 (default: $GEOMETRIA_GSTATE or %(default)s)")
+    p.add_argument('--buckets', type=int, default=os.environ.get(polyline.ENV, polyline.DEFAULT),
+                   help='style levels along gradient polylines and dot clouds: fewer give longer '
+                        'paths, fewer bins and smaller PDFs, 0 keeps every style exact (default: '
+                        '$GEOMETRIA_BUCKETS or %(default)s)')
+    p.add_argument('--simplify', default=os.environ.get(polyline.SIMPLIFY_ENV,
+                                                        polyline.SIMPLIFY_DEFAULT),
+                   help="drop polyline vertices the path passes within this many pixels at "
+                        "300 dpi of: 'off' or a tolerance such as 0.5 (default: "
+                        "$GEOMETRIA_SIMPLIFY or %(default)s)")
+    p.add_argument('--dots', default=os.environ.get(dots.ENV, dots.DEFAULT),
+                   help="dot clouds: 'form' (a shared unit-circle XObject per dot), 'path' "
+                        "(one compound path per colour bin) or 'off' (a circle() per dot) "
+                        "(default: $GEOMETRIA_DOTS or %(default)s)")
+    p.add_argument('--cull', default=os.environ.get(cull.ENV, cull.DEFAULT),
+                   help="drop primitives that cannot change a pixel (faint, off the page or "
+                        "under a later opaque fill): 'off' or the threshold in 8-bit levels "
+                        "(default: $GEOMETRIA_CULL or %(default)s)")
+    p.add_argument('--glow', default=os.environ.get(shading.ENV, shading.DEFAULT),
+                   help="soft glows: 'shading' (one radial shading through a soft mask) or "
+                        "'off' (the stacks of concentric circles) (default: $GEOMETRIA_GLOW or "
+                        "%(default)s)")
+    p.set_defaults(run=cmd_render, parser=p)
+
+    p = sub.add_parser('raster', help='compare vector and hybrid raster output of posters')
+    _add_selection(p)
+    p.add_argument('-o', '--out', help='keep both renders here (default: a temp directory)')
+    p.set_defaults(run=cmd_raster, parser=p)
+
+    p = sub.add_parser('watch', help='re-render edited generators and serve live previews')
+    _add_selection(p)
+    p.add_argument('-o', '--out', default=watch.DEFAULT_DIR,
+                   help='scratch directory for previews (default: %(default)s)')
+    p.add_argument('-q', '--quality', choices=list(quality.LEVELS), default='preview',
+                   help='sampling density of the previews (default: %(default)s)')
+    p.add_argument('--port', type=int, default=8000, help='HTTP port (default: %(default)s)')
+    p.add_argument('--interval', type=float, default=0.5,
+                   help='seconds between checks of the gen_*.py files (default: %(default)s)')
+    p.set_defaults(run=cmd_watch, parser=p)
+
+    p = sub.add_parser('bench', help='time the compute kernels against a stored baseline')
+    p.add_argument('selectors', nargs='*', metavar='CASE',
+                   help='benchmark names or substrings, e.g. julia, gif07 (default: all)')
+    p.add_argument('--baseline', help='baseline JSON (default: bench-baseline.json)')
+    p.add_argument('--save', action='store_true', help='record these timings as the baseline')
+    p.add_argument('--threshold', type=float, default=bench.THRESHOLD,
+                   help='allowed slowdown before failing, as a fraction (default: %(default)s)')
+    p.add_argument('-r', '--repeat', type=int, default=3,
+                   help='runs per size; the best one counts (default: %(default)s)')
+    p.set_defaults(run=cmd_bench, parser=p)
+
+    # Selectors and options may be interleaved ("render 031 --tag fractal 054"),
+    # which subparsers cannot parse; dispatch on the command word ourselves.
+    argv = sys.argv[1:] if argv is None else list(argv)
+    command = parser.parse_args(argv[:1])
+    args = command.parser.parse_intermixed_args(argv[1:])
+    return command.run(command.parser, args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
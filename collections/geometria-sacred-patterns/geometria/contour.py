@@ -0,0 +1,148 @@
+"""GEOMETRIA SACRED PATTERNS — Marching-squares contours
+
+Finds the iso-lines of a height grid and returns them as continuous
+polylines instead of one two-point segment per cell:
+
+    heights = ...                           # (ny + 1, nx + 1), indexed [y][x]
+    for line in contour.isolines(heights, level):
+        path.moveTo(*to_page(line[0]))
+        ...                                 # line is an (n, 2) array of (x, y)
+
+All cells of a level are classified at once with NumPy (case index from
+the four corners, crossing points interpolated along every edge). The two
+ambiguous saddle cases are resolved with the cell centre, taken as the
+mean of its corners, so lines never cross inside a cell. Segments are then
+stitched through the edges they share: open lines run from one grid border
+to another, closed loops end on their first point.
+
+Coordinates are in grid units: corner (x, y) is heights[y][x].
+"""
+
+from collections import defaultdict
+
+import numpy as np
+
+# Corner bits: 1 = (x, y), 2 = (x+1, y), 4 = (x+1, y+1), 8 = (x, y+1).
+# Edges of a cell: 0 = bottom (y), 1 = right (x+1), 2 = top (y+1), 3 = left (x).
+S, E, N, W = 0, 1, 2, 3
+
+SEGMENTS = {
+    1: ((S, W),), 2: ((S, E),), 3: ((W, E),), 4: ((E, N),),
+    6: ((S, N),), 7: ((W, N),), 8: ((W, N),), 9: ((S, N),),
+    11: ((E, N),), 12: ((W, E),), 13: ((S, E),), 14: ((S, W),),
+}
+# Saddles: (centre below, centre above). When the centre is above the level
+# the two above corners join through it, so the cut goes around the others.
+SADDLES = {
+    5: (((S, W), (E, N)), ((S, E), (W, N))),     # (x, y) and (x+1, y+1) above
+    10: (((S, E), (W, N)), ((S, W), (E, N))),    # (x+1, y) and (x, y+1) above
+}
+
+
+def _edge_points(h, level):
+    """Crossing points on every horizontal and vertical edge, flattened by edge id."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        h0, h1 = h[:, :-1], h[:, 1:]
+        t = np.where(h1 != h0, (level - h0) / (h1 - h0), 0.5)
+        ys, xs = np.indices(h0.shape)
+        hx, hy = xs + t, ys.astype(float)
+
+        v0, v1 = h[:-1, :], h[1:, :]
+        t = np.where(v1 != v0, (level - v0) / (v1 - v0), 0.5)
+        ys, xs = np.indices(v0.shape)
+        vx, vy = xs.astype(float), ys + t
+
+    return (np.concatenate([hx.ravel(), vx.ravel()]),
+            np.concatenate([hy.ravel(), vy.ravel()]))
+
+
+def segments(heights, level):
+    """Edge-id pairs (a, b) of every cell segment at level, saddles resolved."""
+    h = np.asarray(heights, dtype=float)
+    ny, nx = h.shape[0] - 1, h.shape[1] - 1
+    up = h >= level
+    case = (up[:-1, :-1] * 1 + up[:-1, 1:] * 2 + up[1:, 1:] * 4 + up[1:, :-1] * 8)
+
+    # Edge ids of each cell, by edge code
+    n_h = (ny + 1) * nx
+    ys, xs = np.indices((ny, nx))
+    ids = np.stack([
+        ys * nx + xs,                       # S
+        n_h + ys * (nx + 1) + xs + 1,       # E
+        (ys + 1) * nx + xs,                 # N
+        n_h + ys * (nx + 1) + xs,           # W
+    ])
+
+    first, second = [], []
+    for code, pairs in SEGMENTS.items():
+        sel = case == code
+        if sel.any():
+            (a, b), = pairs
+            first.append(ids[a][sel])
+            second.append(ids[b][sel])
+    centre = (h[:-1, :-1] + h[:-1, 1:] + h[1:, 1:] + h[1:, :-1]) / 4 >= level
+    for code, options in SADDLES.items():
+        for above, pairs in ((False, options[0]), (True, options[1])):
+            sel = (case == code) & (centre == above)
+            if sel.any():
+                for a, b in pairs:
+                    first.append(ids[a][sel])
+                    second.append(ids[b][sel])
+    if not first:
+        empty = np.empty(0, dtype=int)
+        return empty, empty
+    return np.concatenate(first), np.concatenate(second)
+
+
+def stitch(first, second):
+    """Join segments sharing an edge into chains of edge ids (closed: last == first)."""
+    links = defaultdict(list)
+    for a, b in zip(first.tolist(), second.tolist()):
+        links[a].append(b)
+        links[b].append(a)
+
+    seen = set()
+    chains = []
+
+    def walk(start):
+        chain = [start]
+        seen.add(start)
+        cur = start
+        while True:
+            nxt = next((n for n in links[cur] if n not in seen), None)
+            if nxt is None:
+                if len(chain) > 2 and start in links[cur]:
+                    chain.append(start)
+                return chain
+            chain.append(nxt)
+            seen.add(nxt)
+            cur = nxt
+
+    # Open lines start at a border edge (one link); what is left are loops.
+    for node in sorted(links):
+        if len(links[node]) == 1 and node not in seen:
+            chains.append(walk(node))
+    for node in sorted(links):
+        if node not in seen:
+            chains.append(walk(node))
+    return chains
+
+
+def isolines(heights, level):
+    """Contour polylines of heights at level: a list of (n, 2) arrays of (x, y)."""
+    h = np.asarray(heights, dtype=float)
+    first, second = segments(h, level)
+    if not len(first):
+        return []
+    px, py = _edge_points(h, level)
+    return [np.column_stack([px[chain], py[chain]]) for chain in stitch(first, second)]
+
+
+def contours(heights, levels):
+    """isolines() for each level."""
+    h = np.asarray(heights, dtype=float)
+    return [isolines(h, level) for level in levels]
+
+
+def is_closed(line):
+    return len(line) > 2 and line[0][0] == line[-1][0] and line[0][1] == line[-1][1]
@@ -0,0 +1,487 @@
+"""GEOMETRIA SACRED PATTERNS — Sub-visibility culling
+
+Many primitives cannot change a single pixel: halos and vignette rings at
+alpha 0.001, dots that land off the page, nebula dots under the event
+horizon that 046 paints again opaque on top. Poster canvases record their
+calls in a display list (gstate.canvas() wraps every canvas in a
+CullCanvas) and, on save(), replay only what can be seen. A primitive is
+dropped when
+
+    faint     alpha x pixel coverage x the largest possible contrast is
+              below `threshold` 8-bit levels: it cannot move a pixel
+              against any backdrop (coverage is the shape's area at
+              DPI, so a speck with a generous alpha is still faint)
+    offpage   its bounding box (grown by the stroke) misses the page
+    covered   a later opaque circle, ellipse or rect contains it, so it is
+              painted over whatever comes between (at most the antialiased
+              edge pixels change, towards the coverage of a single fill)
+
+State changes (colours, widths, saveState / transform pairs) are deferred
+until something is drawn with them, so a dropped primitive takes its
+`q ... cm ... Q` with it, and its setFillColor too unless something drawn
+later still runs under that colour. Forms and clipped drawing are
+replayed untouched.
+
+GEOMETRIA_CULL (inherited by worker processes, set by
+`python3 -m geometria render --cull ...`) is 'off' or the threshold in
+8-bit levels (default 0.5, i.e. below rounding). `render --instrument`
+reports what was culled per poster, along with the stacked glow loops
+(runs of concentric same-colour fills) that a radial shading could
+replace.
+"""
+
+import math
+import os
+from collections import Counter
+
+import numpy as np
+from reportlab.lib.colors import Color
+
+ENV = 'GEOMETRIA_CULL'
+DEFAULT = '0.5'
+DPI = 300            # coverage is measured on a print-resolution pixel
+GLOW_RUN = 8         # concentric fills in a row that count as a stacked glow
+
+PIXEL_AREA = (72 / DPI) ** 2
+IDENTITY = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+# Calls that change only the graphics state: deferred until something is drawn.
+STATE = ('setFillColor', 'setStrokeColor', 'setFillAlpha', 'setStrokeAlpha', 'setLineWidth',
+         'setFont', 'setDash', 'setLineJoin', 'setLineCap', 'setMiterLimit')
+# Calls answered by the wrapped canvas right away (they draw nothing).
+IMMEDIATE = ('beginPath', 'stringWidth', 'getPageNumber', 'getAvailableFonts')
+
+
+def parse(value):
+    """'off' or a threshold in 8-bit levels (>= 0)."""
+    value = (value or DEFAULT).strip().lower() or DEFAULT
+    if value == 'off':
+        return value
+    try:
+        levels = float(value)
+    except ValueError:
+        levels = -1
+    if not levels >= 0:
+        raise ValueError(f"unknown cull mode {value!r}; expected off or a threshold "
+                         f"in 8-bit levels such as 0.5")
+    return levels
+
+
+def mode():
+    """Normalised mode for the build fingerprint."""
+    return str(parse(os.environ.get(ENV)))
+
+
+def set_mode(value):
+    """Select the mode for this process and every worker started after it."""
+    parse(value)
+    os.environ[ENV] = str(value)
+
+
+def wrap(canvas):
+    """canvas behind a CullCanvas, or canvas itself when culling is off."""
+    sel = parse(os.environ.get(ENV))
+    if sel == 'off':
+        return canvas
+    return CullCanvas(canvas, threshold=sel)
+
+
+# ─── Geometry helpers ────────────────────────────────────
+
+def _multiply(m, n):
+    """Matrix n applied after m, in PDF (a b c d e f) form: m is the outer CTM."""
+    a, b, c, d, e, f = m
+    a2, b2, c2, d2, e2, f2 = n
+    return (a * a2 + c * b2, b * a2 + d * b2,
+            a * c2 + c * d2, b * c2 + d * d2,
+            a * e2 + c * f2 + e, b * e2 + d * f2 + f)
+
+
+def _apply(m, box):
+    """Bounding box of box (x0, y0, x1, y1) under matrix m."""
+    if m == IDENTITY:
+        return box
+    a, b, c, d, e, f = m
+    x0, y0, x1, y1 = box
+    xs = [a * x + c * y + e for x, y in ((x0, y0), (x0, y1), (x1, y0), (x1, y1))]
+    ys = [b * x + d * y + f for x, y in ((x0, y0), (x0, y1), (x1, y0), (x1, y1))]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def _path_box(code):
+    """Bounding box of a PDFPathObject's code (control points bound the curves)."""
+    xs, ys = [], []
+    for op in code:
+        parts = op.split()
+        if len(parts) < 3:
+            continue
+        nums = [float(v) for v in parts[:-1]]
+        if parts[-1] == 're':
+            x, y, w, h = nums
+            xs += [x, x + w]
+            ys += [y, y + h]
+        else:
+            xs += nums[0::2]
+            ys += nums[1::2]
+    if not xs:
+        return None
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def _contrast(color):
+    """Largest change one unit of alpha of this colour can make to any channel."""
+    if isinstance(color, Color):
+        return max(max(v, 1 - v) for v in (color.red, color.green, color.blue))
+    return 1.0
+
+
+# ─── Display list ────────────────────────────────────────
+
+class CullCanvas:
+    """Proxy for a Canvas that records calls and replays the visible ones on save()."""
+
+    def __init__(self, inner, threshold=0.5):
+        self._canvas = inner
+        self.threshold = threshold
+        self.culled = Counter()        # reason -> primitives dropped
+        self.primitives = 0
+        self.dropped_states = 0
+        self.glow_stacks = 0
+        self.glow_fills = 0
+        self._forms = set()
+        self._reset()
+        target = inner
+        while target is not None:      # instrument.InstrumentedCanvas reports the culling
+            if 'cull' in vars(target):
+                target.cull = self
+                break
+            target = vars(target).get('_canvas')
+
+    def _reset(self):
+        self._records = []             # (name, args, kwargs)
+        self._meta = []                # per record: None, or (box, visible, shape, opaque, disc)
+        self._fill = (None, 1.0)       # (colour, alpha) in effect
+        self._stroke = (None, 1.0)
+        self._width = 1.0
+        self._ctm = IDENTITY
+        self._clipped = False
+        self._stack = []
+        self._form = 0                 # > 0 while recording a form
+
+    def __getattr__(self, name):
+        attr = getattr(self._canvas, name)
+        if not callable(attr) or name in IMMEDIATE:
+            return attr
+
+        def recorded(*args, **kwargs):
+            self._record(name, args, kwargs)
+        self.__dict__[name] = recorded
+        return recorded
+
+    def _record(self, name, args, kwargs, meta=None):
+        self._records.append((name, args, kwargs))
+        self._meta.append(meta)
+
+    # ─── Tracked state ───────────────────────────────────
+
+    def setFillColor(self, aColor, alpha=None):
+        self._fill = self._color(self._fill, aColor, alpha)
+        self._record('setFillColor', (aColor, alpha), {})
+
+    def setStrokeColor(self, aColor, alpha=None):
+        self._stroke = self._color(self._stroke, aColor, alpha)
+        self._record('setStrokeColor', (aColor, alpha), {})
+
+    @staticmethod
+    def _color(current, color, alpha):
+        if alpha is None:
+            alpha = getattr(color, 'alpha', None)
+        return color, current[1] if alpha is None else alpha
+
+    def setFillAlpha(self, a):
+        self._fill = (self._fill[0], a)
+        self._record('setFillAlpha', (a,), {})
+
+    def setStrokeAlpha(self, a):
+        self._stroke = (self._stroke[0], a)
+        self._record('setStrokeAlpha', (a,), {})
+
+    def setLineWidth(self, width):
+        self._width = width
+        self._record('setLineWidth', (width,), {})
+
+    def saveState(self):
+        self._stack.append((self._fill, self._stroke, self._width, self._ctm, self._clipped))
+        self._record('saveState', (), {})
+
+    def restoreState(self):
+        if self._stack:
+            self._fill, self._stroke, self._width, self._ctm, self._clipped = self._stack.pop()
+        self._record('restoreState', (), {})
+
+    def transform(self, a, b, c, d, e, f):
+        self._ctm = _multiply(self._ctm, (a, b, c, d, e, f))
+        self._record('transform', (a, b, c, d, e, f), {})
+
+    def translate(self, dx, dy):
+        self.transform(1, 0, 0, 1, dx, dy)
+
+    def scale(self, x, y):
+        self.transform(x, 0, 0, y, 0, 0)
+
+    def rotate(self, theta):
+        t = math.radians(theta)
+        self.transform(math.cos(t), math.sin(t), -math.sin(t), math.cos(t), 0, 0)
+
+    def clipPath(self, *args, **kwargs):
+        self._clipped = True
+        self._record('clipPath', args, kwargs)
+
+    def beginForm(self, name, *args, **kwargs):
+        self._forms.add(name)
+        self._form += 1
+        self._stack.append((self._fill, self._stroke, self._width, self._ctm, self._clipped))
+        self._record('beginForm', (name,) + args, kwargs)
+
+    def endForm(self, *args, **kwargs):
+        self._form -= 1
+        self._fill, self._stroke, self._width, self._ctm, self._clipped = self._stack.pop()
+        self._record('endForm', args, kwargs)
+
+    def hasForm(self, name):
+        return name in self._forms or self._canvas.hasForm(name)
+
+    # ─── Primitives ──────────────────────────────────────
+
+    def _visible(self, fill, stroke, area, width):
+        """Largest 8-bit change the primitive can make to a pixel."""
+        v = 0.0
+        if fill:
+            color, alpha = self._fill
+            v = max(v, alpha * min(1.0, area / PIXEL_AREA) * _contrast(color))
+        if stroke:
+            color, alpha = self._stroke
+            v = max(v, alpha * min(1.0, width * DPI / 72) * _contrast(color))
+        return v * 255
+
+    def _primitive(self, name, args, kwargs, box, fill, stroke, area, shape=None, reach=None):
+        if self._form or self._clipped:
+            return self._record(name, args, kwargs)
+        if stroke:
+            grow = self._width * (reach or 1)
+            box = (box[0] - grow, box[1] - grow, box[2] + grow, box[3] + grow)
+        scale = abs(self._ctm[0] * self._ctm[3] - self._ctm[1] * self._ctm[2])
+        visible = self._visible(fill, stroke, area * scale, self._width * math.sqrt(scale))
+        opaque = (self._ctm == IDENTITY and fill and self._fill[1] >= 1
+                  and isinstance(self._fill[0], Color))
+        box = _apply(self._ctm, box)
+        if shape is not None and shape[0] == 'ellipse' and self._ctm == IDENTITY:
+            disc = (shape[1], shape[2], max(shape[3], shape[4]) + (box[2] - box[0]) / 2 - shape[3])
+        else:
+            disc = ((box[0] + box[2]) / 2, (box[1] + box[3]) / 2,
+                    math.hypot(box[2] - box[0], box[3] - box[1]) / 2)
+        self._record(name, args, kwargs, (box, visible, shape, opaque, disc))
+
+    def circle(self, x_cen, y_cen, r, stroke=1, fill=0):
+        self._primitive('circle', (x_cen, y_cen, r, stroke, fill), {},
+                        (x_cen - r, y_cen - r, x_cen + r, y_cen + r), fill, stroke,
+                        math.pi * r * r, ('ellipse', x_cen, y_cen, abs(r), abs(r)))
+
+    def ellipse(self, x1, y1, x2, y2, stroke=1, fill=0):
+        rx, ry = abs(x2 - x1) / 2, abs(y2 - y1) / 2
+        self._primitive('ellipse', (x1, y1, x2, y2, stroke, fill), {},
+                        (min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2)), fill, stroke,
+                        math.pi * rx * ry, ('ellipse', (x1 + x2) / 2, (y1 + y2) / 2, rx, ry))
+
+    def rect(self, x, y, width, height, stroke=1, fill=0):
+        box = (min(x, x + width), min(y, y + height), max(x, x + width), max(y, y + height))
+        self._primitive('rect', (x, y, width, height, stroke, fill), {}, box, fill, stroke,
+                        abs(width * height), ('rect',) + box)
+
+    def line(self, x1, y1, x2, y2):
+        self._primitive('line', (x1, y1, x2, y2), {},
+                        (min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2)), 0, 1, 0.0)
+
+    def drawPath(self, aPath, stroke=1, fill=0, **kwargs):
+        code = list(aPath._code)
+        aPath._code = code                 # later edits to the path must not reach the record
+        box = _path_box(code)
+        if box is None:
+            return self._record('drawPath', (aPath, stroke, fill), kwargs)
+        area = (box[2] - box[0]) * (box[3] - box[1])
+        # miter joins can reach MiterLimit (10) half-widths past a vertex
+        self._primitive('drawPath', (aPath, stroke, fill), kwargs, box, fill, stroke, area,
+                        reach=5)
+
+    def doForm(self, name):
+        # forms drawn here (dots' unit circle, glows) paint with the caller's fill
+        box = (-1.0, -1.0, 1.0, 1.0)
+        self._primitive('doForm', (name,), {}, box, 1, 0, 4.0)
+
+    # ─── Culling and replay ──────────────────────────────
+
+    def _cull(self):
+        """Reason each record is dropped for, or None."""
+        reasons = [None] * len(self._records)
+        prims = [i for i, m in enumerate(self._meta) if m is not None]
+        self.primitives += len(prims)
+        if not prims:
+            return reasons
+        boxes = np.array([self._meta[i][0] for i in prims], dtype=float)
+        discs = np.array([self._meta[i][4] for i in prims], dtype=float)
+        visible = np.array([self._meta[i][1] for i in prims])
+        width, height = self._canvas._pagesize
+        faint = visible < self.threshold
+        offpage = ~faint & ((boxes[:, 2] < 0) | (boxes[:, 0] > width)
+                            | (boxes[:, 3] < 0) | (boxes[:, 1] > height))
+        covered = np.zeros(len(prims), dtype=bool)
+        order = np.array(prims)
+        for k, i in enumerate(prims):
+            _, _, occ, opaque, _ = self._meta[i]
+            if occ is None or not opaque:
+                continue
+            earlier = slice(0, k)
+            x0, y0, x1, y1 = (boxes[earlier, j] for j in range(4))
+            if occ[0] == 'rect':
+                _, ox0, oy0, ox1, oy1 = occ
+                inside = (x0 >= ox0) & (y0 >= oy0) & (x1 <= ox1) & (y1 <= oy1)
+            else:
+                _, cx, cy, rx, ry = occ
+                if rx <= 0 or ry <= 0:
+                    continue
+                inside = np.ones(k, dtype=bool)
+                for px, py in ((x0, y0), (x0, y1), (x1, y0), (x1, y1)):
+                    inside &= ((px - cx) / rx) ** 2 + ((py - cy) / ry) ** 2 <= 1
+                if rx == ry:          # a round shape inside a circle: compare bounding discs
+                    dx, dy, dr = (discs[earlier, j] for j in range(3))
+                    inside |= np.hypot(dx - cx, dy - cy) + dr <= rx
+            covered[earlier] |= inside
+        covered &= ~faint & ~offpage
+        for reason, mask in (('faint', faint), ('offpage', offpage), ('covered', covered)):
+            for i in order[mask].tolist():
+                reasons[i] = reason
+            self.culled[reason] += int(mask.sum())
+        return reasons
+
+    def _count_glows(self):
+        """Runs of concentric same-colour filled circles / ellipses."""
+        run, last = 0, None
+        for (name, args, _), meta in zip(self._records, self._meta):
+            if meta is None:
+                continue
+            key = None
+            shape = meta[2]
+            if shape is not None and shape[0] == 'ellipse' and args[-1] and not args[-2]:
+                key = (round(shape[1], 3), round(shape[2], 3))
+            if key is not None and key == last:
+                run += 1
+            else:
+                if run >= GLOW_RUN:
+                    self.glow_stacks += 1
+                    self.glow_fills += run
+                run = 1 if key is not None else 0
+            last = key
+        if run >= GLOW_RUN:
+            self.glow_stacks += 1
+            self.glow_fills += run
+
+    def _replay(self, page_end=True):
+        """Write the visible records to the wrapped canvas.
+
+        At the end of a page the state changes nothing was drawn with are
+        dropped and the tracked state starts over. Otherwise (a text object
+        is about to read the live state) they are written out, and the
+        tracked CTM and save stack carry on into the next records.
+        """
+        target = self._canvas
+        reasons = self._cull()
+        self._count_glows()
+        pending = []          # deferred (name, args, kwargs)
+        opened = []           # per open saveState: its index in pending, or None once written
+
+        def flush():
+            for name, args, kwargs in pending:
+                getattr(target, name)(*args, **kwargs)
+            pending.clear()
+            opened[:] = [None] * len(opened)
+
+        for (name, args, kwargs), reason in zip(self._records, reasons):
+            if reason is not None:
+                continue
+            if name == 'saveState':
+                opened.append(len(pending))
+                pending.append((name, args, kwargs))
+            elif name == 'restoreState':
+                start = opened.pop() if opened else None
+                if start is not None:           # nothing drawn inside: drop the pair
+                    self.dropped_states += len(pending) - start - 1
+                    del pending[start:]
+                else:                           # changes since the last draw die here
+                    self.dropped_states += len(pending)
+                    pending.clear()
+                    target.restoreState()
+            elif name in STATE or name == 'transform':
+                if name in STATE and self._supersedes(args):
+                    for k in range(len(pending) - 1, -1, -1):
+                        if pending[k][0] == 'saveState':
+                            break
+                        if pending[k][0] == name:
+                            del pending[k]
+                            self.dropped_states += 1
+                            break
+                pending.append((name, args, kwargs))
+            else:
+                flush()
+                getattr(target, name)(*args, **kwargs)
+        if not page_end:
+            flush()
+            self._records, self._meta = [], []
+            return
+        self.dropped_states += len(pending)
+        self._reset()
+
+    @staticmethod
+    def _supersedes(args):
+        """Whether a state call replaces an earlier call of the same method outright."""
+        if len(args) == 2 and args[1] is None:      # setFillColor / setStrokeColor
+            return getattr(args[0], 'alpha', None) is not None
+        return True
+
+    def beginText(self, *args, **kwargs):
+        self._replay(page_end=False)     # text objects read the live font state and CTM
+        return self._canvas.beginText(*args, **kwargs)
+
+    def showPage(self):
+        self._replay()
+        self._canvas.showPage()
+
+    def save(self):
+        self._replay()
+        self._canvas.save()
+
+    # ─── Reporting ───────────────────────────────────────
+
+    def summary(self):
+        """Primitives seen and culled so far, by reason."""
+        return {
+            'threshold': self.threshold,
+            'primitives': self.primitives,
+            'culled': sum(self.culled.values()),
+            'by_reason': {r: self.culled[r] for r in ('faint', 'offpage', 'covered')},
+            'dropped_states': self.dropped_states,
+            'glow_stacks': self.glow_stacks,
+            'glow_fills': self.glow_fills,
+        }
+
+
+def format_table(rows):
+    """Console table of (key, cull summary) pairs, most culled first."""
+    lines = [f"{'item':>6} {'prims':>8} {'faint':>7} {'offpage':>7} {'covered':>7} "
+             f"{'culled%':>7} {'states':>7} {'glows':>6} {'fills':>6}"]
+    for key, s in sorted(rows, key=lambda r: r[1]['culled'], reverse=True):
+        r = s['by_reason']
+        pct = 100 * s['culled'] / s['primitives'] if s['primitives'] else 0.0
+        lines.append(f"{key:>6} {s['primitives']:8d} {r['faint']:7d} {r['offpage']:7d} "
+                     f"{r['covered']:7d} {pct:7.1f} {s['dropped_states']:7d} "
+                     f"{s['glow_stacks']:6d} {s['glow_fills']:6d}")
+    return '\n'.join(lines)
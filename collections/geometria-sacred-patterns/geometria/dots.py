@@ -0,0 +1,151 @@
+"""GEOMETRIA SACRED PATTERNS — Batched dot clouds
+
+Star fields, the galaxy arms and the orbital clouds are thousands of small
+filled circles, each drawn as setFillColor(Color(...)) + c.circle(): four
+Bézier curves and often a state change per dot. fill() takes the cloud as
+arrays instead:
+
+    dots.fill(c, xs, ys, radii, rgb=(0.9, 0.9, 1), alpha=alphas)
+
+Colour and alpha are quantized into `buckets` levels over their range in
+the cloud (as in polyline, GEOMETRIA_BUCKETS; 0, the default, keeps exact
+colours, one bin per distinct style), dots are grouped by bin in
+order of first appearance, and each bin costs one state change. Dots of
+the same colour composite the same in any order, so for one-colour clouds
+the regrouping is invisible.
+
+GEOMETRIA_DOTS (inherited by worker processes, set by
+`python3 -m geometria render --dots ...`) selects how a bin is written:
+
+    form     one unit circle as a Form XObject, placed per dot with
+             `q r 0 0 r x y cm /dot Do Q` (the default): about a quarter
+             of the bytes of a circle, and overlapping dots still build up
+    path     every dot of a bin as a subpath of one filled path; fewest
+             operators, but overlapping dots of a bin are painted once
+             (non-zero winding: overlaps are filled, not knocked out)
+    off      one setFillColor + circle() per dot, exact styles, in order
+
+Given a raster.Layer (from raster.layer()) instead of a canvas, fill()
+hands it the arrays as they are: no bins, exact colours, in order.
+"""
+
+import os
+
+import numpy as np
+from reportlab.lib.colors import Color
+from reportlab.pdfgen.canvas import FILL_NON_ZERO
+
+from geometria import polyline, raster
+
+ENV = 'GEOMETRIA_DOTS'
+DEFAULT = 'form'
+MODES = ('form', 'path', 'off')
+
+FORM = 'dot'
+
+
+def parse(value):
+    """'form', 'path' or 'off'."""
+    value = (value or DEFAULT).strip().lower() or DEFAULT
+    if value not in MODES:
+        raise ValueError(f"unknown dots mode {value!r}; expected {', '.join(MODES)}")
+    return value
+
+
+def mode():
+    """Normalised mode for the build fingerprint."""
+    return parse(os.environ.get(ENV))
+
+
+def set_mode(value):
+    """Select the mode for this process and every worker started after it."""
+    parse(value)
+    os.environ[ENV] = str(value)
+
+
+def _per_dot(values, m, name):
+    a = np.asarray(values, dtype=float)
+    if name == 'rgb':
+        a = np.broadcast_to(a, (m, 3)) if a.ndim == 1 else a
+    else:
+        a = np.broadcast_to(a, (m,)) if a.ndim == 0 else a
+    if len(a) != m:
+        raise ValueError(f'{name} has {len(a)} entries for {m} dots')
+    return a
+
+
+def bins(rgb, alpha, n=None):
+    """Group dots by quantized (r, g, b, alpha).
+
+    Returns a list of ((r, g, b, alpha), indices), bins in order of their
+    first dot and indices in drawing order.
+    """
+    n = polyline.buckets() if n is None else n
+    quantized = [polyline.quantize(col, n) for col in (rgb[:, 0], rgb[:, 1], rgb[:, 2], alpha)]
+    keys = np.stack([idx for idx, _ in quantized], axis=1)
+    _, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    order = np.argsort(inverse, kind='stable')
+    groups = np.split(order, np.cumsum(np.bincount(inverse))[:-1])
+    out = []
+    for b in np.argsort(first, kind='stable').tolist():
+        a = first[b]
+        out.append((tuple(float(levels[idx[a]]) for idx, levels in quantized), groups[b]))
+    return out
+
+
+def _form(c):
+    """Define the unit-circle Form XObject on c's document once; return its name."""
+    if not c.hasForm(FORM):
+        c.beginForm(FORM, -1, -1, 1, 1)
+        c.circle(0, 0, 1, stroke=0, fill=1)   # no colour of its own: uses the caller's fill
+        c.endForm()
+    return FORM
+
+
+def fill(c, xs, ys, radii, rgb=(1, 1, 1), alpha=1.0, buckets=None):
+    """Fill a circle of radius radii[i] at (xs[i], ys[i]) for every dot.
+
+    radii, rgb ((3,) or one row per dot) and alpha may be scalars or
+    per-dot arrays. Returns the number of state changes (bins) written.
+    """
+    xs = np.asarray(xs, dtype=float)
+    m = len(xs)
+    if m == 0:
+        return 0
+    if isinstance(c, raster.Layer):
+        c.dots(xs, ys, _per_dot(radii, m, 'radii'), _per_dot(rgb, m, 'rgb'),
+               _per_dot(alpha, m, 'alpha'))
+        return 1
+    ys = np.asarray(ys, dtype=float).tolist()
+    radii = _per_dot(radii, m, 'radii').tolist()
+    rgb = _per_dot(rgb, m, 'rgb')
+    alpha = _per_dot(alpha, m, 'alpha')
+    xs = xs.tolist()
+    sel = mode()
+
+    if sel == 'off':
+        for (r, g, b), a, x, y, rad in zip(rgb.tolist(), alpha.tolist(), xs, ys, radii):
+            c.setFillColor(Color(r, g, b, alpha=a))
+            c.circle(x, y, rad, fill=1, stroke=0)
+        return m
+
+    groups = bins(rgb, alpha, buckets)
+    name = _form(c) if sel == 'form' else None
+    for (r, g, b, a), idx in groups:
+        c.setFillColor(Color(r, g, b, alpha=a))
+        if name is None:
+            p = c.beginPath()
+            for i in idx.tolist():
+                p.circle(xs[i], ys[i], radii[i])
+            c.drawPath(p, fill=1, stroke=0, fillMode=FILL_NON_ZERO)   # overlaps stay filled
+            continue
+        for i in idx.tolist():
+            rad = radii[i]
+            if rad <= 0:
+                continue                      # a singular cm; circle() drew nothing either
+            c.saveState()
+            c.transform(rad, 0, 0, rad, xs[i], ys[i])
+            c.doForm(name)
+            c.restoreState()
+    return len(groups)
@@ -0,0 +1,129 @@
+"""GEOMETRIA SACRED PATTERNS — Escape-time engine
+
+Iterates z → z² + c over a whole grid at once with NumPy. Only the pixels
+that have not escaped yet are kept in the working arrays, so late
+iterations cost as much as the pixels still left on the fractal boundary:
+
+    esc = escape.julia(complex(-0.7, 0.27015), res=350, max_iter=80)
+    for ix, iy in zip(*np.nonzero(esc.escaped)):
+        t = esc.counts[ix, iy] / esc.max_iter
+
+Arrays are indexed [ix, iy], with ix along the real axis, as the old
+per-pixel loops were. Pixel (ix, iy) samples
+
+    re = center.real + (ix / nx - 0.5) * span_x
+    im = center.imag + (iy / ny - 0.5) * span_y
+
+and the arithmetic per step matches the scalar loop, so counts are
+identical to the pure-Python version.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass
+class Escape:
+    counts: np.ndarray     # iterations done before |z| reached the bailout (int32)
+    smooth: np.ndarray     # continuous count n + 1 - log2(log|z|) (escaped pixels only),
+                           # or None unless the iteration ran with smooth=True
+    escaped: np.ndarray    # bool mask
+    max_iter: int
+
+    @property
+    def t(self):
+        """counts / max_iter, the 0..1 value the posters colour by."""
+        return self.counts / self.max_iter
+
+    @property
+    def potential(self):
+        """Smooth count normalised to 0..1; 1.0 inside the set (needs smooth=True)."""
+        if self.smooth is None:
+            raise ValueError('potential needs the smooth count; iterate with smooth=True')
+        p = np.ones(self.counts.shape)
+        p[self.escaped] = np.clip(self.smooth[self.escaped] / self.max_iter, 0.0, 1.0)
+        return p
+
+
+def grid(res, center=0j, span=3.0):
+    """Real and imaginary sample coordinates, shape (nx, ny) each."""
+    nx, ny = (res, res) if np.isscalar(res) else res
+    sx, sy = (span, span * ny / nx) if np.isscalar(span) else span
+    re = (np.arange(nx) / nx - 0.5) * sx + center.real
+    im = (np.arange(ny) / ny - 0.5) * sy + center.imag
+    return np.meshgrid(re, im, indexing='ij')
+
+
+def iterate(zr, zi, cr, ci, max_iter=80, bailout=2.0, smooth=False):
+    """Escape-time iteration of z → z² + c for arrays of starting z and c.
+
+    cr / ci are scalars (Julia) or arrays shaped like zr (Mandelbrot).
+    """
+    shape = zr.shape
+    n = zr.size
+    counts = np.full(n, max_iter, dtype=np.int32)
+    nu = np.zeros(n)
+    escaped = np.zeros(n, dtype=bool)
+    limit = bailout * bailout
+
+    idx = np.arange(n)
+    zr = zr.ravel().astype(float)
+    zi = zi.ravel().astype(float)
+    per_pixel = not np.isscalar(cr)
+    if per_pixel:
+        cr = np.broadcast_to(cr, shape).ravel().astype(float)
+        ci = np.broadcast_to(ci, shape).ravel().astype(float)
+
+    # Pixels that start outside the bailout never iterate.
+    keep = zr*zr + zi*zi < limit
+    out = ~keep
+    counts[idx[out]] = 0
+    escaped[idx[out]] = True
+    if smooth:
+        nu[idx[out]] = _smooth(0, zr[out], zi[out])
+    idx, zr, zi = idx[keep], zr[keep], zi[keep]
+    if per_pixel:
+        cr, ci = cr[keep], ci[keep]
+
+    for it in range(1, max_iter + 1):
+        if not idx.size:
+            break
+        zr, zi = zr*zr - zi*zi + cr, 2*zr*zi + ci
+        mag = zr*zr + zi*zi
+        keep = mag < limit
+        if keep.all():
+            continue
+        out = ~keep
+        done = idx[out]
+        counts[done] = it
+        escaped[done] = True
+        if smooth:
+            nu[done] = _smooth(it, zr[out], zi[out])
+        idx, zr, zi = idx[keep], zr[keep], zi[keep]
+        if per_pixel:
+            cr, ci = cr[keep], ci[keep]
+
+    # A pixel that escapes on the very last step still counts as inside,
+    # exactly like `while ... and iteration < max_iter` did.
+    escaped &= counts < max_iter
+    return Escape(counts.reshape(shape), nu.reshape(shape) if smooth else None,
+                  escaped.reshape(shape), max_iter)
+
+
+def _smooth(n, zr, zi):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_mod = 0.5 * np.log(zr*zr + zi*zi)
+        return np.nan_to_num(n + 1 - np.log2(np.maximum(log_mod, 1e-12)), nan=float(n))
+
+
+def julia(c, res, center=0j, span=3.0, max_iter=80, bailout=2.0, smooth=False):
+    """Julia set of z² + c over the window given by center and span."""
+    zr, zi = grid(res, center, span)
+    return iterate(zr, zi, c.real, c.imag, max_iter, bailout, smooth)
+
+
+def mandelbrot(res, center=-0.5+0j, span=3.0, max_iter=80, bailout=2.0, smooth=False):
+    """Mandelbrot set: z starts at 0 and c is the pixel."""
+    cr, ci = grid(res, center, span)
+    return iterate(np.zeros_like(cr), np.zeros_like(ci), cr, ci, max_iter, bailout, smooth)
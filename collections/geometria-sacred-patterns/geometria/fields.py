@@ -0,0 +1,137 @@
+"""GEOMETRIA SACRED PATTERNS — Scalar field sampling
+
+Chladni plates (016), two-source interference (025) and membrane modes (037)
+all evaluate an expression at every point of a grid, skip points outside a
+circle or rectangle and keep the ones whose |value| passes a threshold.
+Sampler does the same over NumPy coordinate arrays in one pass:
+
+    s = fields.Sampler.square(res).within(r2=0.95)      # x, y on [-1, 1)
+    vals = s.evaluate(lambda s, n, m: np.sin(n*pi*s.x) * np.sin(m*pi*s.y) - ...,
+                      n=[2, 3, 4, 5], m=[3, 5, 7, 6])  # one row per mode
+    for pts in s.threshold(vals, below=0.06):           # one Points per mode
+        for x, y, val in pts.rows():
+            ...
+
+Coordinates are built exactly as the old loops built them
+((i / res - 0.5) * 2, or start + i / n * size) and survivors come back in
+the same ix-major order, so posters keep drawing in the same sequence.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+def centered(n, scale=2.0):
+    """(i / n - 0.5) * scale for i in range(n): the [-1, 1) axis of most posters."""
+    return (np.arange(n) / n - 0.5) * scale
+
+
+def linear(n, start, size):
+    """start + i / n * size for i in range(n)."""
+    return start + np.arange(n) / n * size
+
+
+def distance(s, point):
+    """Distance from each sample to point = (x, y)."""
+    return np.hypot(s.x - point[0], s.y - point[1])
+
+
+@dataclass
+class Points:
+    """Compact survivors of a threshold: parallel arrays."""
+    ix: np.ndarray
+    iy: np.ndarray
+    x: np.ndarray
+    y: np.ndarray
+    value: np.ndarray
+
+    def __len__(self):
+        return len(self.x)
+
+    def rows(self):
+        """(x, y, value) tuples of Python floats, in grid order."""
+        return zip(self.x.tolist(), self.y.tolist(), self.value.tolist())
+
+
+class Sampler:
+    """Flattened grid samples (ix-major) with an optional mask already applied."""
+
+    def __init__(self, xs, ys, ix=None, iy=None):
+        self.xs = np.asarray(xs, dtype=float)
+        self.ys = np.asarray(ys, dtype=float)
+        if ix is None:
+            ix, iy = np.divmod(np.arange(self.xs.size * self.ys.size), self.ys.size)
+        self.ix, self.iy = ix, iy
+        self.x = self.xs[ix]
+        self.y = self.ys[iy]
+        self._r2 = self._r = self._theta = None
+
+    @classmethod
+    def square(cls, res, scale=2.0):
+        """res × res samples on [-scale/2, scale/2)."""
+        axis = centered(res, scale)
+        return cls(axis, axis)
+
+    def __len__(self):
+        return len(self.x)
+
+    @property
+    def r2(self):
+        if self._r2 is None:
+            self._r2 = self.x*self.x + self.y*self.y
+        return self._r2
+
+    @property
+    def r(self):
+        if self._r is None:
+            self._r = np.sqrt(self.r2)
+        return self._r
+
+    @property
+    def theta(self):
+        if self._theta is None:
+            self._theta = np.arctan2(self.y, self.x)
+        return self._theta
+
+    # ─── Masks ───────────────────────────────────────────
+
+    def keep(self, mask):
+        """A new Sampler with only the samples where mask is true."""
+        sel = np.nonzero(mask)[0]
+        return Sampler(self.xs, self.ys, self.ix[sel], self.iy[sel])
+
+    def within(self, radius=None, r2=None):
+        """Samples inside a circle about the origin, given r (r <= radius) or r² (x²+y² <= r2)."""
+        if r2 is not None:
+            return self.keep(self.r2 <= r2)
+        return self.keep(self.r <= radius)
+
+    def rect(self, x0, y0, x1, y1):
+        """Samples inside the rectangle [x0, x1] × [y0, y1]."""
+        return self.keep((self.x >= x0) & (self.x <= x1) & (self.y >= y0) & (self.y <= y1))
+
+    # ─── Evaluation ──────────────────────────────────────
+
+    def evaluate(self, func, **modes):
+        """func(sampler, **params) over all samples.
+
+        Each keyword is a sequence of per-mode parameters; they are passed as
+        (modes, 1) columns so the result has one row per mode. Without
+        keywords the result is 1-D.
+        """
+        params = {k: np.asarray(v)[:, None] for k, v in modes.items()}
+        return np.asarray(func(self, **params), dtype=float)
+
+    def threshold(self, values, below=None, above=None):
+        """Points where |value| < below and/or |value| > above (one per row if 2-D)."""
+        if values.ndim == 2:
+            return [self.threshold(row, below, above) for row in values]
+        mag = np.abs(values)
+        mask = np.ones(values.shape, dtype=bool)
+        if below is not None:
+            mask &= mag < below
+        if above is not None:
+            mask &= mag > above
+        sel = np.nonzero(mask)[0]
+        return Points(self.ix[sel], self.iy[sel], self.x[sel], self.y[sel], values[sel])
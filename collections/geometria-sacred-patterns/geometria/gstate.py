@@ -0,0 +1,209 @@
+"""GEOMETRIA SACRED PATTERNS — Graphics-state deduplication
+
+Nearly every primitive in the generators is preceded by
+setFillColor(Color(..., alpha=...)) or setStrokeColor with a fresh Color.
+ReportLab writes an `rg` / `RG` operator for each call even when the colour
+is already in effect, and every distinct float alpha becomes its own
+ExtGState. Poster canvases are created through this module instead:
+
+    c = gstate.canvas(poster_path(31), pagesize=A3)
+
+and come back wrapped in a StateCanvas that tracks the fill, stroke, line
+width and font in effect (through saveState / restoreState), drops calls
+that would not change them and only sends the alpha when a colour differs
+from the current one by alpha alone. The page looks exactly the same.
+
+GEOMETRIA_GSTATE (inherited by worker processes, set by
+`python3 -m geometria render --gstate ...`) selects the mode:
+
+    off      plain ReportLab canvas
+    dedup    skip redundant state changes (the default)
+    N        dedup, and round RGB and alpha to N levels (256 is below what
+             an 8-bit display can show) so near-identical alphas share an
+             ExtGState; each level is written as the shortest decimal
+             inside it, so 0.4 stays 0.4 rather than 102/255
+
+`render --instrument` reports the operators and graphics states saved per
+poster.
+"""
+
+import os
+from collections import Counter
+
+from reportlab.lib.colors import Color
+from reportlab.pdfgen import canvas as rl_canvas
+
+from geometria import cull
+
+ENV = 'GEOMETRIA_GSTATE'
+DEFAULT = 'dedup'
+
+# PDF operator each tracked call emits, for the savings report
+OPERATORS = {'setFillColor': 'rg', 'setStrokeColor': 'RG', 'setLineWidth': 'w', 'setFont': 'Tf'}
+
+
+def parse(value):
+    """'off', 'dedup' or a number of quantization levels (>= 2)."""
+    value = (value or DEFAULT).strip().lower() or DEFAULT
+    if value in ('off', 'dedup'):
+        return value
+    if not value.isdigit() or int(value) < 2:
+        raise ValueError(f"unknown gstate mode {value!r}; expected off, dedup "
+                         f"or a number of levels such as 256")
+    return int(value)
+
+
+def mode():
+    """Normalised mode for the build fingerprint."""
+    return str(parse(os.environ.get(ENV)))
+
+
+def set_mode(value):
+    """Select the mode for this process and every worker started after it."""
+    parse(value)
+    os.environ[ENV] = str(value)
+
+
+def canvas(*args, **kwargs):
+    """A poster canvas: reportlab's Canvas(*args, **kwargs), wrapped unless the mode is off.
+
+    Canvas is looked up at call time, so instrument.instrumented() still
+    sees every canvas. cull.wrap() puts the culling display list in front.
+    """
+    inner = rl_canvas.Canvas(*args, **kwargs)
+    sel = parse(os.environ.get(ENV))
+    if sel != 'off':
+        inner = StateCanvas(inner, levels=0 if sel == 'dedup' else sel)
+    return cull.wrap(inner)
+
+
+class StateCanvas:
+    """Proxy for a Canvas that skips state changes to the value already in effect."""
+
+    def __init__(self, inner, levels=0):
+        self._canvas = inner
+        self.levels = levels
+        self.saved = Counter()       # PDF operator -> occurrences not written
+        self._state = {}
+        self._stack = []
+        self._colors = {}
+        self._levels = {}
+        self._alphas = set()         # (key, alpha) as requested
+        self._quantized = set()      # (key, alpha) as written
+        if hasattr(inner, 'gstate'):
+            inner.gstate = self      # instrument.InstrumentedCanvas reports the savings
+
+    def __getattr__(self, name):
+        attr = getattr(self._canvas, name)
+        if not callable(attr):
+            return attr
+        if name.startswith('setFill'):
+            drops = ('fill',)
+        elif name.startswith('setStroke'):
+            drops = ('stroke',)
+        elif name in ('drawText', 'showPage'):
+            drops = ('fill', 'stroke', 'width', 'font')   # text objects set their own colours
+        else:
+            self.__dict__[name] = attr
+            return attr
+
+        def forgetting(*args, **kwargs):
+            for key in drops:
+                self._state.pop(key, None)
+            if name == 'showPage':
+                self._stack = []
+            return attr(*args, **kwargs)
+        self.__dict__[name] = forgetting
+        return forgetting
+
+    # ─── Tracked state ───────────────────────────────────
+
+    def _quantize(self, v):
+        n = self.levels - 1
+        i = round(v * n)
+        q = self._levels.get(i)
+        if q is None:
+            centre = i / n
+            q = next(r for r in (round(centre, d) for d in range(1, 7))
+                     if abs(r - centre) <= 0.5 / n)
+            self._levels[i] = q = min(1.0, max(0.0, q))
+        return q
+
+    def _color(self, key, color, alpha):
+        """(r, g, b, a) to write for a colour call, or None for colours we do not track."""
+        if not isinstance(color, Color):
+            return None
+        a = color.alpha if alpha is None else alpha
+        if a is None:
+            a = 1
+        self._alphas.add((key, a))
+        if self.levels:
+            r, g, b, a = (self._quantize(v) for v in (color.red, color.green, color.blue, a))
+        else:
+            r, g, b = color.red, color.green, color.blue
+        self._quantized.add((key, a))
+        return r, g, b, a
+
+    def _set_color(self, key, method, alpha_method, color, alpha):
+        value = self._color(key, color, alpha)
+        if value is None:
+            self._state.pop(key, None)
+            return getattr(self._canvas, method)(color, alpha)
+        current = self._state.get(key)
+        op = OPERATORS[method]
+        if current == value:
+            self.saved[op] += 1
+            return None
+        self._state[key] = value
+        if current is not None and current[:3] == value[:3]:
+            self.saved[op] += 1
+            return getattr(self._canvas, alpha_method)(value[3])
+        if self.levels:
+            color = self._colors.get(value)
+            if color is None:
+                color = self._colors[value] = Color(*value[:3], alpha=value[3])
+            alpha = None
+        return getattr(self._canvas, method)(color, alpha)
+
+    def setFillColor(self, aColor, alpha=None):
+        return self._set_color('fill', 'setFillColor', 'setFillAlpha', aColor, alpha)
+
+    def setStrokeColor(self, aColor, alpha=None):
+        return self._set_color('stroke', 'setStrokeColor', 'setStrokeAlpha', aColor, alpha)
+
+    def setLineWidth(self, width):
+        if self._state.get('width') == width:
+            self.saved['w'] += 1
+            return None
+        self._state['width'] = width
+        return self._canvas.setLineWidth(width)
+
+    def setFont(self, psfontname, size, leading=None):
+        value = (psfontname, size, leading)
+        if self._state.get('font') == value:
+            self.saved['Tf'] += 1
+            return None
+        self._state['font'] = value
+        return self._canvas.setFont(psfontname, size, leading)
+
+    def saveState(self):
+        self._stack.append(dict(self._state))
+        return self._canvas.saveState()
+
+    def restoreState(self):
+        if self._stack:
+            self._state = self._stack.pop()
+        else:
+            self._state = {}
+        return self._canvas.restoreState()
+
+    # ─── Reporting ───────────────────────────────────────
+
+    def summary(self):
+        """Operators and ExtGStates saved so far."""
+        return {
+            'mode': 'dedup' if not self.levels else self.levels,
+            'saved_ops': sum(self.saved.values()),
+            'saved_by_op': dict(self.saved),
+            'saved_states': len(self._alphas) - len(self._quantized),
+        }
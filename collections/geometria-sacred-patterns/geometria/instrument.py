@@ -0,0 +1,167 @@
+"""GEOMETRIA SACRED PATTERNS — Instrumented canvas
+
+An opt-in proxy around reportlab.pdfgen.canvas.Canvas that counts every
+operator call, spots redundant state changes (setFillColor / setStrokeColor
+/ setLineWidth / setFont to the value already in effect) and splits a
+poster's time into three phases:
+
+    compute   Python work between canvas calls (geometry, colour maths, ...)
+    emit      time spent inside canvas calls building the content stream
+    save      c.save(): page compression and PDF serialisation
+
+    with instrumented() as canvases:
+        gen_031()
+    print(canvases[0].summary())
+
+While active, `canvas.Canvas(...)` returns an InstrumentedCanvas, so no
+generator code has to change; gstate.canvas() wraps the proxy and its
+savings (operators and ExtGStates not written) and what cull.CullCanvas
+dropped are reported alongside.
+"""
+
+import contextlib
+import json
+import os
+import time
+from collections import Counter
+
+from reportlab.pdfgen import canvas as rl_canvas
+
+# Operators shown in reports; every other method is still counted.
+KEY_OPS = ('circle', 'line', 'drawPath', 'setFillColor', 'setStrokeColor', 'setLineWidth')
+STATE_OPS = ('setFillColor', 'setStrokeColor', 'setLineWidth', 'setFont')
+
+_Canvas = rl_canvas.Canvas
+
+
+def _state_value(name, args, kwargs):
+    if name in ('setFillColor', 'setStrokeColor'):
+        col = args[0] if args else kwargs.get('aColor')
+        alpha = args[1] if len(args) > 1 else kwargs.get('alpha')
+        if hasattr(col, 'red'):
+            return (col.red, col.green, col.blue, col.alpha if alpha is None else alpha)
+        return (repr(col), alpha)
+    return tuple(args) + tuple(sorted(kwargs.items()))
+
+
+class InstrumentedCanvas:
+    """Proxy for a Canvas that times and counts every method call."""
+
+    def __init__(self, *args, **kwargs):
+        self._canvas = _Canvas(*args, **kwargs)
+        self.filename = args[0] if args else kwargs.get('filename')
+        self.calls = Counter()
+        self.redundant = Counter()
+        self.emit_s = 0.0
+        self.save_s = 0.0
+        self.compute_s = None
+        self.gstate = None           # set by a wrapping gstate.StateCanvas
+        self.cull = None             # set by a wrapping cull.CullCanvas
+        self.gstates = 0             # ExtGStates on the page, counted before save()
+        self._state = {}
+        self._stack = []
+        self._created = time.perf_counter()
+
+    def __getattr__(self, name):
+        attr = getattr(self._canvas, name)
+        if not callable(attr):
+            return attr
+
+        def timed(*args, **kwargs):
+            t0 = time.perf_counter()
+            self.calls[name] += 1
+            if name in STATE_OPS:
+                value = _state_value(name, args, kwargs)
+                if self._state.get(name) == value:
+                    self.redundant[name] += 1
+                self._state[name] = value
+            elif name == 'saveState':
+                self._stack.append(dict(self._state))
+            elif name == 'restoreState' and self._stack:
+                self._state = self._stack.pop()
+            result = attr(*args, **kwargs)
+            self.emit_s += time.perf_counter() - t0
+            return result
+        self.__dict__[name] = timed
+        return timed
+
+    def save(self):
+        t0 = time.perf_counter()
+        self.compute_s = t0 - self._created - self.emit_s
+        self.calls['save'] += 1
+        self.gstates = len(self._canvas._extgstate._c)
+        self._canvas.save()
+        self.save_s = time.perf_counter() - t0
+
+    # ─── Reporting ────────────────────────────────────────
+
+    @property
+    def bound(self):
+        """'compute' or 'emit', whichever phase dominates the render."""
+        compute = self.compute_s or 0.0
+        return 'compute' if compute >= self.emit_s + self.save_s else 'emit'
+
+    def summary(self):
+        state_calls = sum(self.calls[op] for op in STATE_OPS)
+        return {
+            'file': self.filename,
+            'compute_s': round(self.compute_s or 0.0, 4),
+            'emit_s': round(self.emit_s, 4),
+            'save_s': round(self.save_s, 4),
+            'bound': self.bound,
+            'calls': sum(self.calls.values()),
+            'ops': {op: self.calls[op] for op in KEY_OPS},
+            'redundant': dict(self.redundant),
+            'redundant_pct': round(100 * sum(self.redundant.values()) / state_calls, 1)
+            if state_calls else 0.0,
+            'gstates': self.gstates,
+            'gstate': self.gstate.summary() if self.gstate is not None else None,
+            'cull': self.cull.summary() if self.cull is not None else None,
+        }
+
+
+@contextlib.contextmanager
+def instrumented():
+    """Make canvas.Canvas(...) build InstrumentedCanvas proxies.
+
+    Yields the list the created canvases are appended to.
+    """
+    created = []
+
+    def factory(*args, **kwargs):
+        proxy = InstrumentedCanvas(*args, **kwargs)
+        created.append(proxy)
+        return proxy
+
+    rl_canvas.Canvas = factory
+    try:
+        yield created
+    finally:
+        rl_canvas.Canvas = _Canvas
+
+
+def format_table(rows):
+    """Console table of (key, summary) pairs, slowest total first."""
+    def total(s):
+        return s['compute_s'] + s['emit_s'] + s['save_s']
+
+    def saved(s, field):
+        g = s.get('gstate')
+        return f"{g[field]:>9d}" if g else f"{'-':>9}"
+    lines = [f"{'item':>6} {'compute':>8} {'emit':>8} {'save':>7} {'bound':>8} "
+             f"{'calls':>8} {'redund%':>8} {'gstates':>8} {'saved op':>9} {'saved gs':>9}  "
+             + ' '.join(f'{op:>14}' for op in KEY_OPS)]
+    for key, s in sorted(rows, key=lambda r: total(r[1]), reverse=True):
+        lines.append(f"{key:>6} {s['compute_s']:8.2f} {s['emit_s']:8.2f} {s['save_s']:7.2f} "
+                     f"{s['bound']:>8} {s['calls']:8d} {s['redundant_pct']:8.1f} "
+                     f"{s['gstates']:8d} {saved(s, 'saved_ops')} {saved(s, 'saved_states')}  "
+                     + ' '.join(f"{s['ops'][op]:14d}" for op in KEY_OPS))
+    return '\n'.join(lines)
+
+
+def write_report(summaries, out_dir):
+    """Write {key: summary} as canvas-profile.json in out_dir; return its path."""
+    path = os.path.join(out_dir, 'canvas-profile.json')
+    with open(path, 'w') as fh:
+        json.dump(summaries, fh, indent=1, sort_keys=True)
+    return path
@@ -0,0 +1,190 @@
+"""GEOMETRIA SACRED PATTERNS — Ensemble ODE integration
+
+Advances many trajectories at once: the state is an (n, dim) array with
+one row per initial condition, so the interpreter cost of a step is paid
+once for the whole ensemble. That makes dense "flow" renderings (thousands
+of short trajectories instead of one long one) about as cheap as a single
+path:
+
+    y0 = ode.ball((0.1, 0.0, 0.0), radius=5.0, n=2000, seed=7)
+    ens = ode.integrate(ode.lorenz(), y0, dt=0.005, steps=400,
+                        method='rk4', discard=100, every=4)
+    ens.states                  # (outputs, 2000, 3)
+    ens.trajectory(0)           # a trajectory.Trajectory for one row
+
+Methods:
+
+    euler   y + f(y)·dt, the same step (and rounding) as trajectory.py
+    rk4     classic fourth-order Runge-Kutta
+    rk45    adaptive Dormand-Prince 5(4); each output interval dt is
+            covered by as many internal steps as the ensemble's worst
+            row needs for rtol / atol
+
+discard drops the first steps (the transient onto the attractor), every
+keeps one output in N, and callback(i, t, y) sees every step after the
+transient — with record=False nothing is stored, for streaming.
+
+No poster uses it yet: 020, 044, 059 and gif07 keep their single long
+trajectory from trajectory.py, bit-for-bit the original art, since an
+ensemble of short paths would change the picture and not just its cost.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from geometria import trajectory
+
+
+@dataclass
+class Ensemble:
+    t: np.ndarray          # (outputs,)
+    states: np.ndarray     # (outputs, n, dim)
+
+    def __len__(self):
+        return self.states.shape[1]
+
+    def trajectory(self, i):
+        """Row i as a trajectory.Trajectory (bounds, depth, …)."""
+        return trajectory.Trajectory(np.ascontiguousarray(self.states[:, i, :].T))
+
+    def segments(self):
+        """(n, outputs, dim) view: one polyline per initial condition."""
+        return self.states.transpose(1, 0, 2)
+
+
+# ─── Systems: f(t, y) for y of shape (n, dim) ─────────────
+
+def lorenz(sigma=10.0, rho=28.0, beta=8.0/3.0):
+    def f(t, s):
+        x, y, z = s[:, 0], s[:, 1], s[:, 2]
+        out = np.empty_like(s)
+        out[:, 0] = sigma * (y - x)
+        out[:, 1] = x * (rho - z) - y
+        out[:, 2] = x * y - beta * z
+        return out
+    return f
+
+
+def rossler(a=0.2, b=0.2, c=5.7):
+    def f(t, s):
+        x, y, z = s[:, 0], s[:, 1], s[:, 2]
+        out = np.empty_like(s)
+        out[:, 0] = -y - z
+        out[:, 1] = x + a * y
+        out[:, 2] = b + z * (x - c)
+        return out
+    return f
+
+
+def ball(center, radius, n, seed=0):
+    """n initial conditions uniformly inside a ball (or disc) around center."""
+    rng = np.random.default_rng(seed)
+    center = np.asarray(center, dtype=float)
+    d = rng.normal(size=(n, center.size))
+    d /= np.linalg.norm(d, axis=1, keepdims=True)
+    r = radius * rng.random(n) ** (1 / center.size)
+    return center + d * r[:, None]
+
+
+# ─── Steppers ─────────────────────────────────────────────
+
+def euler_step(f, t, y, h):
+    return y + f(t, y) * h
+
+
+def rk4_step(f, t, y, h):
+    k1 = f(t, y)
+    k2 = f(t + h/2, y + k1 * (h/2))
+    k3 = f(t + h/2, y + k2 * (h/2))
+    k4 = f(t + h, y + k3 * h)
+    return y + (k1 + 2*k2 + 2*k3 + k4) * (h/6)
+
+
+# Dormand-Prince 5(4) tableau
+DP_C = (0, 1/5, 3/10, 4/5, 8/9, 1, 1)
+DP_A = (
+    (),
+    (1/5,),
+    (3/40, 9/40),
+    (44/45, -56/15, 32/9),
+    (19372/6561, -25360/2187, 64448/6561, -212/729),
+    (9017/3168, -355/33, 46732/5247, 49/176, -5103/18656),
+    (35/384, 0, 500/1113, 125/192, -2187/6784, 11/84),
+)
+DP_B5 = (35/384, 0, 500/1113, 125/192, -2187/6784, 11/84, 0)
+DP_B4 = (5179/57600, 0, 7571/16695, 393/640, -92097/339200, 187/2100, 1/40)
+
+
+def _dopri(f, t, y, h):
+    """One Dormand-Prince step: (5th-order result, error estimate)."""
+    k = []
+    for c, row in zip(DP_C, DP_A):
+        yi = y
+        for a, kj in zip(row, k):
+            if a:
+                yi = yi + kj * (h * a)
+        k.append(f(t + c*h, yi))
+    y5 = y + sum(ki * (h * b) for b, ki in zip(DP_B5, k) if b)
+    y4 = y + sum(ki * (h * b) for b, ki in zip(DP_B4, k) if b)
+    return y5, y5 - y4
+
+
+class Adaptive:
+    """rk45 stepper that covers a fixed interval with adaptive substeps."""
+
+    def __init__(self, rtol=1e-6, atol=1e-9, h_min=1e-9):
+        self.rtol, self.atol, self.h_min = rtol, atol, h_min
+        self.h = None
+
+    def __call__(self, f, t, y, dt):
+        end = t + dt
+        h = min(self.h or dt, dt)
+        while t < end:
+            h = min(h, end - t)
+            y_new, err = _dopri(f, t, y, h)
+            scale = self.atol + self.rtol * np.maximum(np.abs(y), np.abs(y_new))
+            # worst row of the ensemble decides the step
+            e = float(np.sqrt(np.mean((err / scale) ** 2, axis=1)).max()) if y.size else 0.0
+            if e <= 1.0 or h <= self.h_min:
+                t, y = t + h, y_new
+            factor = 5.0 if e == 0 else min(5.0, max(0.2, 0.9 * e ** -0.2))
+            h = max(self.h_min, h * factor)
+        self.h = h
+        return y
+
+
+METHODS = ('euler', 'rk4', 'rk45')
+
+
+def integrate(f, y0, dt, steps, method='euler', discard=0, every=1,
+              callback=None, record=True, rtol=1e-6, atol=1e-9):
+    """Advance every row of y0 by steps + discard steps of dt.
+
+    Records the state after each kept step (the first output is one step
+    past the transient, as trajectory.py's first point is one step past
+    its start) and returns an Ensemble.
+    """
+    if method not in METHODS:
+        raise ValueError(f'unknown method {method!r}; expected one of {", ".join(METHODS)}')
+    y = np.array(y0, dtype=float, ndmin=2)
+    step = {'euler': euler_step, 'rk4': rk4_step}.get(method) or Adaptive(rtol, atol)
+
+    t = 0.0
+    for _ in range(discard):
+        y = step(f, t, y, dt)
+        t += dt
+
+    n_out = steps // every if record else 0
+    times = np.empty(n_out)
+    states = np.empty((n_out,) + y.shape)
+    for i in range(steps):
+        y = step(f, t, y, dt)
+        t += dt
+        if callback is not None:
+            callback(i, t, y)
+        if record and (i + 1) % every == 0:
+            j = (i + 1) // every - 1
+            times[j] = t
+            states[j] = y
+    return Ensemble(times, states)
@@ -0,0 +1,257 @@
+"""GEOMETRIA SACRED PATTERNS — Style-bucketed polylines
+
+Attractor trails, field lines, harmonographs and the dragon / Hilbert
+curves change colour, alpha or width a little at every vertex, so they
+were drawn one c.line() per segment, each with its own setStrokeColor and
+setLineWidth. stroke() takes the whole curve as arrays instead:
+
+    polyline.stroke(c, xs, ys, rgb=colors, alpha=alphas, width=widths)
+
+Every style component is quantized into `buckets` levels spread over its
+own range along the curve, and each run of segments that land in the same
+bucket is emitted as one path with one state change, so a 65k-segment
+curve becomes a few hundred paths. Fewer buckets mean fewer, longer runs
+and a smaller PDF; more buckets a smoother gradient. buckets=0 (the
+default) keeps styles exact and only merges consecutive segments that are
+identical.
+
+Styles may be given per segment or per vertex; with one entry per vertex,
+segment i takes the style of its start vertex i, as the old
+`c.line(x[i], y[i], x[i+1], y[i+1])` loops did.
+
+Runs meet at the midpoint of a segment, where the curve is straight:
+butt caps end flush there, so there is neither a gap nor a darker spot
+where two translucent runs overlap. Inside a run vertices get round joins
+(join=1): stroke() sets the join inside saveState / restoreState so the
+caller's join is left as it was. Posters that stroke many curves set the
+join once around the loop and pass join=None, which writes no state.
+
+The default number of buckets comes from GEOMETRIA_BUCKETS (0, exact), set
+by `python3 -m geometria render --buckets N`.
+
+Trajectories and fractal curves also carry far more vertices than print
+needs: collinear runs, steps shorter than a pixel. Before emission each
+piece is simplified with Ramer-Douglas-Peucker: a vertex is dropped when
+the path stays within `tolerance` of it. The two vertices of every segment
+where a run starts are always kept, so runs still meet at that segment's
+midpoint and no segment changes style. The tolerance is in pixels at
+cull.DPI (300): GEOMETRIA_SIMPLIFY, set by `python3 -m geometria render
+--simplify`, is 'off' (the default: every vertex is written) or a number
+of pixels; 0.5 stays below what a print can resolve, 0 drops exactly
+collinear vertices only. With exact styles every segment starts a run, so
+simplifying only pays together with --buckets.
+"""
+
+import os
+
+import numpy as np
+from reportlab.lib.colors import Color
+
+from geometria import cull
+
+ENV = 'GEOMETRIA_BUCKETS'
+DEFAULT = 0
+
+SIMPLIFY_ENV = 'GEOMETRIA_SIMPLIFY'
+SIMPLIFY_DEFAULT = 'off'
+
+
+def buckets():
+    """Default bucket count (GEOMETRIA_BUCKETS, 0 = exact styles)."""
+    value = os.environ.get(ENV, '').strip() or str(DEFAULT)
+    if not value.isdigit():
+        raise ValueError(f'unknown bucket count {value!r}; expected a number such as 32, or 0')
+    return int(value)
+
+
+def set_buckets(n):
+    """Select the bucket count for this process and every worker started after it."""
+    if int(n) < 0:
+        raise ValueError(f'unknown bucket count {n!r}; expected a number such as 32, or 0')
+    os.environ[ENV] = str(int(n))
+
+
+def parse_tolerance(value):
+    """'off' or a tolerance in pixels at cull.DPI (>= 0)."""
+    value = (value or SIMPLIFY_DEFAULT).strip().lower() or SIMPLIFY_DEFAULT
+    if value == 'off':
+        return value
+    try:
+        pixels = float(value)
+    except ValueError:
+        pixels = -1
+    if not pixels >= 0:
+        raise ValueError(f"unknown simplify tolerance {value!r}; expected off or a number "
+                         f"of pixels such as 0.5")
+    return pixels
+
+
+def tolerance():
+    """Simplification tolerance in points, or None when it is off."""
+    pixels = parse_tolerance(os.environ.get(SIMPLIFY_ENV))
+    return None if pixels == 'off' else pixels * 72 / cull.DPI
+
+
+def simplify_mode():
+    """Normalised tolerance for the build fingerprint."""
+    return str(parse_tolerance(os.environ.get(SIMPLIFY_ENV)))
+
+
+def set_tolerance(value):
+    """Select the tolerance for this process and every worker started after it."""
+    parse_tolerance(value)
+    os.environ[SIMPLIFY_ENV] = str(value)
+
+
+def quantize(values, n):
+    """Bucket index per value and the level of each bucket, over the values' range.
+
+    n = 0 keeps the distinct values themselves as levels.
+    """
+    values = np.asarray(values, dtype=float)
+    lo, hi = (float(values.min()), float(values.max())) if values.size else (0.0, 0.0)
+    if n <= 0 or hi == lo:
+        levels, idx = np.unique(values, return_inverse=True)
+        return idx.reshape(values.shape), levels
+    if n == 1:
+        return np.zeros(values.shape, dtype=np.int64), np.array([(lo + hi) / 2])
+    idx = np.rint((values - lo) / (hi - lo) * (n - 1)).astype(np.int64)
+    return idx, lo + np.arange(n) * ((hi - lo) / (n - 1))
+
+
+def _per_segment(values, m, name):
+    """Broadcast a style to one row per segment.
+
+    A per-vertex array (m + 1 rows) gives segment i the style of vertex i.
+    """
+    a = np.asarray(values, dtype=float)
+    if a.ndim == (1 if name == 'rgb' else 0):
+        return np.broadcast_to(a, (m, 3) if name == 'rgb' else (m,))
+    if len(a) not in (m, m + 1):
+        raise ValueError(f'{name} has {len(a)} entries for {m} segments; expected {m} '
+                         f'(per segment) or {m + 1} (per vertex)')
+    return a[:m]
+
+
+def runs(rgb, alpha, width, keep=None, n=None):
+    """Split segments into same-style runs.
+
+    Returns (pieces, style): pieces is a list of (start, stop) segment
+    ranges of consecutive kept segments, each a list of (a, b) runs, and
+    style(a) gives the quantized (r, g, b, alpha, width) of the run
+    starting at segment a.
+    """
+    n = buckets() if n is None else n
+    m = len(alpha)
+    columns = [rgb[:, 0], rgb[:, 1], rgb[:, 2], alpha, width]
+    quantized = [quantize(col, n) for col in columns]
+    keys = np.stack([idx for idx, _ in quantized], axis=1) if m else np.empty((0, 5), int)
+
+    kept = np.ones(m, dtype=bool) if keep is None else np.asarray(keep, dtype=bool)[:m]
+    # piece boundaries: where keep switches
+    edges = np.flatnonzero(np.diff(np.r_[False, kept, False].astype(np.int8)))
+    change = np.r_[True, np.any(keys[1:] != keys[:-1], axis=1)] if m else np.zeros(0, bool)
+
+    pieces = []
+    for start, stop in zip(edges[::2].tolist(), edges[1::2].tolist()):
+        cuts = [start] + (np.flatnonzero(change[start + 1:stop]) + start + 1).tolist() + [stop]
+        pieces.append(((start, stop), list(zip(cuts[:-1], cuts[1:]))))
+
+    def style(a):
+        return tuple(float(levels[idx[a]]) for idx, levels in quantized)
+    return pieces, style
+
+
+def simplify(xs, ys, tol, fixed=None):
+    """Vertices of the polyline through (xs, ys) that Ramer-Douglas-Peucker keeps.
+
+    Returns a bool mask. The ends and the `fixed` vertices are always kept.
+    Every pass handles all open intervals between kept vertices at once:
+    the vertex farthest from its interval's chord is kept if it lies more
+    than tol away, otherwise the interval is settled.
+    """
+    x = np.asarray(xs, dtype=float)
+    y = np.asarray(ys, dtype=float)
+    n = len(x)
+    kept = np.zeros(n, dtype=bool) if fixed is None else np.array(fixed, dtype=bool)
+    if n == 0:
+        return kept
+    kept[[0, -1]] = True
+    pending = ~kept
+    while True:
+        idx = np.flatnonzero(pending)
+        if not idx.size:
+            return kept
+        anchors = np.flatnonzero(kept)
+        j = np.searchsorted(anchors, idx) - 1
+        a, b = anchors[j], anchors[j + 1]
+        dx, dy = x[b] - x[a], y[b] - y[a]
+        length2 = dx * dx + dy * dy
+        t = ((x[idx] - x[a]) * dx + (y[idx] - y[a]) * dy) / np.where(length2 > 0, length2, 1)
+        t = np.clip(t, 0.0, 1.0)
+        d = np.hypot(x[idx] - x[a] - t * dx, y[idx] - y[a] - t * dy)
+        # farthest vertex of each interval: first of its group sorted by (interval, -d)
+        order = np.lexsort((-d, j))
+        _, first = np.unique(j[order], return_index=True)
+        far = order[first]
+        split = far[d[far] > tol]
+        kept[idx[split]] = True
+        pending[idx[split]] = False
+        settled = np.isin(j, j[far[d[far] <= tol]])
+        pending[idx[settled]] = False
+
+
+def stroke(c, xs, ys, rgb=(1, 1, 1), alpha=1.0, width=1.0, keep=None, buckets=None,
+           join=1):
+    """Stroke the polyline through (xs, ys) with a style per segment.
+
+    rgb ((3,) or one row per segment), alpha and width (scalars or one per
+    segment) may also be given per vertex; segment i then uses vertex i,
+    its start. keep (one bool per segment) leaves segments out, splitting
+    the curve. join is the line join inside runs, set and restored around
+    the curve; None keeps the caller's. Vertices are simplified within
+    tolerance() first. Returns the number of paths drawn.
+    """
+    xs = np.asarray(xs, dtype=float).tolist()
+    ys = np.asarray(ys, dtype=float).tolist()
+    m = len(xs) - 1
+    if m < 1:
+        return 0
+    rgb = _per_segment(rgb, m, 'rgb')
+    alpha = _per_segment(alpha, m, 'alpha')
+    width = _per_segment(width, m, 'width')
+    pieces, style = runs(rgb, alpha, width, keep, buckets)
+    tol = tolerance()
+    vertices = np.ones(m + 1, dtype=bool)
+    if tol is not None:
+        for (start, stop), piece_runs in pieces:
+            fixed = np.zeros(stop - start + 1, dtype=bool)
+            for a, _ in piece_runs[1:]:
+                fixed[a - start:a - start + 2] = True      # the segment where the run starts
+            vertices[start:stop + 1] = simplify(xs[start:stop + 1], ys[start:stop + 1], tol, fixed)
+    vertices = vertices.tolist()
+
+    def mid(i):
+        return (xs[i] + xs[i + 1]) / 2, (ys[i] + ys[i + 1]) / 2
+
+    if join is not None:
+        c.saveState()
+        c.setLineJoin(join)
+    paths = 0
+    for (start, stop), piece_runs in pieces:
+        for a, b in piece_runs:
+            r, g, bl, al, w = style(a)
+            p = c.beginPath()
+            p.moveTo(*((xs[a], ys[a]) if a == start else mid(a)))
+            for i in range(a + 1, b + 1):
+                if vertices[i]:
+                    p.lineTo(xs[i], ys[i])
+            if b < stop:
+                p.lineTo(*mid(b))
+            c.setStrokeColor(Color(r, g, bl, alpha=al))
+            c.setLineWidth(w)
+            c.drawPath(p, fill=0, stroke=1)
+            paths += 1
+    if join is not None:
+        c.restoreState()
+    return paths
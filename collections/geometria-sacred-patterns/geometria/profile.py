@@ -0,0 +1,128 @@
+"""GEOMETRIA SACRED PATTERNS — Per-item build profile
+
+Records wall time, CPU time, peak resident memory, output size and the
+number of drawing primitives issued for every rendered poster or GIF, and
+writes them as build-profile.json / build-profile.csv next to the outputs
+plus a console table sorted by the slowest item.
+"""
+
+import contextlib
+import csv
+import json
+import os
+import sys
+from collections import Counter
+
+FIELDS = ['key', 'wall_s', 'cpu_s', 'peak_rss_mb', 'output_bytes', 'primitives']
+REPORT = 'build-profile'
+
+# Canvas / ImageDraw methods that put marks on the page or frame.
+CANVAS_OPS = ('circle', 'ellipse', 'rect', 'roundRect', 'line', 'lines', 'drawPath',
+              'wedge', 'arc', 'bezier', 'grid', 'drawString', 'drawCentredString',
+              'drawRightString', 'drawImage', 'drawInlineImage')
+IMAGEDRAW_OPS = ('point', 'line', 'ellipse', 'polygon', 'rectangle', 'arc', 'chord',
+                 'pieslice', 'text', 'regular_polygon', 'rounded_rectangle')
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MiB (None where unsupported)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS.
+    return peak / (1 << 20) if sys.platform == 'darwin' else peak / 1024
+
+
+@contextlib.contextmanager
+def counting_primitives():
+    """Count drawing calls on every ReportLab Canvas and Pillow ImageDraw.
+
+    Yields a Counter of method name -> calls; the classes are restored on exit.
+    Only the outermost call is counted, so Canvas.circle drawing through
+    Canvas.ellipse is one primitive, not two.
+    """
+    from PIL import ImageDraw
+    from reportlab.pdfgen.canvas import Canvas
+
+    counts = Counter()
+    patched = []
+    depth = [0]
+
+    def wrap(cls, name):
+        original = cls.__dict__[name]
+
+        def counted(self, *args, **kwargs):
+            if not depth[0]:
+                counts[name] += 1
+            depth[0] += 1
+            try:
+                return original(self, *args, **kwargs)
+            finally:
+                depth[0] -= 1
+        counted.__name__ = name
+        patched.append((cls, name, original))
+        setattr(cls, name, counted)
+
+    for name in CANVAS_OPS:
+        if name in Canvas.__dict__:
+            wrap(Canvas, name)
+    for name in IMAGEDRAW_OPS:
+        if name in ImageDraw.ImageDraw.__dict__:
+            wrap(ImageDraw.ImageDraw, name)
+    try:
+        yield counts
+    finally:
+        for cls, name, original in reversed(patched):
+            setattr(cls, name, original)
+
+
+# ─── Reports ──────────────────────────────────────────────
+
+def write_reports(records, out_dir):
+    """Merge records into the report of out_dir (by key) as JSON and CSV.
+
+    Items that were not rebuilt keep their previous row, so a partial build
+    still leaves a profile of the whole collection. Returns the two paths.
+    """
+    merged = {r['key']: r for r in load_report(out_dir)}
+    merged.update((r['key'], r) for r in records)
+    records = [merged[k] for k in sorted(merged, key=lambda k: (k.startswith('gif'), k))]
+    json_path = os.path.join(out_dir, REPORT + '.json')
+    csv_path = os.path.join(out_dir, REPORT + '.csv')
+    with open(json_path, 'w') as fh:
+        json.dump(records, fh, indent=1)
+    with open(csv_path, 'w', newline='') as fh:
+        writer = csv.DictWriter(fh, fieldnames=FIELDS, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(records)
+    return json_path, csv_path
+
+
+def load_report(out_dir):
+    """Records of the previous profiled build in out_dir, or []."""
+    try:
+        with open(os.path.join(out_dir, REPORT + '.json')) as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return []
+
+
+def _fmt(value, spec):
+    return '-' if value is None else format(value, spec)
+
+
+def format_table(records, sort='wall_s'):
+    """Console table of records, heaviest first by the sort column."""
+    rows = sorted(records, key=lambda r: r.get(sort) or 0, reverse=True)
+    lines = [f"{'item':>6} {'wall s':>8} {'cpu s':>8} {'rss MB':>8} {'KB out':>9} {'prims':>9}"]
+    for r in rows:
+        kb = None if r['output_bytes'] is None else r['output_bytes'] / 1024
+        lines.append(f"{r['key']:>6} {_fmt(r['wall_s'], '8.2f')} {_fmt(r['cpu_s'], '8.2f')} "
+                     f"{_fmt(r['peak_rss_mb'], '8.1f')} {_fmt(kb, '9.1f')} "
+                     f"{_fmt(r['primitives'], '9d')}")
+    total_wall = sum(r['wall_s'] for r in records)
+    total_kb = sum(r['output_bytes'] or 0 for r in records) / 1024
+    lines.append(f"{'total':>6} {total_wall:8.2f} {'':>8} {'':>8} {total_kb:9.1f}")
+    return '\n'.join(lines)
@@ -0,0 +1,91 @@
+"""GEOMETRIA SACRED PATTERNS — Render quality levels
+
+One setting scales every sampling grid, particle count, trajectory length
+and GIF frame count in the collection:
+
+    draft     ~3% of the samples, for layout review of the whole collection
+    preview   ~30%
+    final     exactly today's constants (the default)
+    print     2× the samples
+
+Generators ask for their sizes through this module instead of hard-coding
+them:
+
+    res = quality.grid(350)          # linear grid size: samples scale by density
+    n = quality.count(200000)        # points / particles / steps
+    folds = quality.depth(16, 2)     # recursion: 2^folds segments
+    sz = (0.8 + t * 1.2) * 350 / res # keep dots touching when res changes
+
+The level comes from GEOMETRIA_QUALITY (so worker processes inherit it) and
+is set by `python3 -m geometria render --quality draft`. Module constants
+such as FRAMES in gen_gifs.py are read at import time, so set the level
+before registry.load().
+"""
+
+import math
+import os
+
+LEVELS = {
+    'draft': 0.03,
+    'preview': 0.3,
+    'final': 1.0,
+    'print': 2.0,
+}
+DEFAULT = 'final'
+ENV = 'GEOMETRIA_QUALITY'
+
+
+def level():
+    """Current level name (GEOMETRIA_QUALITY, default 'final')."""
+    name = os.environ.get(ENV, DEFAULT).strip().lower() or DEFAULT
+    if name not in LEVELS:
+        raise ValueError(f'unknown quality {name!r}; expected one of {", ".join(LEVELS)}')
+    return name
+
+
+def set_level(name):
+    """Select a level for this process and every worker started after it."""
+    name = name.lower()
+    if name not in LEVELS:
+        raise ValueError(f'unknown quality {name!r}; expected one of {", ".join(LEVELS)}')
+    os.environ[ENV] = name
+
+
+def density():
+    """Sample-count multiplier of the current level (1.0 at 'final')."""
+    return LEVELS[level()]
+
+
+def count(n, minimum=1):
+    """Scale a 1-D quantity: points, particles, integration steps."""
+    d = density()
+    if d == 1.0:
+        return n
+    return max(minimum, int(round(n * d)))
+
+
+def grid(n, minimum=8):
+    """Scale a linear grid size so the number of cells scales with density."""
+    d = density()
+    if d == 1.0:
+        return n
+    return max(minimum, int(round(n * math.sqrt(d))))
+
+
+def depth(n, branching, minimum=1):
+    """Recursion depth of a structure that grows branching× per level (L-systems)."""
+    d = density()
+    if d == 1.0:
+        return n
+    return max(minimum, n + int(round(math.log(d, branching))))
+
+
+def frames(n, minimum=8):
+    """GIF frame count; loops stay perfect because t = frame / n."""
+    return count(n, minimum)
+
+
+def pixels(n):
+    """GIF output size: shrunk below 'final' (to no less than a third), never enlarged
+    since the GIFs are drawn in absolute pixel coordinates."""
+    return min(n, grid(n, minimum=n // 3))
@@ -0,0 +1,330 @@
+"""GEOMETRIA SACRED PATTERNS — Hybrid raster layers for dense dot fields
+
+054, 025, 057, 037 and 031 draw tens of thousands of small translucent
+circles, each with its own colour and graphics state; the PDF grows to
+megabytes and viewers re-blend every circle on each redraw. In hybrid mode
+a poster's dense layer is composited into an RGBA buffer instead and placed
+with one drawImage, while outlines, labels, stars and the title block stay
+vector:
+
+    dense = raster.layer(c, 54, (x0, y0, x1, y1))   # extent in points
+    for ...:
+        dense.setFillColor(Color(r, g, b, alpha=a))
+        dense.circle(x, y, sz, fill=1, stroke=0)
+    raster.flush(c, dense)                          # the image goes here
+
+dots.fill(dense, xs, ys, radii, rgb, alpha) takes a layer in place of the
+canvas as well.
+
+With background=Color(...) the layer is flattened onto that colour and
+embedded as an opaque JPEG, which is far smaller than an RGBA image with a
+soft mask; use it only where nothing but the solid page background lies
+under the extent, since the image covers it completely. A layer is placed
+where flush() is called, over everything drawn before it: flush before
+drawing outlines or labels that must stay on top (037 uses one layer per
+mode for that).
+
+When the poster is not selected, layer() returns the canvas itself and the
+output is byte-for-byte the vector one. Selection comes from
+GEOMETRIA_RASTER (so worker processes inherit it): 'all', 'off' (the
+default) or poster numbers such as '054,057', set by
+`python3 -m geometria render --raster 054,057`.
+
+Circles are anti-aliased by pixel coverage and composited with the source
+over operator in drawing order, as a viewer would, but for whole chunks of
+dots at once: contributions are sorted by pixel, and each dot's colour is
+attenuated by the transmittance of the dots drawn after it on that pixel.
+
+    python3 -m geometria raster 054 025 057 037
+
+renders the posters both ways and compares file size and viewer render
+time (measured with pdftoppm, mutool or gs, whichever is on PATH).
+"""
+
+import io
+import math
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+
+import numpy as np
+from PIL import Image
+from reportlab.lib.utils import ImageReader
+
+from geometria import quality
+
+ENV = 'GEOMETRIA_RASTER'
+DEFAULT = 'off'
+DPI = 200
+POSTERS = ('025', '031', '037', '054', '057')   # generators with a raster.layer()
+CHUNK = 1 << 21      # kernel entries composited per pass
+JPEG_QUALITY = 90
+
+
+def parse(value):
+    """'all', 'off' or a frozenset of poster numbers from '054,57,...'."""
+    value = (value or DEFAULT).strip().lower() or DEFAULT
+    if value in ('all', 'off'):
+        return value
+    numbers = set()
+    for token in value.replace(' ', ',').split(','):
+        if not token:
+            continue
+        if not token.isdigit():
+            raise ValueError(f"unknown raster selection {token!r}; expected 'all', 'off' "
+                             f"or poster numbers such as 054,057")
+        numbers.add(int(token))
+    return frozenset(numbers) if numbers else DEFAULT
+
+
+def mode():
+    """Normalised selection for the build fingerprint: 'off', 'all' or '025,054'."""
+    sel = parse(os.environ.get(ENV))
+    return sel if isinstance(sel, str) else ','.join(f'{n:03d}' for n in sorted(sel))
+
+
+def set_mode(value):
+    """Select posters for this process and every worker started after it."""
+    parse(value)
+    os.environ[ENV] = value
+
+
+def enabled(number):
+    sel = parse(os.environ.get(ENV))
+    return sel == 'all' or (not isinstance(sel, str) and number in sel)
+
+
+# ─── Layer ────────────────────────────────────────────────
+
+class Layer:
+    """Records filled circles over an extent in points and composites them to RGBA.
+
+    Only the canvas calls used by dot fields are supported: setFillColor()
+    and circle(..., fill=1, stroke=0), plus dots() for whole arrays.
+    """
+
+    def __init__(self, extent, dpi=DPI, background=None):
+        self.x0, self.y0, self.x1, self.y1 = extent
+        self.background = background
+        self.scale = dpi / 72.0
+        self.width = max(1, int(math.ceil((self.x1 - self.x0) * self.scale)))
+        self.height = max(1, int(math.ceil((self.y1 - self.y0) * self.scale)))
+        self._fill = (0.0, 0.0, 0.0, 1.0)
+        self._batches = []
+        self._pending = []
+
+    def __len__(self):
+        return sum(len(b[0]) for b in self._batches) + len(self._pending)
+
+    # ─── Canvas subset ───────────────────────────────────
+
+    def setFillColor(self, color):
+        self._fill = (color.red, color.green, color.blue, getattr(color, 'alpha', 1.0))
+
+    def circle(self, x, y, r, fill=1, stroke=0):
+        if stroke or not fill:
+            raise ValueError('raster layers only hold filled, unstroked circles')
+        self._pending.append((x, y, r) + self._fill)
+
+    def dots(self, xs, ys, radii, rgb, alpha):
+        """Add many circles: radii and alpha scalar or (n,), rgb (3,) or (n, 3)."""
+        self._flush_pending()
+        xs = np.asarray(xs, dtype=float)
+        n = xs.size
+        self._batches.append((
+            xs, np.asarray(ys, dtype=float),
+            np.broadcast_to(np.asarray(radii, dtype=float), (n,)),
+            np.broadcast_to(np.asarray(rgb, dtype=float), (n, 3)),
+            np.broadcast_to(np.asarray(alpha, dtype=float), (n,)),
+        ))
+
+    def _flush_pending(self):
+        if self._pending:
+            a = np.array(self._pending, dtype=float)
+            self._batches.append((a[:, 0], a[:, 1], a[:, 2], a[:, 3:6], a[:, 6]))
+            self._pending = []
+
+    # ─── Compositing ─────────────────────────────────────
+
+    def render(self):
+        """Composite every recorded circle; returns an RGBA PIL image (straight alpha)."""
+        self._flush_pending()
+        size = self.width * self.height
+        color = np.zeros((size, 3), dtype=np.float32)     # premultiplied
+        cover = np.zeros(size, dtype=np.float32)
+        if self._batches:
+            xs, ys, rs, rgb, alpha = (np.concatenate(parts) for parts in zip(*self._batches))
+            cx = (xs - self.x0) * self.scale
+            cy = (self.y1 - ys) * self.scale          # top row first
+            rp = rs * self.scale
+            reach = np.ceil(rp + 0.5).astype(np.int64)
+            cost = np.cumsum((2 * reach + 1) ** 2)
+            start = 0
+            while start < len(xs):
+                stop = max(start + 1, int(np.searchsorted(cost, cost[start] + CHUNK)))
+                sl = slice(start, stop)
+                pix, c_rgb, c_a = self._chunk(cx[sl], cy[sl], rp[sl], reach[sl],
+                                              rgb[sl], alpha[sl])
+                color[pix] = c_rgb + color[pix] * (1 - c_a)[:, None]
+                cover[pix] = c_a + cover[pix] * (1 - c_a)
+                start = stop
+
+        out = np.zeros((size, 4), dtype=np.uint8)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            straight = np.nan_to_num(color / cover[:, None])
+        out[:, :3] = np.round(np.clip(straight, 0, 1) * 255)
+        out[:, 3] = np.round(np.clip(cover, 0, 1) * 255)
+        return Image.fromarray(out.reshape(self.height, self.width, 4), 'RGBA')
+
+    def _chunk(self, cx, cy, rp, reach, rgb, alpha):
+        """Over-composite one chunk of dots, in order, onto a transparent layer.
+
+        Returns the touched pixel indices with their premultiplied colour and alpha.
+        """
+        pix, order, a = [], [], []
+        for n in np.unique(reach).tolist():
+            sel = np.nonzero(reach == n)[0]
+            off = np.arange(-n, n + 1)
+            cols = np.floor(cx[sel]).astype(np.int64)[:, None, None] + off[None, None, :]
+            rows = np.floor(cy[sel]).astype(np.int64)[:, None, None] + off[None, :, None]
+            d = np.hypot(cols + 0.5 - cx[sel, None, None], rows + 0.5 - cy[sel, None, None])
+            cov = np.clip(rp[sel, None, None] - d + 0.5, 0.0, 1.0)   # anti-aliased edge
+            ok = ((cov > 0) & (cols >= 0) & (cols < self.width)
+                  & (rows >= 0) & (rows < self.height))
+            pix.append((rows * self.width + cols)[ok])
+            order.append(np.broadcast_to(sel[:, None, None], ok.shape)[ok])
+            a.append((cov * alpha[sel, None, None])[ok])
+        pix, order, a = np.concatenate(pix), np.concatenate(order), np.concatenate(a)
+        if not len(pix):
+            return pix, np.zeros((0, 3)), np.zeros(0)
+
+        idx = np.lexsort((order, pix))
+        pix, order = pix[idx], order[idx]
+        # log transmittance; opaque dots are capped so the sums stay finite
+        logt = np.log1p(-np.minimum(a[idx], 1 - 1e-9))
+        starts = np.flatnonzero(np.r_[True, pix[1:] != pix[:-1]])
+        ends = np.r_[starts[1:], len(pix)] - 1
+        run = np.cumsum(logt)
+        group = np.repeat(np.arange(len(starts)), np.diff(np.r_[starts, len(pix)]))
+        # what the dots drawn later on the same pixel let through
+        through = np.exp(run[ends][group] - run)
+        w = a[idx] * through
+        layer_rgb = np.add.reduceat(rgb[order] * w[:, None], starts, axis=0)
+        layer_a = -np.expm1(run[ends] - run[starts] + logt[starts])
+        return pix[starts], layer_rgb, layer_a
+
+    def flatten(self):
+        """render() composited over the background colour, as an RGB image."""
+        img = self.render()
+        bg = self.background
+        out = Image.new('RGB', img.size, tuple(round(v * 255) for v in (bg.red, bg.green, bg.blue)))
+        out.paste(img, mask=img)
+        return out
+
+    def draw(self, c):
+        w, h = self.width / self.scale, self.height / self.scale
+        if self.background is None:
+            c.drawImage(ImageReader(self.render()), self.x0, self.y1 - h,
+                        width=w, height=h, mask='auto')
+            return
+        buf = io.BytesIO()
+        self.flatten().save(buf, 'JPEG', quality=JPEG_QUALITY, subsampling=0)
+        buf.seek(0)
+        c.drawImage(ImageReader(buf), self.x0, self.y1 - h, width=w, height=h)
+
+
+def layer(c, number, extent, dpi=DPI, background=None):
+    """A Layer for poster number's dense dots when it is selected, else c itself."""
+    if not enabled(number):
+        return c
+    return Layer(extent, quality.grid(dpi, minimum=72), background)
+
+
+def flush(c, target):
+    """Place a layer() on the canvas; nothing to do when it was the canvas."""
+    if isinstance(target, Layer):
+        target.draw(c)
+
+
+# ─── Report ───────────────────────────────────────────────
+
+VIEWERS = (
+    ('pdftoppm', lambda pdf, out: ['pdftoppm', '-r', '100', '-png', '-singlefile', pdf, out]),
+    ('mutool', lambda pdf, out: ['mutool', 'draw', '-q', '-r', '100', '-o', out + '.png', pdf]),
+    ('gs', lambda pdf, out: ['gs', '-q', '-dSAFER', '-dBATCH', '-dNOPAUSE', '-sDEVICE=png16m',
+                             '-r100', f'-sOutputFile={out}.png', pdf]),
+)
+
+
+def viewer():
+    """(name, argv builder) of the first PDF rasterizer on PATH, or None."""
+    for name, argv in VIEWERS:
+        if shutil.which(name):
+            return name, argv
+    return None
+
+
+def view_seconds(path, tool, repeat=3):
+    """Best wall time of tool rasterizing path at 100 dpi."""
+    name, argv = tool
+    best = None
+    with tempfile.TemporaryDirectory() as tmp:
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            subprocess.run(argv(path, os.path.join(tmp, 'page')), check=True,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            dt = time.perf_counter() - t0
+            best = dt if best is None else min(best, dt)
+    return best
+
+
+def compare(items, out_dir=None):
+    """Render items in vector and hybrid mode; one row per item:
+    (key, vector bytes, hybrid bytes, vector render s, hybrid render s,
+     vector view s, hybrid view s). View times are None without a rasterizer.
+    """
+    from geometria import registry
+
+    tool = viewer()
+    previous_env, previous_dir = os.environ.get(ENV), registry.output_dir()
+    base = out_dir or tempfile.mkdtemp(prefix='geometria-raster-')
+    rows = []
+    try:
+        for it in items:
+            row = {'key': it.key}
+            for variant, value in (('vector', 'off'), ('hybrid', str(it.number))):
+                os.environ[ENV] = value
+                registry.set_output_dir(os.path.join(base, variant))
+                t0 = time.perf_counter()
+                it.func()
+                row[f'{variant}_s'] = time.perf_counter() - t0
+                row[f'{variant}_bytes'] = os.path.getsize(it.path)
+                row[f'{variant}_view_s'] = view_seconds(it.path, tool) if tool else None
+            rows.append(row)
+    finally:
+        if previous_env is None:
+            os.environ.pop(ENV, None)
+        else:
+            os.environ[ENV] = previous_env
+        registry.set_output_dir(previous_dir)
+    return rows, base, tool and tool[0]
+
+
+def format_table(rows, tool=None):
+    def mb(n):
+        return f'{n / (1 << 20):8.2f}'
+
+    def sec(s):
+        return f'{s:7.2f}' if s is not None else '    n/a'
+
+    lines = [f"{'item':<6} {'vector MB':>9} {'hybrid MB':>9} {'ratio':>6}  "
+             f"{'render s':>15}  {'view s (' + (tool or 'no viewer') + ')':>17}",
+             '-' * 72]
+    for r in rows:
+        ratio = r['hybrid_bytes'] / r['vector_bytes'] if r['vector_bytes'] else 0
+        lines.append(f"{r['key']:<6} {mb(r['vector_bytes'])}  {mb(r['hybrid_bytes'])} {ratio:6.2f}  "
+                     f"{sec(r['vector_s'])} → {sec(r['hybrid_s'])}  "
+                     f"{sec(r['vector_view_s'])} → {sec(r['hybrid_view_s'])}")
+    return '\n'.join(lines)
@@ -0,0 +1,163 @@
+"""GEOMETRIA SACRED PATTERNS — Generator registry
+
+Each gen_NNN() / gif_NN() is registered with its number, slug, series and
+tags, so tools can select and render any subset of the collection:
+
+    @poster(31, 'julia-set', tags=('fractal', 'complex'))
+    def gen_031():
+        c = gstate.canvas(poster_path(31), pagesize=A3)
+
+The registry also owns the output directory (formerly the OUT constant of
+each script): posters go to output_dir(), GIFs to output_dir()/gif.
+"""
+
+import importlib
+import os
+import re
+import sys
+from dataclasses import dataclass, field
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULES = ['gen_001_015', 'gen_016_030', 'gen_031_045', 'gen_046_060', 'gen_gifs']
+
+_items = {}
+_out_dir = ROOT
+
+
+@dataclass
+class Item:
+    kind: str          # 'poster' or 'gif'
+    number: int
+    slug: str
+    func: object
+    series: str
+    tags: tuple = field(default_factory=tuple)
+
+    @property
+    def key(self):
+        """Catalogue id: '031' for posters, 'gif07' for GIFs."""
+        return f'{self.number:03d}' if self.kind == 'poster' else f'gif{self.number:02d}'
+
+    @property
+    def name(self):
+        return self.func.__name__
+
+    @property
+    def filename(self):
+        """Output path relative to the output directory."""
+        if self.kind == 'poster':
+            return f'{self.number:03d}-{self.slug}.pdf'
+        return f'gif/{self.number:02d}-{self.slug}.gif'
+
+    @property
+    def path(self):
+        return os.path.join(_out_dir, self.filename)
+
+    @property
+    def order(self):
+        return (0 if self.kind == 'poster' else 1, self.number)
+
+
+# ─── Registration ─────────────────────────────────────────
+
+def _series(number):
+    lo = (number - 1) // 15 * 15 + 1
+    return f'{lo:03d}-{lo + 14:03d}'
+
+
+def _register(kind, number, slug, tags, series):
+    def decorate(func):
+        _items[(kind, number)] = Item(kind, number, slug, func, series, tuple(tags))
+        return func
+    return decorate
+
+
+def poster(number, slug, tags=()):
+    """Register a gen_NNN() poster function."""
+    return _register('poster', number, slug, tags, _series(number))
+
+
+def gif(number, slug, tags=()):
+    """Register a gif_NN() animation function."""
+    return _register('gif', number, slug, tags, 'gifs')
+
+
+# ─── Output directory ─────────────────────────────────────
+
+def output_dir():
+    return _out_dir
+
+
+def set_output_dir(path):
+    """Send every subsequent render to path (created on demand, with gif/)."""
+    global _out_dir
+    _out_dir = os.path.abspath(path)
+    os.makedirs(os.path.join(_out_dir, 'gif'), exist_ok=True)
+
+
+def poster_path(number):
+    """Where poster number should be written."""
+    return get('poster', number).path
+
+
+def gif_path(name):
+    """Where the GIF called name (e.g. '07-lorenz-butterfly') should be written."""
+    return os.path.join(_out_dir, 'gif', f'{name}.gif')
+
+
+# ─── Lookup ───────────────────────────────────────────────
+
+def load(modules=MODULES):
+    """Import the generator modules so their decorators run; return all items."""
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+    for name in modules:
+        importlib.import_module(name)
+    return items()
+
+
+def get(kind, number):
+    return _items[(kind, number)]
+
+
+def items(kind=None, series=None, tags=None):
+    """Registered items in catalogue order, optionally filtered."""
+    found = sorted(_items.values(), key=lambda it: it.order)
+    if kind:
+        found = [it for it in found if it.kind == kind]
+    if series:
+        series = series.replace('–', '-')
+        found = [it for it in found if it.series == series]
+    if tags:
+        found = [it for it in found if set(tags) & set(it.tags)]
+    return found
+
+
+_SELECTOR = re.compile(r'^(gif-?)?(\d+)(?:-(\d+))?$')
+
+
+def select(selectors=(), tags=(), series=None):
+    """Items matching any selector or tag, in catalogue order.
+
+    Selectors are poster numbers ('031'), ranges ('044-047'), GIF numbers
+    ('gif07', 'gif01-05') or slugs ('julia-set'). With no selectors and no
+    tags every item (of the given series) is returned.
+    """
+    pool = items(series=series)
+    if not selectors and not tags:
+        return pool
+    wanted = set()
+    for sel in selectors:
+        m = _SELECTOR.match(sel.lower())
+        if m:
+            kind = 'gif' if m.group(1) else 'poster'
+            lo = int(m.group(2))
+            hi = int(m.group(3) or lo)
+            hits = {it.order for it in pool if it.kind == kind and lo <= it.number <= hi}
+        else:
+            hits = {it.order for it in pool if it.slug == sel}
+        if not hits:
+            raise KeyError(f'no generator matches {sel!r}')
+        wanted |= hits
+    wanted |= {it.order for it in pool if set(tags) & set(it.tags)}
+    return [it for it in pool if it.order in wanted]
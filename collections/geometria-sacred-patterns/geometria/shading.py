@@ -0,0 +1,276 @@
+"""GEOMETRIA SACRED PATTERNS — Radial-gradient glows
+
+Soft glows (the centre of 001, the bindu of 002, the supernova core of 022,
+the photon sphere of 046, the bulge of 038, ...) were stacks of 20-120
+concentric circles, each a little more opaque than the one around it:
+dozens of fills and alpha states per glow, and visible banding where the
+rings step. glow() paints the same stack in one go:
+
+    shading.glow(c, cx, cy, 30, Color(1, 0.85, 0.2, alpha=0.04))
+
+stands in for
+
+    for rr in range(30, 0, -1):
+        c.setFillColor(Color(1, 0.85, 0.2, alpha=0.04 * (1 - rr/30)))
+        c.circle(cx, cy, rr, fill=1, stroke=0)
+
+color.alpha is the alpha of the innermost ring; ring alpha falls off as
+(1 - u) ** falloff towards the rim (u runs 0 -> 1 from `inner` to r) and
+ring colour runs from color to `edge`, with a ring every `step` points of
+radius from `outer` (default r; the loops that counted down from int(r)
+pass that) inwards. sx, sy stretch the glow into an ellipse (rx = r * sx,
+ry = r * sy).
+
+The rings are composited in the continuous limit: the opacity and colour
+of the whole stack at every distance from the centre, sampled 64 times.
+A PDF shading has no alpha, so the glow is a Form XObject painted through
+a luminosity soft mask, a radial shading of the opacity relative to the
+centre's; the centre's opacity and colour are the caller's fill:
+
+    q  r g b rg /gRLs0 gs  rx 0 0 ry x y cm  /FormXob.glow... Do  Q
+
+Glows of one shape share the form whatever their colour. When the rings
+change colour the form paints a radial colour shading instead of the fill.
+glow_image() composites the same profile into a Pillow image for the GIFs.
+
+GEOMETRIA_GLOW (inherited by worker processes, set by
+`python3 -m geometria render --glow ...`) is 'shading' (the default) or
+'off', which draws the circle stacks.
+"""
+
+import hashlib
+import math
+import os
+from functools import lru_cache
+
+import numpy as np
+from PIL import Image, ImageDraw
+from reportlab import rl_config
+from reportlab.lib.colors import Color
+from reportlab.pdfbase.pdfdoc import (PDFArray, PDFBase85Encode, PDFDictionary, PDFName, PDFStream,
+                                     PDFZCompress)
+
+ENV = 'GEOMETRIA_GLOW'
+DEFAULT = 'shading'
+MODES = ('shading', 'off')
+
+SAMPLES = 64         # profile samples from the centre to the rim
+STEPS = 4096         # integration steps across the radius
+
+
+def parse(value):
+    """'shading' or 'off'."""
+    value = (value or DEFAULT).strip().lower() or DEFAULT
+    if value not in MODES:
+        raise ValueError(f"unknown glow mode {value!r}; expected {', '.join(MODES)}")
+    return value
+
+
+def mode():
+    """Normalised mode for the build fingerprint."""
+    return parse(os.environ.get(ENV))
+
+
+def set_mode(value):
+    """Select the mode for this process and every worker started after it."""
+    parse(value)
+    os.environ[ENV] = str(value)
+
+
+# ─── Profile ──────────────────────────────────────────────
+
+def _ring(u, rgb, edge, alpha, falloff):
+    """Colour and alpha of the ring at u (0 = innermost, 1 = rim)."""
+    a = alpha * (1 - u) ** falloff
+    return tuple(e + (c - e) * (1 - u) for c, e in zip(rgb, edge)), a
+
+
+def _radii(r, inner, step):
+    """Ring radii of the stack, from the rim inwards."""
+    rr = r
+    while rr > inner:
+        yield rr
+        rr -= step
+
+
+@lru_cache(maxsize=256)
+def profile(r, rgb, alpha, falloff=1.0, inner=0.0, edge=None, step=1.0, outer=None):
+    """Opacity and colour of the ring stack at SAMPLES distances 0 .. r.
+
+    Returns (opacity, colour), shapes (SAMPLES,) and (SAMPLES, 3). Rings
+    are painted from the rim inwards, one every `step` points between
+    inner and outer (default r); inside `inner` every ring overlaps.
+    """
+    edge = rgb if edge is None else edge
+    outer = r if outer is None else outer
+    ds = r / STEPS
+    s = (np.arange(STEPS) + 0.5) * ds
+    u = np.clip((s - inner) / (r - inner), 0.0, 1.0) if r > inner else np.ones(STEPS)
+    a = np.where((s >= inner) & (s <= outer), alpha * (1 - u) ** falloff, 0.0)
+    w = 1 - (1 - a) ** (ds / step)               # an integration step holds ds / step rings
+    colour = np.array(edge) + np.outer(1 - u, np.subtract(rgb, edge))
+
+    # over-composite from the rim inwards: what a point at step k sees
+    seen, acc = [0.0], [(0.0, 0.0, 0.0)]
+    for wk, (cr, cg, cb) in zip(w.tolist()[::-1], colour.tolist()[::-1]):
+        o, (pr, pg, pb) = seen[-1], acc[-1]
+        seen.append(wk + (1 - wk) * o)
+        acc.append((wk * cr + (1 - wk) * pr, wk * cg + (1 - wk) * pg, wk * cb + (1 - wk) * pb))
+    opacity, premul = np.array(seen[::-1]), np.array(acc[::-1])
+
+    at = np.rint(np.linspace(0, STEPS, SAMPLES)).astype(int)
+    opacity, premul = opacity[at], premul[at]
+    ring = colour[np.minimum(at, STEPS - 1)]
+    lit = opacity > 1e-12
+    out = np.where(lit[:, None], premul / np.where(lit, opacity, 1)[:, None], ring)
+    return opacity, np.clip(out, 0.0, 1.0)
+
+
+# ─── PDF ──────────────────────────────────────────────────
+
+def _filters(c):
+    """Stream filters matching the page streams (reportlab leaves ours raw)."""
+    if not c._pageCompression:
+        return None
+    return rl_config.useA85 and [PDFBase85Encode, PDFZCompress] or [PDFZCompress]
+
+
+def _sampled(c, values, bits):
+    """Type 0 (sampled) function of t in [0, 1] through `values` (SAMPLES x n)."""
+    values = np.asarray(values, dtype=float).reshape(SAMPLES, -1)
+    n = values.shape[1]
+    top = (1 << bits) - 1
+    dtype = '>u2' if bits == 16 else 'u1'
+    data = np.rint(np.clip(values, 0, 1) * top).astype(dtype).tobytes()
+    return PDFStream(PDFDictionary({
+        'FunctionType': 0,
+        'Domain': PDFArray([0, 1]),
+        'Range': PDFArray([0, 1] * n),
+        'Size': PDFArray([SAMPLES]),
+        'BitsPerSample': bits,
+    }), content=data, filters=_filters(c))
+
+
+def _radial(doc, function, space):
+    """Radial shading over the unit disc, nothing outside it."""
+    return PDFDictionary({
+        'ShadingType': 3,
+        'ColorSpace': PDFName(space),
+        'Coords': PDFArray([0, 0, 0, 0, 0, 1]),
+        'Function': doc.Reference(function) if isinstance(function, PDFStream) else function,
+    })
+
+
+def _form(c, shape, colour=None):
+    """Define the glow's Form XObject on c's document once; return its name.
+
+    shape is the opacity relative to the centre's; colour, when the rings
+    change colour, a row per sample. Otherwise the form fills with the
+    caller's colour, so glows of one shape share it.
+    """
+    mask = _sampled(c, shape, 8)
+    paint = None if colour is None else _sampled(c, colour, 8)
+    key = mask.content + (b'' if paint is None else paint.content)
+    name = 'glow' + hashlib.sha1(key).hexdigest()[:12]
+    if c.hasForm(name):
+        return name
+    doc = c._doc
+    unit = PDFArray([-1, -1, 1, 1])
+    group = PDFStream(PDFDictionary({
+        'Type': PDFName('XObject'),
+        'Subtype': PDFName('Form'),
+        'BBox': unit,
+        'Group': PDFDictionary({'S': PDFName('Transparency'), 'CS': PDFName('DeviceGray')}),
+        'Resources': PDFDictionary({'Shading': PDFDictionary({'A': _radial(doc, mask, 'DeviceGray')})}),
+    }), content=b'/A sh\n')
+    resources = {'ExtGState': PDFDictionary({'M': PDFDictionary({
+        'Type': PDFName('ExtGState'),
+        'SMask': PDFDictionary({
+            'Type': PDFName('Mask'),
+            'S': PDFName('Luminosity'),
+            'G': doc.Reference(group),
+            'BC': PDFArray([0]),
+        }),
+    })})}
+    if paint is None:
+        content = b'/M gs -1 -1 2 2 re f\n'        # the mask is 0 outside the unit disc
+    else:
+        resources['Shading'] = PDFDictionary({'C': _radial(doc, paint, 'DeviceRGB')})
+        content = b'/M gs /C sh\n'
+    form = PDFStream(PDFDictionary({
+        'Type': PDFName('XObject'),
+        'Subtype': PDFName('Form'),
+        'BBox': unit,
+        'Resources': PDFDictionary(resources),
+    }), content=content)
+    doc.addForm(name, form)
+    return name
+
+
+def _stack(c, x, y, r, color, falloff, inner, edge, step, sx, sy, outer):
+    rgb = (color.red, color.green, color.blue)
+    for rr in _radii(outer, inner, step):
+        (red, green, blue), a = _ring((rr - inner) / (r - inner), rgb, edge, color.alpha, falloff)
+        c.setFillColor(Color(red, green, blue, alpha=a))
+        if sx == sy == 1:
+            c.circle(x, y, rr, fill=1, stroke=0)
+        else:
+            c.ellipse(x - rr * sx, y - rr * sy, x + rr * sx, y + rr * sy, fill=1, stroke=0)
+
+
+def glow(c, x, y, r, color, falloff=1.0, inner=0, edge=None, step=1, sx=1, sy=1, outer=None):
+    """Paint the glow of rings from radius outer (default r) in to `inner` around (x, y).
+
+    color is a Color whose alpha is the innermost ring's; edge (a Color,
+    default color) is the colour at r, where the falloff reaches 0.
+    """
+    edge = color if edge is None else edge
+    edge = (edge.red, edge.green, edge.blue)
+    outer = r if outer is None else outer
+    if mode() == 'off':
+        return _stack(c, x, y, r, color, falloff, inner, edge, step, sx, sy, outer)
+    if r <= inner or outer <= inner or r * sx == 0 or r * sy == 0:
+        return
+    rgb = (color.red, color.green, color.blue)
+    opacity, colour = profile(float(r), rgb, float(color.alpha), float(falloff),
+                              float(inner), edge, float(step), float(outer))
+    if opacity[0] <= 0:
+        return
+    name = _form(c, opacity / opacity[0], None if edge == rgb else colour)
+    c.saveState()
+    c.setFillColor(Color(*(rgb if edge == rgb else colour[0].tolist()), alpha=float(opacity[0])))
+    c.transform(r * sx, 0, 0, r * sy, x, y)
+    c.doForm(name)
+    c.restoreState()
+
+
+# ─── Pillow ───────────────────────────────────────────────
+
+def glow_image(img, x, y, r, color, falloff=1.0, inner=0, edge=None, step=1):
+    """glow() for an RGB Pillow image; colours are 0-255 (r, g, b[, alpha])."""
+    rgb = tuple(v / 255 for v in color[:3])
+    alpha = color[3] / 255 if len(color) > 3 else 1.0
+    edge = rgb if edge is None else tuple(v / 255 for v in edge[:3])
+    if mode() == 'off':
+        for rr in _radii(r, inner, step):
+            ring, a = _ring((rr - inner) / (r - inner), rgb, edge, alpha, falloff)
+            mask = Image.new('L', img.size, 0)
+            ImageDraw.Draw(mask).ellipse([x - rr, y - rr, x + rr, y + rr], fill=round(255 * a))
+            img.paste(tuple(round(255 * v) for v in ring), mask=mask)
+        return
+    if r <= inner:
+        return
+    x0, y0 = max(0, math.floor(x - r)), max(0, math.floor(y - r))
+    x1, y1 = min(img.width, math.ceil(x + r) + 1), min(img.height, math.ceil(y + r) + 1)
+    if x0 >= x1 or y0 >= y1:
+        return
+    opacity, colour = profile(float(r), rgb, float(alpha), float(falloff), float(inner), edge,
+                              float(step))
+    yy, xx = np.mgrid[y0:y1, x0:x1]
+    t = np.hypot(xx - x, yy - y) / r
+    grid = np.linspace(0, 1, SAMPLES)
+    a = np.interp(t, grid, opacity, right=0.0)[..., None]
+    paint = np.stack([np.interp(t, grid, colour[:, i]) for i in range(3)], axis=-1) * 255
+    box = (x0, y0, x1, y1)
+    under = np.asarray(img.crop(box), dtype=float)
+    img.paste(Image.fromarray(np.rint(under * (1 - a) + paint * a).astype(np.uint8)), box)
@@ -0,0 +1,188 @@
+"""GEOMETRIA SACRED PATTERNS — Simulation result cache
+
+Expensive deterministic simulations (Gray-Scott, attractor integrations,
+field-line tracing, ...) are stored on disk as .npz files keyed by a hash of
+the simulation's source, the geometria code it calls (the same walk as the
+build fingerprint, so editing reaction.py invalidates gray-scott-034), its
+parameters (seed, grid size, step count, ...) and the NumPy version, so
+re-styling a poster skips the simulation:
+
+    @simcache.memoize('gray-scott')
+    def gray_scott(res, spots, steps):
+        ...
+        return v                       # ndarray, or a list/tuple of ndarrays
+
+The cache lives in .sim-cache/ next to the generators and is capped in size;
+the least recently used entries are evicted first. Environment overrides:
+
+    GEOMETRIA_SIM_CACHE      cache directory, or 'off' to disable
+    GEOMETRIA_SIM_CACHE_MB   size cap in MiB (default 512)
+"""
+
+import contextlib
+import functools
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from geometria import cache, registry
+
+DEFAULT_DIR = os.path.join(registry.ROOT, '.sim-cache')
+DEFAULT_MB = 512
+
+_disabled = 0
+
+
+def cache_dir():
+    """Directory holding the .npz entries, or None when caching is off."""
+    path = os.environ.get('GEOMETRIA_SIM_CACHE', DEFAULT_DIR)
+    if _disabled or path.lower() in ('', '0', 'off', 'no', 'false'):
+        return None
+    return path
+
+
+def max_bytes():
+    return int(float(os.environ.get('GEOMETRIA_SIM_CACHE_MB', DEFAULT_MB)) * (1 << 20))
+
+
+@contextlib.contextmanager
+def disabled():
+    """Always recompute inside this block (used by the benchmarks)."""
+    global _disabled
+    _disabled += 1
+    try:
+        yield
+    finally:
+        _disabled -= 1
+
+
+# ─── Keys ─────────────────────────────────────────────────
+
+def key(name, func, arguments):
+    """Hex digest of the simulation and the code it calls, its bound arguments and NumPy."""
+    parts = {
+        'name': name,
+        'source': inspect.getsource(func),
+        'helpers': cache._dependencies(func),
+        'arguments': arguments,
+        'numpy': np.__version__,
+    }
+    blob = json.dumps(parts, sort_keys=True, default=list)
+    return hashlib.sha256(blob.encode()).hexdigest()[:32]
+
+
+# ─── Storage ──────────────────────────────────────────────
+
+def _pack(result):
+    if isinstance(result, np.ndarray):
+        return 'array', {'a0': result}
+    kind = 'tuple' if isinstance(result, tuple) else 'list'
+    return kind, {f'a{i}': np.asarray(a) for i, a in enumerate(result)}
+
+
+def _unpack(data):
+    kind = str(data['__kind__'])
+    arrays = [data[f'a{i}'] for i in range(len(data.files) - 1)]
+    if kind == 'array':
+        return arrays[0]
+    return tuple(arrays) if kind == 'tuple' else arrays
+
+
+def load(path):
+    """The cached result at path, or None if it is missing or unreadable."""
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            result = _unpack(data)
+    except (OSError, ValueError, KeyError):
+        return None
+    os.utime(path)  # mark as recently used
+    return result
+
+
+def store(path, result):
+    kind, arrays = _pack(result)
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as fh:
+            np.savez(fh, __kind__=np.array(kind), **arrays)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    evict(directory)
+
+
+def entries(directory):
+    """(mtime, size, path) of every cache entry, least recently used first."""
+    found = []
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return found
+    for name in names:
+        if name.endswith('.npz'):
+            path = os.path.join(directory, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            found.append((st.st_mtime, st.st_size, path))
+    return sorted(found)
+
+
+def evict(directory, limit=None):
+    """Delete least recently used entries until the cache fits in limit bytes."""
+    limit = max_bytes() if limit is None else limit
+    found = entries(directory)
+    total = sum(size for _, size, _ in found)
+    for _, size, path in found:
+        if total <= limit:
+            break
+        with contextlib.suppress(OSError):
+            os.unlink(path)
+        total -= size
+
+
+def clear(directory=None):
+    """Remove every entry; returns how many were deleted."""
+    directory = directory or cache_dir()
+    found = entries(directory) if directory else []
+    for _, _, path in found:
+        with contextlib.suppress(OSError):
+            os.unlink(path)
+    return len(found)
+
+
+# ─── Decorator ────────────────────────────────────────────
+
+def memoize(name):
+    """Cache func's array result on disk, keyed by name, source and arguments.
+
+    Arguments must be JSON-serialisable (numbers, strings, lists/tuples of
+    them). func must be deterministic and must not touch global state such
+    as the random module: on a hit it is not called at all.
+    """
+    def decorate(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def cached(*args, **kwargs):
+            directory = cache_dir()
+            if directory is None:
+                return func(*args, **kwargs)
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            path = os.path.join(directory, f'{name}-{key(name, func, bound.arguments)}.npz')
+            result = load(path)
+            if result is None:
+                result = func(*args, **kwargs)
+                store(path, result)
+            return result
+        return cached
+    return decorate
@@ -0,0 +1,133 @@
+"""GEOMETRIA SACRED PATTERNS — Attractor trajectories
+
+Integrates the Lorenz, Rössler and Clifford systems into preallocated NumPy
+arrays and works out bounds and normalised depth once, so drawing code gets
+array views instead of rebuilding xs/ys/zs lists (or, as 020 and 044 used
+to, recomputing min/max for every segment):
+
+    traj = trajectory.lorenz(25000)
+    (x_min, x_max), (z_min, z_max) = traj.bounds(0), traj.bounds(2)
+    depth = traj.depth(1)          # y mapped to 0..1
+
+The recurrences are the same explicit Euler / map steps, in the same order,
+as the original loops, so the points are bit-for-bit identical. Integrated
+coordinates are kept in the simulation cache (geometria.simcache).
+"""
+
+import math
+
+import numpy as np
+
+from geometria import simcache
+
+
+class Trajectory:
+    """An integrated path of n points in dim dimensions.
+
+    coords has shape (dim, n); x, y, z and points are views into it.
+    """
+
+    def __init__(self, coords):
+        self.coords = coords
+        self.lo = coords.min(axis=1)
+        self.hi = coords.max(axis=1)
+        self._depth = {}
+
+    def __len__(self):
+        return self.coords.shape[1]
+
+    @property
+    def x(self):
+        return self.coords[0]
+
+    @property
+    def y(self):
+        return self.coords[1]
+
+    @property
+    def z(self):
+        return self.coords[2]
+
+    @property
+    def points(self):
+        """(n, dim) view, one row per point."""
+        return self.coords.T
+
+    def bounds(self, axis):
+        return float(self.lo[axis]), float(self.hi[axis])
+
+    def center(self, axis):
+        return (float(self.lo[axis]) + float(self.hi[axis])) / 2
+
+    def span(self, axis):
+        return float(self.hi[axis]) - float(self.lo[axis])
+
+    def depth(self, axis):
+        """Coordinate along axis normalised to 0..1 (computed once, then cached)."""
+        if axis not in self._depth:
+            lo, hi = self.bounds(axis)
+            self._depth[axis] = (self.coords[axis] - lo) / (hi - lo)
+        return self._depth[axis]
+
+
+def _columns(dim, n):
+    coords = np.empty((dim, n))
+    return coords, [memoryview(row) for row in coords]
+
+
+# ─── Systems ──────────────────────────────────────────────
+
+def lorenz(n, sigma=10.0, rho=28.0, beta=8.0/3.0, dt=0.005, start=(0.1, 0.0, 0.0)):
+    """n Euler steps of the Lorenz system (the first point is after one step)."""
+    return Trajectory(_lorenz(n, sigma, rho, beta, dt, tuple(start)))
+
+
+def rossler(n, a=0.2, b=0.2, c=5.7, dt=0.01, start=(1.0, 1.0, 1.0)):
+    """n Euler steps of the Rössler system."""
+    return Trajectory(_rossler(n, a, b, c, dt, tuple(start)))
+
+
+def clifford(n, a=-1.4, b=1.6, c=1.0, d=0.7, start=(0.1, 0.1)):
+    """n iterations of the Clifford map x' = sin(ay) + c cos(ax), y' = sin(bx) + d cos(by)."""
+    return Trajectory(_clifford(n, a, b, c, d, tuple(start)))
+
+
+@simcache.memoize('lorenz')
+def _lorenz(n, sigma, rho, beta, dt, start):
+    coords, (mx, my, mz) = _columns(3, n)
+    x, y, z = start
+    for i in range(n):
+        dx = sigma * (y - x)
+        dy = x * (rho - z) - y
+        dz = x * y - beta * z
+        x += dx * dt
+        y += dy * dt
+        z += dz * dt
+        mx[i] = x; my[i] = y; mz[i] = z
+    return coords
+
+
+@simcache.memoize('rossler')
+def _rossler(n, a, b, c, dt, start):
+    coords, (mx, my, mz) = _columns(3, n)
+    x, y, z = start
+    for i in range(n):
+        dx = -y - z
+        dy = x + a * y
+        dz = b + z * (x - c)
+        x += dx * dt
+        y += dy * dt
+        z += dz * dt
+        mx[i] = x; my[i] = y; mz[i] = z
+    return coords
+
+
+@simcache.memoize('clifford')
+def _clifford(n, a, b, c, d, start):
+    coords, (mx, my) = _columns(2, n)
+    sin, cos = math.sin, math.cos
+    x, y = start
+    for i in range(n):
+        x, y = sin(a * y) + c * cos(a * x), sin(b * x) + d * cos(b * y)
+        mx[i] = x; my[i] = y
+    return coords
@@ -0,0 +1,280 @@
+"""GEOMETRIA SACRED PATTERNS — Watch mode
+
+Polls the gen_*.py files and the geometria modules they import, reloads
+the ones that changed, works out which gen_NNN() / gif_NN() functions
+actually changed (by fingerprint, so editing a shared helper or dots.py
+re-renders every poster that calls it) and re-renders only those at preview
+quality on a background thread. Reloads run on that same thread, between
+renders, so a module is never re-executed while a poster is using it.
+Results are served from a local HTTP server whose page refreshes each
+preview as soon as it is rebuilt:
+
+    python3 -m geometria watch                 # then open http://localhost:8000
+    python3 -m geometria watch 031 gif07 --quality draft
+
+Simulations come from the simulation cache (geometria.simcache), so
+re-styling a heavy poster does not re-run its model.
+"""
+
+import html
+import http.server
+import importlib
+import json
+import os
+import queue
+import sys
+import tempfile
+import threading
+import time
+import traceback
+import urllib.parse
+
+from geometria import build, cache, quality, registry
+
+DEFAULT_DIR = os.path.join(tempfile.gettempdir(), 'geometria-preview')
+
+
+def _helpers():
+    """name -> geometria module imported by the generators, directly or through each other."""
+    found = {}
+    todo = [sys.modules[name] for name in registry.MODULES if name in sys.modules]
+    while todo:
+        for obj in list(vars(todo.pop()).values()):
+            module = cache._geometria_module(obj)
+            if module is not None and module.__name__ not in found:
+                found[module.__name__] = module
+                todo.append(module)
+    return found
+
+
+class Watcher:
+    """Tracks module mtimes and item fingerprints; queues changed items for rendering."""
+
+    def __init__(self, wanted=None):
+        self.wanted = wanted          # set of keys to watch, or None for everything
+        self.mtimes = {}
+        self.digests = {}
+        self.status = {}              # key -> dict shown on the page
+        self.version = 0
+        self.lock = threading.Lock()
+        self.jobs = queue.Queue()
+
+    def _watched(self):
+        return [it for it in registry.items() if self.wanted is None or it.key in self.wanted]
+
+    def _paths(self):
+        paths = {name: sys.modules[name].__file__ for name in _helpers()}
+        paths.update((name, os.path.join(registry.ROOT, name + '.py'))
+                     for name in registry.MODULES)
+        return paths
+
+    def snapshot(self):
+        """Record mtimes and fingerprints without rendering anything."""
+        for name, path in self._paths().items():
+            self.mtimes[name] = os.path.getmtime(path)
+        self.digests = {it.key: cache.fingerprint(it.func) for it in self._watched()}
+
+    def poll(self):
+        """Names of the watched modules modified since the last poll."""
+        modified = []
+        for name, path in self._paths().items():
+            try:
+                mtime = os.path.getmtime(path)
+            except OSError:
+                continue
+            if mtime != self.mtimes.get(name):
+                self.mtimes[name] = mtime
+                modified.append(name)
+        return modified
+
+    def reload(self, modified):
+        """Reload modules (geometria helpers first); return the items whose fingerprint changed.
+
+        Called on the render thread only, see render_forever().
+        """
+        for name in sorted(modified, key=lambda n: not n.startswith('geometria.')):
+            try:
+                importlib.reload(sys.modules[name])
+            except Exception:
+                self.set_error(name, traceback.format_exc())
+                continue
+            self.clear(name)
+        changed = []
+        for it in self._watched():
+            digest = cache.fingerprint(it.func)
+            if digest != self.digests.get(it.key):
+                self.digests[it.key] = digest
+                changed.append(it)
+        return changed
+
+    # ─── Status shown by the server ──────────────────────
+
+    def update(self, key, **fields):
+        with self.lock:
+            self.version += 1
+            entry = self.status.setdefault(key, {'key': key})
+            entry.update(fields, version=self.version)
+
+    def set_error(self, key, error):
+        print(error, file=sys.stderr)
+        self.update(key, state='error', error=error)
+
+    def clear(self, key):
+        with self.lock:
+            if self.status.pop(key, None) is not None:
+                self.version += 1
+
+    def snapshot_status(self):
+        with self.lock:
+            return {'version': self.version,
+                    'items': sorted(self.status.values(), key=lambda e: e['key'])}
+
+    # ─── Background rendering ────────────────────────────
+
+    def render_forever(self):
+        """Run (modules, items) jobs: reload the modules, then render items plus what changed."""
+        while True:
+            modified, items = self.jobs.get()
+            if modified:
+                changed = [it for it in self.reload(modified) if it not in items]
+                if changed:
+                    print(f"changed: {', '.join(it.key for it in changed)}", flush=True)
+                items = list(items) + changed
+            if not items:
+                continue
+            for it in items:
+                self.update(it.key, state='rendering', file=it.filename, error=None)
+            t0 = time.perf_counter()
+            build.run_items(items, n_jobs=1, on_result=self._done)
+            print(f"  rendered {', '.join(it.key for it in items)} "
+                  f"in {time.perf_counter() - t0:.1f}s", flush=True)
+
+    def _done(self, result):
+        if result.ok:
+            self.update(result.key, state='ok', seconds=round(result.seconds, 2))
+        else:
+            self.set_error(result.key, result.error)
+
+
+# ─── HTTP server ──────────────────────────────────────────
+
+PAGE = """<!doctype html>
+<html><head><meta charset="utf-8"><title>GEOMETRIA — preview</title>
+<style>
+ body { background: #111; color: #ccc; font: 13px/1.4 monospace; margin: 16px; }
+ .item { display: inline-block; vertical-align: top; margin: 0 16px 16px 0; }
+ .item iframe, .item img { width: 420px; height: 594px; border: 1px solid #333; background: #000; }
+ .item img { height: auto; }
+ .error { color: #f66; white-space: pre-wrap; max-width: 420px; }
+</style></head>
+<body><h3>GEOMETRIA preview — %(quality)s — watching %(scope)s</h3>
+<div id="items"><p>Edit a gen_*.py file to render its posters…</p></div>
+<script>
+let seen = -1;
+const shown = {};
+async function tick() {
+  try {
+    const s = await (await fetch('/status')).json();
+    if (s.version !== seen) {
+      seen = s.version;
+      const box = document.getElementById('items');
+      if (s.items.length) box.querySelector('p')?.remove();
+      for (const it of s.items) {
+        let el = document.getElementById(it.key);
+        if (!el) {
+          el = document.createElement('div');
+          el.className = 'item'; el.id = it.key;
+          el.innerHTML = '<div class="head"></div><div class="view"></div><div class="error"></div>';
+          box.prepend(el);
+        }
+        el.dataset.live = seen;
+        el.querySelector('.head').textContent =
+          it.key + '  ' + it.state + (it.seconds !== undefined ? '  ' + it.seconds + 's' : '');
+        el.querySelector('.error').textContent = it.state === 'error' ? it.error : '';
+        if (it.state === 'ok' && shown[it.key] !== it.version) {
+          shown[it.key] = it.version;
+          const src = '/files/' + it.file + '?v=' + it.version;
+          el.querySelector('.view').innerHTML = it.file.endsWith('.gif')
+            ? '<img src="' + src + '">' : '<iframe src="' + src + '#view=FitH"></iframe>';
+        }
+      }
+      for (const el of box.querySelectorAll('.item'))
+        if (el.dataset.live != seen) el.remove();
+    }
+  } catch (e) {}
+  setTimeout(tick, 700);
+}
+tick();
+</script></body></html>
+"""
+
+
+def make_handler(watcher, out_dir, scope):
+    class Handler(http.server.SimpleHTTPRequestHandler):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, directory=out_dir, **kwargs)
+
+        def do_GET(self):
+            path = urllib.parse.urlsplit(self.path).path
+            if path == '/':
+                body = PAGE % {'quality': quality.level(), 'scope': html.escape(scope)}
+                self._send(body.encode(), 'text/html; charset=utf-8')
+            elif path == '/status':
+                self._send(json.dumps(watcher.snapshot_status()).encode(), 'application/json')
+            elif path.startswith('/files/'):
+                self.path = path[len('/files'):]
+                super().do_GET()
+            else:
+                self.send_error(404)
+
+        def end_headers(self):
+            self.send_header('Cache-Control', 'no-store')
+            super().end_headers()
+
+        def _send(self, body, content_type):
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def serve(watcher, out_dir, port, scope):
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', port),
+                                             make_handler(watcher, out_dir, scope))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def watch(items, initial=(), out_dir=DEFAULT_DIR, port=8000, interval=0.5):
+    """Serve previews of items and re-render them as their source changes; never returns.
+
+    initial items are rendered once at start-up. Quality and the output
+    directory must be set by the caller before the modules were loaded.
+    """
+    registry.set_output_dir(out_dir)
+    keys = {it.key for it in items}
+    watcher = Watcher(None if len(keys) == len(registry.items()) else keys)
+    watcher.snapshot()
+    scope = 'everything' if watcher.wanted is None else ' '.join(sorted(keys))
+    server = serve(watcher, registry.output_dir(), port, scope)
+    threading.Thread(target=watcher.render_forever, daemon=True).start()
+    if initial:
+        watcher.jobs.put(((), list(initial)))
+    print(f"Watching {scope} at {quality.level()} quality; "
+          f"previews on http://{server.server_address[0]}:{server.server_address[1]}/ "
+          f"(files in {registry.output_dir()}). Ctrl-C to stop.", flush=True)
+    try:
+        while True:
+            modified = watcher.poll()
+            if modified:
+                watcher.jobs.put((modified, []))
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        server.shutdown()
+        return 0
@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from geometria import bessel
+
+
+def integral(n, x, samples=4001):
+    """Bessel's integral J_n(x) = 1/π ∫₀^π cos(nτ − x sin τ) dτ."""
+    tau = np.linspace(0, np.pi, samples)
+    y = np.cos(n * tau[:, None] - np.outer(np.sin(tau), x))
+    return (y.sum(axis=0) - (y[0] + y[-1]) / 2) * (tau[1] - tau[0]) / np.pi    # trapezoid rule
+
+
+X = np.concatenate([np.linspace(-30, 30, 241), [0.0, 1e-12, 7.999, 8.0, 8.001]])
+
+
+@pytest.mark.parametrize('n, func', [(0, bessel.j0), (1, bessel.j1)])
+def test_j0_j1_against_integral(n, func):
+    np.testing.assert_allclose(func(X), integral(n, X), rtol=0, atol=1e-8)
+
+
+@pytest.mark.parametrize('n', [2, 3, 5, 10])
+def test_jn_against_integral(n):
+    x = np.linspace(0, 30, 121)
+    np.testing.assert_allclose(bessel.jn(n, x), integral(n, x), rtol=0, atol=1e-8)
+
+
+def test_scalars_and_known_values():
+    assert isinstance(bessel.j1(24.5), float)
+    assert bessel.j0(2.404825557695773) == pytest.approx(0, abs=1e-8)
+    assert bessel.j1(3.8317059702075125) == pytest.approx(0, abs=1e-8)
+    assert bessel.airy(0.0) == 1.0
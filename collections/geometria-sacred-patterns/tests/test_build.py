@@ -0,0 +1,83 @@
+import inspect
+
+import pytest
+
+from geometria import build, cache, cull, registry
+
+calls = []
+
+
+def fake_poster():
+    calls.append('fake')
+    with open(registry.poster_path(901), 'w') as fh:
+        fh.write('%PDF-fake\n')
+    print('  901 done')
+
+
+def failing_poster():
+    raise RuntimeError('boom')
+
+
+@pytest.fixture
+def catalogue(monkeypatch, tmp_path):
+    monkeypatch.setattr(registry, '_items', {})
+    monkeypatch.setattr(registry, '_out_dir', registry.ROOT)
+    registry.set_output_dir(tmp_path)
+    registry.poster(901, 'fake')(fake_poster)
+    registry.poster(902, 'failing')(failing_poster)
+    for number in (20, 31, 44, 54):
+        registry.poster(number, f'p{number}')(fake_poster)
+    calls.clear()
+    return tmp_path
+
+
+def test_schedule_heavy_first_then_catalogue(catalogue):
+    items = registry.items()
+    keys = [it.key for it in build.schedule(items)]
+    assert keys == ['031', '044', '054', '020', '901', '902']
+
+
+def test_schedule_uses_last_profile(catalogue, monkeypatch):
+    monkeypatch.setattr(build.profile, 'load_report',
+                        lambda out: [{'key': '901', 'wall_s': 9.0}, {'key': '020', 'wall_s': 1.0}])
+    keys = [it.key for it in build.schedule(registry.items())]
+    assert keys[:2] == ['901', '020']
+
+
+def test_results_reported_in_catalogue_order(catalogue):
+    seen = []
+    results = build.run_items(registry.items(), n_jobs=1, on_result=lambda r: seen.append(r.key))
+    assert seen == [r.key for r in results] == ['020', '031', '044', '054', '901', '902']
+    assert results[-1].error and 'boom' in results[-1].error
+    assert results[-2].ok and results[-2].output == '  901 done\n'
+
+
+def test_build_skips_fresh_outputs(catalogue):
+    item = [registry.get('poster', 901)]
+    results, skipped = build.build(item, n_jobs=1)
+    assert len(results) == 1 and not skipped
+    results, skipped = build.build(item, n_jobs=1)
+    assert not results and len(skipped) == 1
+
+    (catalogue / item[0].filename).write_text('%PDF-edited\n')     # output touched
+    results, skipped = build.build(item, n_jobs=1)
+    assert len(results) == 1
+    results, skipped = build.build(item, n_jobs=1, force=True)
+    assert len(results) == 1 and calls == ['fake'] * 3
+
+
+def test_failed_items_are_not_recorded(catalogue):
+    build.build([registry.get('poster', 902)], n_jobs=1)
+    assert '902' not in cache.BuildCache(str(catalogue)).entries
+
+
+def test_fingerprint_follows_geometria_imports(monkeypatch):
+    registry.load()
+    func = registry.get('poster', 1).func       # reaches cull only through gstate
+    before = cache.fingerprint(func)
+    getsource = inspect.getsource
+
+    def edited(obj):
+        return getsource(obj) + '# edited' if obj is cull else getsource(obj)
+    monkeypatch.setattr(inspect, 'getsource', edited)
+    assert cache.fingerprint(func) != before
@@ -0,0 +1,55 @@
+import numpy as np
+
+from geometria import bench, contour
+
+
+def cone(n=40):
+    y, x = np.indices((n + 1, n + 1))
+    return np.hypot(x - n / 2, y - n / 2)
+
+
+def test_circle_is_one_closed_loop():
+    lines = contour.isolines(cone(), 12.3)
+    assert len(lines) == 1
+    line = lines[0]
+    assert contour.is_closed(line)
+    r = np.hypot(line[:, 0] - 20, line[:, 1] - 20)
+    assert np.abs(r - 12.3).max() < 0.1
+
+
+def test_stitching_keeps_every_segment_once():
+    h = np.array(bench._terrain_numpy(30))
+    level = float(np.median(h))
+    first, second = contour.segments(h, level)
+    expected = sorted(tuple(sorted(p)) for p in zip(first.tolist(), second.tolist()))
+    chains = contour.stitch(first, second)
+    stitched = sorted(tuple(sorted(p)) for chain in chains for p in zip(chain, chain[1:]))
+    assert stitched == expected
+
+    for line in contour.isolines(h, level):
+        steps = np.abs(np.diff(line, axis=0))
+        assert (steps <= 1).all()               # consecutive points share a cell
+        if not contour.is_closed(line):
+            for x, y in (line[0], line[-1]):    # open lines run border to border
+                assert x in (0, 30) or y in (0, 30)
+
+
+def test_segment_count_matches_scalar_loop():
+    res, n_contours = 30, 5
+    heights = bench._terrain(res)
+    scalar = bench.marching_squares(res, n_contours)()
+    h = np.array(heights, dtype=float)
+    lo, hi = h.min(), h.max()
+    total = saddles = 0
+    for ci in range(n_contours):
+        level = lo + (hi - lo) * (ci + 0.5) / n_contours
+        total += sum(len(line) - 1 for line in contour.isolines(h, level))
+        up = h >= level
+        case = up[:-1, :-1] * 1 + up[:-1, 1:] * 2 + up[1:, 1:] * 4 + up[1:, :-1] * 8
+        saddles += int(np.isin(case, (5, 10)).sum())
+    # the old loop drew one segment per crossed cell, saddles included
+    assert total == len(scalar) + saddles
+
+
+def test_flat_grid_has_no_lines():
+    assert contour.isolines(np.zeros((5, 5)), 1.0) == []
@@ -0,0 +1,169 @@
+import io
+
+from reportlab.lib.colors import Color
+from reportlab.pdfgen.canvas import Canvas
+
+from geometria.cull import CullCanvas
+
+
+def page_stream(draw):
+    buf = io.BytesIO()
+    c = CullCanvas(Canvas(buf, pagesize=(400, 400), pageCompression=0))
+    draw(c)
+    c.showPage()
+    c.save()
+    return buf.getvalue()
+
+
+def test_text_inside_saved_state():
+    def draw(c):
+        c.saveState()
+        c.translate(100, 100)
+        c.setFont('Helvetica', 20)
+        t = c.beginText(0, 0)
+        t.textLine('hi')
+        c.drawText(t)
+        c.restoreState()
+        c.setFillColor(Color(1, 0, 0))
+        c.rect(10, 10, 50, 50, fill=1, stroke=0)
+
+    pdf = page_stream(draw)
+    assert b'1 0 0 1 100 100 cm' in pdf
+    assert b'20 Tf' in pdf
+    assert b'(hi) Tj' in pdf
+
+
+def test_text_keeps_tracked_transform():
+    def draw(c):
+        c.saveState()
+        c.translate(-1000, -1000)
+        c.drawText(c.beginText(0, 0))
+        c.setFillColor(Color(1, 0, 0))
+        c.rect(10, 10, 50, 50, fill=1, stroke=0)      # off the page under the translate
+        c.restoreState()
+
+    c_pdf = page_stream(draw)
+    assert b'10 10 50 50 re' not in c_pdf
+
+
+def test_faint_primitive_dropped_with_its_state():
+    def draw(c):
+        c.setFillColor(Color(0.2, 0.4, 0.6, alpha=0.0001))
+        c.circle(200, 200, 1, fill=1, stroke=0)
+
+    assert b'0.2 0.4 0.6 rg' not in page_stream(draw)
+
+
+def culled(draw):
+    """The page stream and the cull summary."""
+    buf = io.BytesIO()
+    c = CullCanvas(Canvas(buf, pagesize=(400, 400), pageCompression=0))
+    draw(c)
+    c.showPage()
+    c.save()
+    return buf.getvalue(), c.summary()
+
+
+def test_offpage_primitive_dropped():
+    def draw(c):
+        c.setStrokeColor(Color(0, 0, 1))
+        c.setLineWidth(20)
+        c.line(-25, 0, -25, 400)                   # grown by the width: reaches x = -5
+        c.line(-15, 0, -15, 400)                   # ... this one reaches the page
+        c.setFillColor(Color(1, 0, 0))
+        c.circle(-50, 200, 10, fill=1, stroke=0)
+
+    pdf, s = culled(draw)
+    assert s['by_reason']['offpage'] == 2 and s['culled'] == 2
+    assert b'1 0 0 rg' not in pdf and b'-15 0 m' in pdf
+
+
+def test_covered_by_opaque_rect_and_circle():
+    def draw(c):
+        c.setFillColor(Color(0, 1, 0))
+        c.circle(100, 100, 10, fill=1, stroke=0)   # under the rect
+        c.circle(300, 300, 20, fill=1, stroke=0)   # under the circle
+        c.circle(200, 200, 20, fill=1, stroke=0)   # under neither
+        c.setFillColor(Color(1, 1, 1))
+        c.rect(50, 50, 100, 100, fill=1, stroke=0)
+        c.circle(300, 300, 30, fill=1, stroke=0)
+
+    pdf, s = culled(draw)
+    assert s['by_reason']['covered'] == 2
+    assert b'110 100 m' not in pdf and b'320 300 m' not in pdf and b'220 200 m' in pdf
+
+
+def test_translucent_or_transformed_fill_covers_nothing():
+    def draw(c):
+        c.setFillColor(Color(0, 1, 0))
+        c.circle(100, 100, 10, fill=1, stroke=0)
+        c.setFillColor(Color(1, 1, 1, alpha=0.9))
+        c.rect(50, 50, 100, 100, fill=1, stroke=0)
+        c.saveState()
+        c.translate(1, 1)
+        c.setFillColor(Color(1, 1, 1))
+        c.rect(50, 50, 100, 100, fill=1, stroke=0)
+        c.restoreState()
+
+    assert culled(draw)[1]['culled'] == 0
+
+
+def test_clipped_and_form_content_replayed_untouched():
+    def draw(c):
+        c.beginForm('ring')
+        c.setFillColor(Color(1, 0, 0, alpha=0.0001))
+        c.circle(-50, -50, 1, fill=1, stroke=0)    # faint and off the page, but in a form
+        c.endForm()
+        c.saveState()
+        p = c.beginPath()
+        p.rect(0, 0, 100, 100)
+        c.clipPath(p, stroke=0)
+        c.setFillColor(Color(0, 0, 1))
+        c.circle(-50, -50, 1, fill=1, stroke=0)    # off the page, but clipped
+        c.restoreState()
+        c.doForm('ring')
+
+    pdf, s = culled(draw)
+    assert s['culled'] == 0 and s['primitives'] == 1      # only the doForm is judged
+    assert b'0 0 1 rg' in pdf and b'/FormXob.ring Do' in pdf
+
+
+def test_dropped_primitive_takes_its_transform_and_state_pair():
+    def draw(c):
+        c.saveState()
+        c.translate(1000, 0)
+        c.setFillColor(Color(0.2, 0.4, 0.6))
+        c.rect(0, 0, 10, 10, fill=1, stroke=0)       # off the page under the translate
+        c.restoreState()
+        c.rect(0, 0, 10, 10, fill=1, stroke=0)       # untransformed again: kept
+
+    pdf, s = culled(draw)
+    assert s['culled'] == 1 and s['dropped_states'] == 2   # the cm and the colour
+    assert b'1000 0 cm' not in pdf and b'0.2 0.4 0.6 rg' not in pdf
+    assert pdf.count(b'0 0 10 10 re') == 1 and b'\nq\n' not in pdf
+
+
+def test_restore_state_brings_back_the_tracked_fill():
+    def draw(c):
+        c.setFillColor(Color(1, 1, 1))
+        c.saveState()
+        c.setFillColor(Color(1, 1, 1, alpha=0.5))
+        c.restoreState()
+        c.setFillColor(Color(0, 1, 0))
+        c.circle(100, 100, 10, fill=1, stroke=0)
+        c.setFillColor(Color(1, 1, 1))
+        c.rect(50, 50, 100, 100, fill=1, stroke=0)   # opaque again after the restore
+
+    assert culled(draw)[1]['by_reason']['covered'] == 1
+
+
+def test_glow_stacks_are_counted_not_collapsed():
+    def draw(c):
+        c.setFillColor(Color(1, 1, 0, alpha=0.05))
+        for r in range(10, 0, -1):
+            c.circle(200, 200, r * 5, fill=1, stroke=0)
+        c.circle(100, 100, 5, fill=1, stroke=0)
+
+    pdf, s = culled(draw)
+    assert s['glow_stacks'] == 1 and s['glow_fills'] == 10
+    assert s['culled'] == 0                               # reported only; still drawn
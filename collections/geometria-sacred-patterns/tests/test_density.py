@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from geometria import density
+
+
+def test_add_bins_points_top_row_first():
+    hist = density.Histogram((0, 0, 72, 36), dpi=72)          # one pixel per point
+    assert hist.counts.shape == (36, 72)
+    hist.add([0.5, 0.5, 71.5, 100], [35.5, 35.5, 0.5, 10])    # the last one is off the grid
+    assert hist.total == 3 and hist.counts.sum() == 3
+    assert hist.counts[0, 0] == 2 and hist.counts[35, 71] == 1
+
+
+def test_colors_average_per_bin():
+    hist = density.Histogram((0, 0, 10, 10), dpi=72)
+    hist.add([5.5, 5.5], [5.5, 5.5], colors=[(1, 0, 0), (0, 0, 1)])
+    px = hist.image(tone='linear').getpixel((5, 4))
+    assert px == (128, 0, 128, 255)
+
+
+def test_splat_spreads_over_a_disc():
+    hist = density.Histogram((0, 0, 20, 20), dpi=72)
+    hist.add([10.5], [10.5]).splat(1.0)
+    assert hist.counts.sum() == 5                             # centre and four neighbours
+    assert hist.counts[9, 10] == hist.counts[9, 9] == 1 and hist.counts[8, 8] == 0
+
+
+def test_tones():
+    hist = density.Histogram((0, 0, 4, 1), dpi=72)
+    hist.add([0.5, 1.5, 1.5, 2.5, 2.5, 2.5], [0.5] * 6)
+    np.testing.assert_allclose(hist.tone('linear')[0], [1/3, 2/3, 1, 0])
+    np.testing.assert_allclose(hist.tone('log')[0], np.log1p([1, 2, 3, 0]) / np.log1p(3))
+    np.testing.assert_allclose(hist.tone('over', alpha=0.5)[0], [0.5, 0.75, 0.875, 0])
+    assert hist.percentile(50) == 2.0
+    with pytest.raises(ValueError, match='unknown tone'):
+        hist.tone('sqrt')
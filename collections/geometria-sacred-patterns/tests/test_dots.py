@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+from reportlab.pdfgen.canvas import Canvas
+
+from geometria import dots, polyline, raster
+
+
+@pytest.fixture
+def dots_mode(monkeypatch):
+    monkeypatch.setenv(dots.ENV, dots.DEFAULT)       # restored after the test
+    monkeypatch.setenv(polyline.ENV, '')
+    return dots.set_mode
+
+
+def page(tmp_path):
+    return Canvas(str(tmp_path / 'd.pdf'))
+
+
+def ops(c, *names):
+    return sum(line.rsplit(' ', 1)[-1] in names for line in c._code)
+
+
+def test_parsing(dots_mode):
+    assert dots.parse('') == dots.parse(None) == 'form'
+    assert dots.parse(' Path ') == 'path'
+    with pytest.raises(ValueError, match='unknown dots mode'):
+        dots_mode('circles')
+
+
+def test_bins_keep_first_appearance_order():
+    rgb = np.array([[0, 0, 1], [1, 0, 0], [0, 0, 1], [1, 0, 0], [0, 1, 0]], dtype=float)
+    groups = dots.bins(rgb, np.ones(5), n=0)
+    assert [style for style, _ in groups] == [(0, 0, 1, 1), (1, 0, 0, 1), (0, 1, 0, 1)]
+    assert [idx.tolist() for _, idx in groups] == [[0, 2], [1, 3], [4]]
+
+
+def test_bins_exact_by_default_and_quantized_on_request(dots_mode):
+    alpha = np.linspace(0.1, 0.2, 7)
+    rgb = np.ones((7, 3))
+    assert len(dots.bins(rgb, alpha)) == 7
+    assert len(dots.bins(rgb, alpha, n=2)) == 2
+    styles = [style[3] for style, _ in dots.bins(rgb, alpha, n=2)]
+    assert min(styles) >= 0.1 and max(styles) <= 0.2
+
+
+def test_form_places_one_xobject_per_dot(tmp_path, dots_mode):
+    c = page(tmp_path)
+    rgb = [[1, 0, 0], [0, 0, 1], [1, 0, 0]]
+    assert dots.fill(c, [10, 20, 30], [10, 20, 30], [1, 0, 2], rgb=rgb) == 2
+    assert c.hasForm(dots.FORM)
+    assert ops(c, 'Do') == 2                        # the zero-radius dot is skipped
+    assert ops(c, 'rg') == 2
+    c.save()
+
+
+def test_path_mode_fills_each_bin_once(tmp_path, dots_mode):
+    dots_mode('path')
+    c = page(tmp_path)
+    assert dots.fill(c, np.arange(6.0), np.zeros(6), 0.5, rgb=(1, 1, 1),
+                     alpha=[0.5, 1] * 3) == 2
+    assert ops(c, 'f') == 2 and ops(c, 'f*', 'Do') == 0 and not c.hasForm(dots.FORM)
+
+
+def test_off_mode_draws_every_dot_in_order(tmp_path, dots_mode):
+    dots_mode('off')
+    c = page(tmp_path)
+    assert dots.fill(c, np.arange(4.0), np.zeros(4), 1.0, rgb=(1, 1, 1)) == 4
+    assert ops(c, 'f', 'f*') == 4
+
+
+def test_lengths_are_checked(tmp_path, dots_mode):
+    with pytest.raises(ValueError, match='alpha has 2 entries for 3 dots'):
+        dots.fill(page(tmp_path), [1, 2, 3], [1, 2, 3], 1.0, alpha=[1, 1])
+    assert dots.fill(page(tmp_path), [], [], 1.0) == 0
+
+
+def test_layer_gets_the_arrays_unbinned():
+    layer = raster.Layer((0, 0, 10, 10), dpi=72)
+    rgb = [[1, 0, 0], [0, 1, 0], [1, 0, 0]]
+    assert dots.fill(layer, [1, 5, 9], [1, 5, 9], 0.5, rgb=rgb, buckets=1) == 1
+    assert len(layer) == 3
+    np.testing.assert_array_equal(layer._batches[0][3], rgb)
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from geometria import bench, escape
+
+
+def test_julia_counts_match_scalar_loop():
+    res = 60
+    expected = np.array(bench.julia(res)()).reshape(res, res)
+    esc = escape.julia(complex(-0.7, 0.27015), res, max_iter=80)
+    np.testing.assert_array_equal(esc.counts, expected)
+    np.testing.assert_array_equal(esc.escaped, expected < 80)
+
+
+def test_mandelbrot_counts_match_scalar_loop():
+    res, max_iter = 40, 50
+    esc = escape.mandelbrot(res, max_iter=max_iter)
+    for ix in range(0, res, 3):
+        for iy in range(0, res, 3):
+            c = complex(-0.5 + (ix / res - 0.5) * 3.0, (iy / res - 0.5) * 3.0)
+            z, n = 0j, 0
+            while abs(z) < 2 and n < max_iter:
+                z = z * z + c
+                n += 1
+            assert esc.counts[ix, iy] == n
+
+
+def test_potential_needs_smooth():
+    with pytest.raises(ValueError):
+        escape.julia(complex(-0.7, 0.27015), 20).potential
+    p = escape.julia(complex(-0.7, 0.27015), 20, smooth=True).potential
+    assert p.min() >= 0 and p.max() <= 1
+    assert (p[~escape.julia(complex(-0.7, 0.27015), 20).escaped] == 1).all()
+
+
+def test_smooth_count_matches_scalar_formula():
+    res, c = 30, complex(-0.7, 0.27015)
+    esc = escape.julia(c, res, max_iter=80, smooth=True)
+    for ix in range(0, res, 2):
+        for iy in range(0, res, 2):
+            z, n = complex((ix / res - 0.5) * 3.0, (iy / res - 0.5) * 3.0), 0
+            while abs(z) < 2 and n < 80:
+                z = z * z + c
+                n += 1
+            if n < 80:
+                nu = n + 1 - np.log2(np.log(abs(z)))
+                assert esc.smooth[ix, iy] == pytest.approx(nu)
+                assert esc.potential[ix, iy] == pytest.approx(min(max(nu / 80, 0), 1))
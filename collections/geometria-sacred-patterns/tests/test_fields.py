@@ -0,0 +1,79 @@
+import math
+
+import numpy as np
+
+from geometria import fields
+
+
+def chladni(s, n, m):
+    return (np.sin(n * np.pi * s.x) * np.sin(m * np.pi * s.y) -
+            np.sin(m * np.pi * s.x) * np.sin(n * np.pi * s.y))
+
+
+def test_chladni_nodal_points_match_016_loop():
+    res, modes = 60, [(2, 3), (3, 5), (4, 7), (5, 6)]
+    plate = fields.Sampler.square(res).within(r2=0.95)
+    nodal = plate.threshold(plate.evaluate(chladni, n=[n for n, m in modes],
+                                           m=[m for n, m in modes]), below=0.06)
+    for (n, m), pts in zip(modes, nodal):
+        expected = []
+        for ix in range(res):
+            for iy in range(res):
+                x = (ix / res - 0.5) * 2
+                y = (iy / res - 0.5) * 2
+                if x*x + y*y > 0.95:
+                    continue
+                val = math.sin(n * math.pi * x) * math.sin(m * math.pi * y) - \
+                    math.sin(m * math.pi * x) * math.sin(n * math.pi * y)
+                if abs(val) < 0.06:
+                    expected.append((x, y, val))
+        got = list(pts.rows())
+        assert [(x, y) for x, y, _ in got] == [(x, y) for x, y, _ in expected]
+        np.testing.assert_allclose([v for *_, v in got], [v for *_, v in expected],
+                                   atol=1e-12)
+
+
+def test_interference_matches_025_loop():
+    res, W, H, wavelength = 50, 842, 1191, 40
+    s1, s2 = (W/2 - 60, H/2 + 50), (W/2 + 60, H/2 + 50)
+    page = fields.Sampler(fields.linear(res, 0, W), fields.linear(res, 140, H - 160))
+
+    def waves(s):
+        return sum(np.sin(2 * np.pi * fields.distance(s, src) / wavelength) for src in (s1, s2))
+    got = list(page.threshold((page.evaluate(waves) / 2) ** 2, above=0.3).rows())
+    expected = []
+    for ix in range(res):
+        for iy in range(res):
+            px = ix / res * W
+            py = 140 + iy / res * (H - 160)
+            d1 = math.hypot(px - s1[0], py - s1[1])
+            d2 = math.hypot(px - s2[0], py - s2[1])
+            wave = math.sin(2 * math.pi * d1 / wavelength) + math.sin(2 * math.pi * d2 / wavelength)
+            if (wave / 2) ** 2 > 0.3:
+                expected.append((px, py, (wave / 2) ** 2))
+    assert [(x, y) for x, y, _ in got] == [(x, y) for x, y, _ in expected]
+    np.testing.assert_allclose([v for *_, v in got], [v for *_, v in expected], atol=1e-12)
+
+
+def test_membrane_modes_match_037_loop():
+    res, modes = 40, [(0, 1), (1, 1), (2, 1), (0, 2), (1, 2)]
+    disc = fields.Sampler.square(res).within(radius=0.95)
+    shapes = disc.threshold(
+        disc.evaluate(lambda s, n, m: np.sin(m * np.pi * s.r) * np.cos(n * s.theta),
+                      n=[n for n, m in modes], m=[m for n, m in modes]), above=0.1)
+    for (n, m), pts in zip(modes, shapes):
+        expected = []
+        for ix in range(res):
+            for iy in range(res):
+                x = (ix / res - 0.5) * 2
+                y = (iy / res - 0.5) * 2
+                r = math.sqrt(x*x + y*y)
+                if r > 0.95:
+                    continue
+                val = math.sin(m * math.pi * r) * math.cos(n * math.atan2(y, x))
+                if abs(val) > 0.1:
+                    expected.append((x, y, val))
+        got = list(pts.rows())
+        assert [(x, y) for x, y, _ in got] == [(x, y) for x, y, _ in expected]
+        np.testing.assert_allclose([v for *_, v in got], [v for *_, v in expected],
+                                   atol=1e-12)
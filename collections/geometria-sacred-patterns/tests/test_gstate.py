@@ -0,0 +1,74 @@
+import pytest
+from reportlab.lib.colors import Color
+
+from geometria import gstate, instrument
+
+
+def state_canvas(tmp_path, levels=0):
+    inner = instrument.InstrumentedCanvas(str(tmp_path / 'g.pdf'))
+    return gstate.StateCanvas(inner, levels=levels), inner
+
+
+def test_dedup_drops_repeated_state(tmp_path):
+    c, inner = state_canvas(tmp_path)
+    for _ in range(3):
+        c.setFillColor(Color(1, 0, 0, alpha=0.5))
+        c.setLineWidth(2)
+        c.setFont('Courier', 8)
+        c.circle(10, 10, 5, fill=1, stroke=0)
+    assert inner.calls['setFillColor'] == inner.calls['setLineWidth'] == 1
+    assert inner.calls['setFont'] == 1
+    assert c.saved == {'rg': 2, 'w': 2, 'Tf': 2}
+
+
+def test_alpha_only_change_writes_the_alpha(tmp_path):
+    c, inner = state_canvas(tmp_path)
+    c.setStrokeColor(Color(0, 1, 0, alpha=0.2))
+    c.setStrokeColor(Color(0, 1, 0, alpha=0.3))
+    assert inner.calls['setStrokeColor'] == 1 and inner.calls['setStrokeAlpha'] == 1
+    assert c.saved == {'RG': 1}
+
+
+def test_restore_state_brings_back_the_outer_state(tmp_path):
+    c, inner = state_canvas(tmp_path)
+    c.setLineWidth(1)
+    c.saveState()
+    c.setLineWidth(3)
+    c.restoreState()
+    c.setLineWidth(1)                   # already in effect again: dropped
+    c.setLineWidth(3)                   # written: the restore undid it
+    assert inner.calls['setLineWidth'] == 3 and c.saved == {'w': 1}
+
+
+def test_text_objects_forget_colours(tmp_path):
+    c, inner = state_canvas(tmp_path)
+    c.setFillColor(Color(1, 1, 1))
+    t = c.beginText(10, 10)
+    t.setFillColor(Color(1, 0, 0))
+    c.drawText(t)
+    c.setFillColor(Color(1, 1, 1))
+    assert inner.calls['setFillColor'] == 2
+
+
+def test_quantize_shares_extgstates(tmp_path):
+    alphas = [0.4, 0.4001, 0.4002, 0.7, 0.70001]
+    counts = {}
+    for levels in (0, 256):
+        c, inner = state_canvas(tmp_path, levels)
+        for a in alphas:
+            c.setFillColor(Color(0.2, 0.3, 0.4, alpha=a))
+            c.circle(10, 10, 5, fill=1, stroke=0)
+        c.save()
+        counts[levels] = (inner.gstates, c.summary()['saved_states'])
+    assert counts == {0: (5, 0), 256: (2, 3)}
+    c, _ = state_canvas(tmp_path, 256)
+    assert c._quantize(0.4) == 0.4 and c._quantize(1.0) == 1.0 and c._quantize(0.0) == 0.0
+
+
+def test_parse(monkeypatch):
+    assert gstate.parse(None) == 'dedup' and gstate.parse(' 256 ') == 256
+    for bad in ('1', 'fast'):
+        with pytest.raises(ValueError, match='unknown gstate mode'):
+            gstate.parse(bad)
+    monkeypatch.setenv(gstate.ENV, 'off')
+    assert gstate.mode() == 'off'
@@ -0,0 +1,38 @@
+from reportlab.lib.colors import Color
+from reportlab.pdfgen import canvas
+
+from geometria import instrument
+
+
+def test_instrumented_counts_calls_and_redundant_state(tmp_path):
+    with instrument.instrumented() as canvases:
+        c = canvas.Canvas(str(tmp_path / 'i.pdf'))
+        c.setFillColor(Color(1, 0, 0))
+        c.setFillColor(Color(1, 0, 0))          # redundant
+        c.saveState()
+        c.setLineWidth(2)
+        c.restoreState()
+        c.setLineWidth(2)                       # restored away, so not redundant
+        c.setLineWidth(2)                       # redundant
+        for _ in range(4):
+            c.circle(10, 10, 5)
+        c.save()
+    assert canvas.Canvas is instrument._Canvas
+    assert len(canvases) == 1 and (tmp_path / 'i.pdf').exists()
+    s = canvases[0].summary()
+    assert s['ops']['circle'] == 4 and s['ops']['setFillColor'] == 2
+    assert s['redundant'] == {'setFillColor': 1, 'setLineWidth': 1}
+    assert s['redundant_pct'] == 40.0
+    assert s['bound'] in ('compute', 'emit') and s['gstate'] is None
+
+
+def test_report_round_trip(tmp_path):
+    with instrument.instrumented() as canvases:
+        c = canvas.Canvas(str(tmp_path / 'i.pdf'))
+        c.line(0, 0, 1, 1)
+        c.save()
+    summary = canvases[0].summary()
+    table = instrument.format_table([('001', summary)]).splitlines()
+    assert table[1].split()[0] == '001'
+    path = instrument.write_report({'001': summary}, tmp_path)
+    assert path.endswith('canvas-profile.json')
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from geometria import bench, ode, simcache, trajectory
+
+
+def oscillator(t, s):
+    """y'' = -y as a first-order system; from (1, 0) the solution is (cos t, -sin t)."""
+    return np.column_stack([s[:, 1], -s[:, 0]])
+
+
+def error(method, dt, end=2.0, **kwargs):
+    ens = ode.integrate(oscillator, [[1.0, 0.0], [0.0, 1.0]], dt, round(end / dt), method=method,
+                        **kwargs)
+    t = ens.t[-1]
+    exact = np.array([[np.cos(t), -np.sin(t)], [np.sin(t), np.cos(t)]])
+    return np.abs(ens.states[-1] - exact).max()
+
+
+@pytest.mark.parametrize('method, order', [('euler', 1), ('rk4', 4)])
+def test_fixed_step_convergence_order(method, order):
+    ratio = error(method, 0.02) / error(method, 0.01)
+    assert ratio == pytest.approx(2 ** order, rel=0.1)
+
+
+def test_rk45_meets_tolerance_on_coarse_output():
+    assert error('rk45', 0.5, rtol=1e-10, atol=1e-12) < 1e-8
+    assert error('rk45', 0.5, rtol=1e-4, atol=1e-6) > error('rk45', 0.5, rtol=1e-10, atol=1e-12)
+
+
+def test_euler_matches_trajectory_and_scalar_loop():
+    with simcache.disabled():
+        single = trajectory.lorenz(300)
+    ens = ode.integrate(ode.lorenz(), [(0.1, 0.0, 0.0)], 0.005, 300)
+    np.testing.assert_array_equal(ens.trajectory(0).coords, single.coords)
+
+    paths = np.array(bench.lorenz_flow(20, steps=50)())
+    ens = ode.integrate(ode.lorenz(), ode.ball((0.1, 0.0, 0.0), 5.0, 20, seed=7), 0.005, 50)
+    np.testing.assert_array_equal(ens.segments(), paths)
+
+
+def test_discard_and_every():
+    ens = ode.integrate(oscillator, [[1.0, 0.0]], 0.1, 10, discard=5, every=3)
+    np.testing.assert_allclose(ens.t, [0.8, 1.1, 1.4])
+    assert ens.states.shape == (3, 1, 2)
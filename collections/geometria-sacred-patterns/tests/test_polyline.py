@@ -0,0 +1,136 @@
+import numpy as np
+import pytest
+from reportlab.pdfgen.pathobject import PDFPathObject
+
+from geometria import polyline
+
+
+def rdp(points, tol):
+    """Recursive Ramer-Douglas-Peucker with the clamped segment distance."""
+    a, b = points[0], points[-1]
+    d = b - a
+    t = np.clip((points - a) @ d / max(d @ d, 1e-300), 0, 1) if d @ d else np.zeros(len(points))
+    dist = np.hypot(*(points - a - t[:, None] * d).T)
+    i = int(np.argmax(dist[1:-1])) + 1 if len(points) > 2 else 0
+    if len(points) < 3 or dist[i] <= tol:
+        return [True] + [False] * (len(points) - 2) + [True]
+    return rdp(points[:i + 1], tol)[:-1] + rdp(points[i:], tol)
+
+
+class Recorder:
+    """Just enough canvas for polyline.stroke: keeps each path's operators."""
+
+    def __init__(self):
+        self.paths = []
+
+    def beginPath(self):
+        return PDFPathObject()
+
+    def drawPath(self, path, **kwargs):
+        self.paths.append([op.split() for op in path._code if op != 'n'])
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class StateRecorder(Recorder):
+    """Recorder that also logs state calls and stroke colours."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def saveState(self):
+        self.calls.append('q')
+
+    def restoreState(self):
+        self.calls.append('Q')
+
+    def setLineJoin(self, join):
+        self.calls.append(('j', join))
+
+    def setStrokeColor(self, color):
+        self.calls.append(('RG', color.red, color.green, color.blue, color.alpha))
+
+
+def test_default_styles_are_exact(monkeypatch):
+    monkeypatch.setenv(polyline.ENV, '')
+    monkeypatch.setenv(polyline.SIMPLIFY_ENV, 'off')
+    assert polyline.buckets() == 0
+    rgb = np.c_[np.linspace(0, 1, 9), np.zeros(9), np.zeros(9)]
+    c = StateRecorder()
+    assert polyline.stroke(c, np.arange(10.0), np.zeros(10), rgb=rgb) == 9
+    reds = [call[1] for call in c.calls if call[0] == 'RG']
+    assert reds == rgb[:, 0].tolist()
+
+
+def test_per_vertex_styles_use_the_start_vertex(monkeypatch):
+    monkeypatch.setenv(polyline.SIMPLIFY_ENV, 'off')
+    c = StateRecorder()
+    alpha = [0.1, 0.2, 0.3, 0.4]                           # one per vertex
+    assert polyline.stroke(c, np.arange(4.0), np.zeros(4), alpha=alpha, buckets=0) == 3
+    assert [call[4] for call in c.calls if call[0] == 'RG'] == [0.1, 0.2, 0.3]
+
+
+@pytest.mark.parametrize('name, value', [('rgb', np.zeros((6, 3))), ('alpha', [1.0] * 2),
+                                         ('width', [1.0] * 7)])
+def test_style_length_must_match_segments_or_vertices(name, value):
+    with pytest.raises(ValueError, match=name):
+        polyline.stroke(Recorder(), np.arange(5.0), np.zeros(5), **{name: value})
+
+
+def test_join_is_scoped_to_the_curve(monkeypatch):
+    monkeypatch.setenv(polyline.SIMPLIFY_ENV, 'off')
+    rgb = np.repeat([[1.0, 0, 0], [0, 0, 1.0]], 2, axis=0)
+    c = StateRecorder()
+    polyline.stroke(c, np.arange(5.0), np.zeros(5), rgb=rgb, buckets=0)
+    states = [call for call in c.calls if call[0] != 'RG']
+    assert states == ['q', ('j', 1), 'Q']                 # once per curve, not per run
+    c = StateRecorder()
+    polyline.stroke(c, np.arange(5.0), np.zeros(5), rgb=rgb, buckets=0, join=None)
+    assert all(call[0] == 'RG' for call in c.calls)
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_simplify_matches_recursive_rdp(seed):
+    rng = np.random.default_rng(seed)
+    pts = np.cumsum(rng.normal(size=(300, 2)), axis=0)
+    kept = polyline.simplify(pts[:, 0], pts[:, 1], 1.5)
+    np.testing.assert_array_equal(kept, rdp(pts, 1.5))
+
+
+def test_simplify_keeps_ends_and_fixed_vertices():
+    xs = np.arange(10.0)
+    assert polyline.simplify(xs, np.zeros(10), 0).tolist() == [True] + [False] * 8 + [True]
+    fixed = np.zeros(10, dtype=bool)
+    fixed[4] = True
+    assert np.flatnonzero(polyline.simplify(xs, np.zeros(10), 0, fixed)).tolist() == [0, 4, 9]
+
+
+def test_stroke_keeps_run_start_segments(monkeypatch):
+    monkeypatch.setenv(polyline.SIMPLIFY_ENV, '0.5')
+    xs = np.linspace(0, 99, 100)
+    rgb = np.where(np.arange(99)[:, None] < 60, [1.0, 0.0, 0.0], [0.0, 0.0, 1.0])
+    c = Recorder()
+    assert polyline.stroke(c, xs, np.zeros(100), rgb=rgb, buckets=0) == 2
+    first, second = c.paths
+    # run one ends at the midpoint of segment 60, where run two starts
+    assert first[-1][:2] == second[0][:2] == ['60.5', '0']
+    assert second[1][:2] == ['61', '0']                   # segment 60 keeps its end vertex
+    assert len(first) == 3 and len(second) == 3            # the straight rest is gone
+
+
+def test_stroke_off_keeps_every_vertex(monkeypatch):
+    monkeypatch.setenv(polyline.SIMPLIFY_ENV, 'off')
+    c = Recorder()
+    polyline.stroke(c, np.arange(50.0), np.zeros(50))
+    assert len(c.paths[0]) == 50
+
+
+def test_tolerance_parsing():
+    assert polyline.parse_tolerance('off') == 'off'
+    assert polyline.parse_tolerance('') == 'off'
+    assert polyline.parse_tolerance('0.5') == 0.5
+    for bad in ('-1', 'fast', 'nan'):
+        with pytest.raises(ValueError):
+            polyline.parse_tolerance(bad)
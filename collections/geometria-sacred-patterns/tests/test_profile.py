@@ -0,0 +1,37 @@
+from reportlab.pdfgen import canvas
+
+from geometria import profile
+
+
+def test_counting_primitives_counts_and_restores(tmp_path):
+    original = canvas.Canvas.circle
+    with profile.counting_primitives() as counts:
+        c = canvas.Canvas(str(tmp_path / 'p.pdf'))
+        for _ in range(3):
+            c.circle(10, 10, 5)
+        c.line(0, 0, 1, 1)
+        c.setFillColorRGB(1, 0, 0)      # state, not a primitive
+    assert counts == {'circle': 3, 'line': 1}
+    assert canvas.Canvas.circle is original
+
+
+def record(key, wall):
+    return {'key': key, 'wall_s': wall, 'cpu_s': wall, 'peak_rss_mb': 1.0,
+            'output_bytes': 2048, 'primitives': 10}
+
+
+def test_reports_merge_by_key(tmp_path):
+    assert profile.load_report(tmp_path) == []
+    profile.write_reports([record('gif01', 1.0), record('002', 2.0)], tmp_path)
+    json_path, csv_path = profile.write_reports([record('002', 3.0), record('001', 0.5)],
+                                                tmp_path)
+    report = profile.load_report(tmp_path)
+    assert [r['key'] for r in report] == ['001', '002', 'gif01']
+    assert report[1]['wall_s'] == 3.0
+    with open(csv_path) as fh:
+        assert fh.readline().strip() == ','.join(profile.FIELDS)
+
+
+def test_format_table_sorts_heaviest_first():
+    lines = profile.format_table([record('001', 0.5), record('002', 3.0)]).splitlines()
+    assert [line.split()[0] for line in lines] == ['item', '002', '001', 'total']
@@ -0,0 +1,38 @@
+import pytest
+
+from geometria import quality
+
+
+@pytest.fixture
+def level(monkeypatch):
+    monkeypatch.setenv(quality.ENV, quality.DEFAULT)     # restored after the test
+    return quality.set_level
+
+
+def test_final_keeps_todays_constants(level):
+    assert quality.level() == 'final'
+    assert (quality.count(200000), quality.grid(350), quality.depth(16, 2),
+            quality.frames(60), quality.pixels(600)) == (200000, 350, 16, 60, 600)
+
+
+def test_draft_scales_samples(level):
+    level('Draft')
+    assert quality.level() == 'draft'
+    assert quality.count(200000) == 6000
+    assert quality.grid(350) == 61                      # cells scale by density
+    assert quality.depth(16, 2) == 11                   # 2^-5 ≈ 3% of the segments
+    assert quality.frames(60) == 8 and quality.grid(10) == 8
+    assert quality.pixels(600) == 200                   # never below a third
+
+
+def test_print_never_enlarges_gifs(level):
+    level('print')
+    assert quality.count(100) == 200 and quality.pixels(600) == 600
+
+
+def test_unknown_level(level, monkeypatch):
+    with pytest.raises(ValueError, match='unknown quality'):
+        level('ultra')
+    monkeypatch.setenv(quality.ENV, 'ultra')
+    with pytest.raises(ValueError, match='unknown quality'):
+        quality.level()
@@ -0,0 +1,85 @@
+import math
+
+import numpy as np
+
+from geometria import bench, bessel, radial
+
+RES = 120
+
+
+def per_pixel(value, keep):
+    """The old nested loop: (ix, iy, r, value) for every kept pixel, ix-major."""
+    out = []
+    for ix in range(RES):
+        for iy in range(RES):
+            x = (ix / RES - 0.5) * 2
+            y = (iy / RES - 0.5) * 2
+            r = math.sqrt(x*x + y*y)
+            if r > 0.98:
+                continue
+            v = value(r)
+            if keep(r, v):
+                out.append((ix, iy, r, v))
+    return out
+
+
+def airy_alpha(r, i):
+    return np.minimum(0.8, i * 1.5)
+
+
+def airy_field(**kwargs):
+    return radial.field(RES, profile=lambda r: bessel.airy(r * 25),
+                        color=lambda r, i: np.stack([i, i, i], axis=-1), alpha=airy_alpha,
+                        keep=lambda r, i: i >= 0.005, **kwargs)
+
+
+def fringe_alpha(r, ph):
+    return (0.5 + 0.5 * np.cos(ph * 2 * math.pi)) ** 2 * (1.0 - r * 0.5) * 0.5
+
+
+def rings_field(**kwargs):
+    return radial.field(RES, profile=lambda r: r * r * 40,
+                        color=lambda r, ph: radial.hsv_to_rgb(ph % 1.0, 0.8, 0.9),
+                        alpha=fringe_alpha, keep=lambda r, ph: fringe_alpha(r, ph) >= 0.02,
+                        **kwargs)
+
+
+def test_airy_matches_per_pixel_evaluation():
+    expected = per_pixel(lambda r: bessel.airy(r * 25), lambda r, i: i >= 0.005)
+    f = airy_field()
+    ix, iy, r, value = (list(col) for col in zip(*expected))
+    assert (f.ix, f.iy) == (ix, iy)
+    np.testing.assert_allclose(f.r, r, rtol=1e-15)
+    np.testing.assert_allclose(f.value, value, rtol=1e-12)
+    np.testing.assert_allclose(f.alpha, airy_alpha(None, np.array(value)), rtol=1e-12)
+    x = radial.axis(RES)
+    assert f.x[5] == x[ix[5]] and f.y[5] == x[iy[5]]
+
+
+def test_airy_sampled_profile_stays_close():
+    exact = airy_field()
+    f = airy_field(samples=4096)
+    common = set(zip(exact.ix, exact.iy)) & set(zip(f.ix, f.iy))
+    assert len(common) >= 0.99 * len(exact)          # only pixels at the cutoff differ
+    want = dict(zip(zip(exact.ix, exact.iy), exact.value))
+    got = dict(zip(zip(f.ix, f.iy), f.value))
+    assert max(abs(got[p] - want[p]) for p in common) < 1e-4
+
+
+def test_rings_match_per_pixel_loop():
+    expected = bench.rings(RES)()                     # the poster's original loop
+    f = rings_field()
+    assert len(f) == len(expected)
+    np.testing.assert_allclose(f.rgb, [rgb for rgb, _ in expected], atol=1e-12)
+    np.testing.assert_allclose(f.alpha, [a for _, a in expected], atol=1e-12)
+
+
+def test_rings_sampled_profile_stays_close():
+    exact = rings_field()
+    f = rings_field(samples=1 << 16)
+    want = dict(zip(zip(exact.ix, exact.iy), zip(exact.rgb, exact.alpha)))
+    got = dict(zip(zip(f.ix, f.iy), zip(f.rgb, f.alpha)))
+    common = set(want) & set(got)
+    assert len(common) >= 0.99 * len(want)
+    assert max(np.abs(np.subtract(got[p][0], want[p][0])).max() for p in common) < 2e-3
+    assert max(abs(got[p][1] - want[p][1]) for p in common) < 1e-5
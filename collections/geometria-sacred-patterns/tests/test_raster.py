@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+from reportlab.lib.colors import Color
+from reportlab.pdfgen.canvas import Canvas
+
+from geometria import dots, quality, raster, registry
+
+
+@pytest.fixture
+def selected(monkeypatch):
+    monkeypatch.setenv(raster.ENV, 'off')           # restored after the test
+    return raster.set_mode
+
+
+def test_selection(selected):
+    assert raster.mode() == 'off' and not raster.enabled(54)
+    selected('57, 054')
+    assert raster.mode() == '054,057' and raster.enabled(54) and not raster.enabled(25)
+    with pytest.raises(ValueError, match='unknown raster selection'):
+        selected('54,x')
+
+
+def test_layer_is_the_canvas_unless_selected(selected):
+    c = object()
+    assert raster.layer(c, 54, (0, 0, 10, 10)) is c
+    selected('all')
+    assert isinstance(raster.layer(c, 54, (0, 0, 10, 10)), raster.Layer)
+
+
+def test_render_composites_over_in_drawing_order():
+    layer = raster.Layer((0, 0, 36, 36), dpi=72)     # one pixel per point
+    layer.setFillColor(Color(1, 0, 0, alpha=0.5))
+    layer.circle(18, 18, 10)
+    layer.setFillColor(Color(0, 0, 1, alpha=0.5))
+    layer.circle(18, 18, 10)
+    r, g, b, a = layer.render().getpixel((18, 18))
+    # blue over red: premultiplied (0.25, 0, 0.5), coverage 0.75
+    assert a == round(0.75 * 255) and (r, g, b) == (round(255 / 3), 0, round(255 * 2 / 3))
+    assert layer.render().getpixel((0, 0))[3] == 0
+
+
+def test_dots_fill_hands_a_layer_exact_arrays():
+    layer = raster.Layer((0, 0, 10, 10), dpi=72)
+    rgb = np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+    assert dots.fill(layer, [1, 5, 9], [1, 5, 9], 0.5, rgb=rgb, alpha=[0.1, 0.2, 0.3]) == 1
+    assert len(layer) == 3
+    xs, ys, rs, colors, alpha = layer._batches[0]
+    np.testing.assert_array_equal(colors, rgb)
+    np.testing.assert_array_equal(alpha, [0.1, 0.2, 0.3])
+
+
+MARKS = ('rect', 'circle', 'line', 'drawPath', 'drawCentredString', 'drawImage', 'doForm')
+
+
+@pytest.fixture
+def marks(monkeypatch, tmp_path, selected):
+    """Render posters with raster on at draft quality; yields the marking calls in order."""
+    monkeypatch.setenv(quality.ENV, 'draft')
+    monkeypatch.setattr(registry, '_out_dir', registry._out_dir)
+    registry.load()
+    registry.set_output_dir(tmp_path)
+    selected('all')
+    calls = []
+    for name in MARKS:
+        original = getattr(Canvas, name)
+
+        def recorded(self, *args, _name=name, _original=original, **kwargs):
+            calls.append(_name)
+            return _original(self, *args, **kwargs)
+        monkeypatch.setattr(Canvas, name, recorded)
+
+    def render(number):
+        calls.clear()
+        registry.get('poster', number).func()
+        return list(calls)
+    return render
+
+
+@pytest.mark.parametrize('number', [25, 31])
+def test_opaque_layers_only_cover_the_background(marks, number):
+    calls = marks(number)
+    assert calls[:2] == ['rect', 'drawImage']       # bg(), then the layer
+
+
+def test_037_places_each_layer_before_its_label(marks):
+    calls = [m for m in marks(37) if m in ('circle', 'drawImage', 'drawCentredString')]
+    assert calls[:15] == ['circle', 'drawImage', 'drawCentredString'] * 5
@@ -0,0 +1,32 @@
+import random
+
+import numpy as np
+import pytest
+
+from geometria import bench, reaction
+
+
+@pytest.mark.parametrize('steps', [1, 2, 20])
+def test_clamped_matches_scalar_step(steps):
+    res = 24
+    expected = np.array(bench.gray_scott(res, steps=steps)())
+    random.seed(2025)
+    margin = min(20, res // 4)
+    spots = [(random.randint(margin, res - margin), random.randint(margin, res - margin))
+             for _ in range(15)]
+    rd = reaction.GrayScott(res, **reaction.PRESETS['turing'], dtype=np.float64)
+    for sx, sy in spots:
+        rd.seed_square(sx, sy)
+    np.testing.assert_array_equal(rd.step(steps).v, expected)
+
+
+def test_periodic_conserves_uniform_state():
+    rd = reaction.GrayScott(16, boundary='periodic', dtype=np.float64)
+    rd.step(5)
+    np.testing.assert_array_equal(rd.u, 1.0)
+    np.testing.assert_array_equal(rd.v, 0.0)
+
+
+def test_snapshots_every():
+    rd = reaction.GrayScott(16)
+    assert [step for step, _ in rd.snapshots(10, every=4)] == [4, 8, 10]
@@ -0,0 +1,44 @@
+import pytest
+
+from geometria import registry
+
+
+@pytest.fixture(scope='module', autouse=True)
+def catalogue():
+    registry.load()
+
+
+def keys(found):
+    return [it.key for it in found]
+
+
+def test_catalogue_is_complete():
+    posters = registry.items(kind='poster')
+    assert len(posters) == 60 and posters[0].key == '001' and posters[-1].key == '060'
+    assert all(it.kind == 'gif' for it in registry.items(kind='gif'))
+    assert keys(registry.items(series='031–045'))[::14] == ['031', '045']
+
+
+def test_select_numbers_ranges_and_gifs():
+    assert keys(registry.select(['031'])) == ['031']
+    assert keys(registry.select(['44-047'])) == ['044', '045', '046', '047']
+    assert keys(registry.select(['gif07', 'gif-1'])) == ['gif01', 'gif07']
+    assert keys(registry.select(['047', '031'])) == ['031', '047']     # catalogue order
+
+
+def test_select_slugs_and_tags():
+    assert keys(registry.select(['julia-set'])) == ['031']
+    tagged = registry.select(tags=['attractor'])
+    assert tagged and all('attractor' in it.tags for it in tagged)
+    assert keys(registry.select(['001'], tags=['attractor']))[0] == '001'
+
+
+def test_select_everything_by_default():
+    assert registry.select() == registry.items()
+
+
+def test_unknown_selector():
+    with pytest.raises(KeyError):
+        registry.select(['999'])
+    with pytest.raises(KeyError):
+        registry.select(['no-such-poster'])
@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+from PIL import Image
+from reportlab.lib.colors import Color
+from reportlab.pdfgen.canvas import Canvas
+
+from geometria import shading
+
+
+@pytest.fixture
+def glow_mode(monkeypatch):
+    monkeypatch.setenv(shading.ENV, shading.DEFAULT)  # restored after the test
+    return shading.set_mode
+
+
+def page(tmp_path):
+    return Canvas(str(tmp_path / 'g.pdf'), pageCompression=0)
+
+
+def ops(c, *names):
+    return sum(line.rsplit(' ', 1)[-1] in names for line in c._code)
+
+
+def stack_centre(r, rgb, alpha, falloff=1.0, edge=None):
+    """Opacity and colour at the centre of the discrete ring stack, rim first."""
+    edge = rgb if edge is None else edge
+    opacity, premul = 0.0, np.zeros(3)
+    for rr in range(r, 0, -1):
+        u = rr / r
+        a = alpha * (1 - u) ** falloff
+        ring = np.add(edge, np.multiply(np.subtract(rgb, edge), 1 - u))
+        opacity, premul = a + (1 - a) * opacity, a * ring + (1 - a) * premul
+    return opacity, premul / opacity
+
+
+def test_parsing(glow_mode):
+    assert shading.parse('') == shading.parse(None) == 'shading'
+    with pytest.raises(ValueError, match='unknown glow mode'):
+        glow_mode('rings')
+
+
+@pytest.mark.parametrize('r, alpha, falloff', [(30, 0.04, 1.0), (80, 0.02, 2.0), (12, 0.3, 1.0)])
+def test_profile_matches_the_ring_stack(r, alpha, falloff):
+    opacity, colour = shading.profile(float(r), (1.0, 0.5, 0.0), alpha, falloff)
+    assert opacity.shape == (shading.SAMPLES,) and colour.shape == (shading.SAMPLES, 3)
+    stack, _ = stack_centre(r, (1.0, 0.5, 0.0), alpha, falloff)
+    # the continuous limit lies between the stack and the stack with one more ring at u = 0
+    assert stack <= opacity[0] <= 1 - (1 - stack) * (1 - alpha)
+    assert opacity[-1] == pytest.approx(0, abs=1e-9)
+    assert np.all(np.diff(opacity) <= 1e-12)               # never brighter towards the rim
+    np.testing.assert_allclose(colour, [[1.0, 0.5, 0.0]] * shading.SAMPLES)
+
+
+def test_profile_blends_towards_the_edge_colour():
+    _, colour = shading.profile(40.0, (1.0, 1.0, 1.0), 0.05, edge=(0.0, 0.0, 1.0))
+    _, centre = stack_centre(40, (1.0, 1.0, 1.0), 0.05, edge=(0.0, 0.0, 1.0))
+    np.testing.assert_allclose(colour[0], centre, atol=0.02)
+    assert colour[-2, 0] < 0.2 and colour[-2, 2] == pytest.approx(1)
+
+
+def test_glow_is_one_form_per_shape(tmp_path, glow_mode):
+    c = page(tmp_path)
+    shading.glow(c, 100, 100, 30, Color(1, 0.85, 0.2, alpha=0.04))
+    shading.glow(c, 200, 200, 30, Color(0.2, 0.4, 1, alpha=0.04))    # same shape, new colour
+    assert ops(c, 'Do') == 2 and ops(c, 'f', 'f*') == 0
+    assert len([n for n in c._doc.idToObject if 'glow' in str(n)]) == 1
+    assert '30 0 0 30 100 100 cm' in c._code
+    shading.glow(c, 100, 100, 30, Color(1, 1, 1, alpha=0.04), edge=Color(0, 0, 1))
+    assert len([n for n in c._doc.idToObject if 'glow' in str(n)]) == 2
+    c.save()
+    assert b'/C sh' in (tmp_path / 'g.pdf').read_bytes()
+
+
+def test_glow_stretches_into_an_ellipse(tmp_path, glow_mode):
+    c = page(tmp_path)
+    shading.glow(c, 50, 60, 10, Color(1, 1, 1, alpha=0.1), sx=2, sy=0.5)
+    assert '20 0 0 5 50 60 cm' in c._code
+
+
+def test_empty_glows_draw_nothing(tmp_path, glow_mode):
+    c = page(tmp_path)
+    shading.glow(c, 0, 0, 5, Color(1, 1, 1, alpha=0.5), inner=5)
+    shading.glow(c, 0, 0, 5, Color(1, 1, 1, alpha=0.0))
+    assert ops(c, 'Do') == 0
+
+
+def test_off_draws_the_ring_stack(tmp_path, glow_mode):
+    glow_mode('off')
+    c = page(tmp_path)
+    shading.glow(c, 100, 100, 30, Color(1, 0.85, 0.2, alpha=0.04))
+    shading.glow(c, 100, 100, 30, Color(1, 0.85, 0.2, alpha=0.04), step=3)
+    assert ops(c, 'f', 'f*') == 30 + 10 and ops(c, 'Do') == 0
+
+
+def test_glow_image_matches_the_ring_stack(glow_mode):
+    rings = Image.new('RGB', (64, 64), (10, 20, 40))
+    glow_mode('off')
+    shading.glow_image(rings, 32, 32, 24, (255, 220, 120, 20))
+    smooth = Image.new('RGB', (64, 64), (10, 20, 40))
+    glow_mode('shading')
+    shading.glow_image(smooth, 32, 32, 24, (255, 220, 120, 20))
+    diff = np.abs(np.asarray(rings, dtype=float) - np.asarray(smooth, dtype=float))
+    assert diff.mean() < 1 and diff.max() <= 12                # ring steps against the blend
+    assert smooth.getpixel((0, 0)) == (10, 20, 40)
@@ -0,0 +1,30 @@
+import inspect
+
+import gen_031_045
+from geometria import ode, reaction, simcache, trajectory
+
+
+def test_key_follows_geometria_dependencies(monkeypatch):
+    sim = inspect.unwrap(gen_031_045.gray_scott)
+    arguments = {'res': 16, 'spots': [[4, 4]], 'steps': 10}
+    before = simcache.key('gray-scott-034', sim, arguments)
+    getsource = inspect.getsource
+
+    def edited(obj):
+        return getsource(obj) + '# edited' if obj is reaction else getsource(obj)
+    monkeypatch.setattr(inspect, 'getsource', edited)
+    assert simcache.key('gray-scott-034', sim, arguments) != before
+
+
+def flow(n):
+    return ode.integrate(ode.lorenz(), ode.ball((0.1, 0.0, 0.0), 1.0, n), 0.005, 10)
+
+
+def test_key_follows_indirect_imports(monkeypatch):
+    before = simcache.key('flow', flow, {'n': 4})
+    getsource = inspect.getsource
+
+    def edited(obj):
+        return getsource(obj) + '# edited' if obj is trajectory else getsource(obj)
+    monkeypatch.setattr(inspect, 'getsource', edited)
+    assert simcache.key('flow', flow, {'n': 4}) != before      # ode -> trajectory
@@ -0,0 +1,49 @@
+import math
+
+import numpy as np
+import pytest
+
+from geometria import simcache, trajectory
+
+
+@pytest.fixture(autouse=True)
+def no_cache():
+    with simcache.disabled():
+        yield
+
+
+def test_lorenz_matches_the_list_loop():
+    xs, ys, zs = [], [], []
+    x, y, z = 0.1, 0.0, 0.0
+    for _ in range(500):
+        dx = 10.0 * (y - x)
+        dy = x * (28.0 - z) - y
+        dz = x * y - 8.0 / 3.0 * z
+        x += dx * 0.005
+        y += dy * 0.005
+        z += dz * 0.005
+        xs.append(x); ys.append(y); zs.append(z)
+    traj = trajectory.lorenz(500)
+    assert traj.x.tolist() == xs and traj.y.tolist() == ys and traj.z.tolist() == zs
+    assert traj.bounds(2) == (min(zs), max(zs))
+    assert traj.points.shape == (500, 3) and len(traj) == 500
+
+
+def test_clifford_matches_the_list_loop():
+    pts = []
+    x, y = 0.1, 0.1
+    for _ in range(300):
+        x, y = (math.sin(-1.4 * y) + math.cos(-1.4 * x),
+                math.sin(1.6 * x) + 0.7 * math.cos(1.6 * y))
+        pts.append((x, y))
+    assert trajectory.clifford(300).points.tolist() == [list(p) for p in pts]
+
+
+def test_depth_is_normalised_and_cached():
+    traj = trajectory.rossler(400)
+    depth = traj.depth(1)
+    assert depth.min() == 0.0 and depth.max() == 1.0
+    assert traj.depth(1) is depth
+    lo, hi = traj.bounds(1)
+    np.testing.assert_allclose(depth * (hi - lo) + lo, traj.y)
+    assert traj.center(1) == (lo + hi) / 2 and traj.span(1) == hi - lo
@@ -0,0 +1,42 @@
+import importlib
+import os
+import threading
+
+from geometria import build, cache, polyline, registry, watch
+
+
+def test_poll_watches_geometria_modules(monkeypatch):
+    registry.load()
+    watcher = watch.Watcher({'020'})
+    watcher.snapshot()
+    assert 'geometria.polyline' in watcher.mtimes and 'gen_016_030' in watcher.mtimes
+    assert 'geometria.registry' not in watcher.mtimes
+    getmtime = os.path.getmtime
+
+    def touched(path):
+        return getmtime(path) + (1 if path == polyline.__file__ else 0)
+    monkeypatch.setattr(os.path, 'getmtime', touched)
+    assert watcher.poll() == ['geometria.polyline']
+    assert watcher.poll() == []
+
+
+def test_reload_runs_on_the_render_thread(monkeypatch):
+    registry.load()
+    watcher = watch.Watcher({'020'})
+    watcher.digests = {'020': 'stale'}
+    reloaded, rendered = [], []
+    monkeypatch.setattr(importlib, 'reload',
+                        lambda module: reloaded.append((module.__name__, threading.get_ident())))
+    monkeypatch.setattr(cache, 'fingerprint', lambda func: 'fresh')
+
+    def run_items(items, n_jobs, on_result):
+        rendered.append(([it.key for it in items], threading.get_ident()))
+        done.set()
+    monkeypatch.setattr(build, 'run_items', run_items)
+    done = threading.Event()
+    thread = threading.Thread(target=watcher.render_forever, daemon=True)
+    thread.start()
+    watcher.jobs.put((['gen_016_030', 'geometria.polyline'], []))
+    assert done.wait(10)
+    assert reloaded == [('geometria.polyline', thread.ident), ('gen_016_030', thread.ident)]
+    assert rendered == [(['020'], thread.ident)]